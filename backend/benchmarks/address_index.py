@@ -0,0 +1,92 @@
+"""
+Benchmark the offline address index: build time, memory footprint and
+lookup latency, for the bundled India Post pincode directory (~165k
+offices) and for a synthetic dataset of comparable size.
+
+Usage (from backend/):
+    python -m benchmarks.address_index [--records 155000]
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault('MONGO_URL', 'mongodb://localhost:27017')
+os.environ.setdefault('DB_NAME', 'intowns_bench')
+
+from server import AddressIndex, ADDRESS_INDEX_PATH  # noqa: E402
+
+WORDS = ['nagar', 'colony', 'vihar', 'enclave', 'park', 'road', 'market', 'bagh',
+         'puram', 'ganj', 'pur', 'abad', 'wadi', 'halli', 'palayam', 'pet']
+
+def synthetic_records(count: int, seed: int = 42) -> list:
+    rng = random.Random(seed)
+    records = []
+    for i in range(count):
+        pincode = str(110000 + rng.randrange(745000))
+        name = ''.join(rng.choice('abcdefghijklmnopqrstuvwxyz') for _ in range(rng.randint(4, 9)))
+        locality = f"{name.title()} {rng.choice(WORDS).title()}"
+        district = f"District {i % 750}"
+        records.append((pincode, locality, district, f"State {i % 36}"))
+    return records
+
+def measure(label: str, build, queries: list):
+    tracemalloc.start()
+    started = time.perf_counter()
+    index = build()
+    build_ms = (time.perf_counter() - started) * 1000
+    memory_mb = tracemalloc.get_traced_memory()[0] / 1024 / 1024
+    tracemalloc.stop()
+    
+    timings = []
+    hits = 0
+    for query in queries:
+        started = time.perf_counter()
+        if index.search(query):
+            hits += 1
+        timings.append((time.perf_counter() - started) * 1e6)
+    timings.sort()
+    
+    print(f"{label}")
+    print(f"  records:      {len(index)}")
+    print(f"  build:        {build_ms:.1f} ms")
+    print(f"  memory:       {memory_mb:.2f} MiB")
+    print(f"  lookups:      {len(queries)} ({hits} hits)")
+    print(f"  p50 / p99:    {statistics.median(timings):.1f} / {timings[int(len(timings) * 0.99)]:.1f} µs")
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--records', type=int, default=155000)
+    parser.add_argument('--queries', type=int, default=20000)
+    args = parser.parse_args()
+    
+    rng = random.Random(7)
+    
+    def bundled():
+        index = AddressIndex()
+        index.load(ADDRESS_INDEX_PATH)
+        return index
+    
+    bundled_index = bundled()
+    sample = [r[1] for r in bundled_index._records] + [r[0] for r in bundled_index._records]
+    queries = [rng.choice(sample)[:rng.randint(3, 8)] for _ in range(args.queries)]
+    measure(f"Bundled dataset ({ADDRESS_INDEX_PATH})", bundled, queries)
+    
+    records = synthetic_records(args.records)
+    sample = [r[1] for r in records] + [r[0] for r in records]
+    queries = [rng.choice(sample)[:rng.randint(3, 8)] for _ in range(args.queries)]
+    
+    def synthetic():
+        index = AddressIndex()
+        index.build(records)
+        return index
+    
+    measure(f"Synthetic dataset ({args.records} records)", synthetic, queries)
+
+if __name__ == '__main__':
+    main()
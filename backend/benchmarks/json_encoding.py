@@ -0,0 +1,135 @@
+"""
+Benchmark JSON serialization of large list responses: a page of bookings
+with their product and user embedded, as returned by GET /api/bookings.
+
+Compares FastAPI's default path (jsonable_encoder + stdlib json), the
+orjson-backed FastJSONResponse, and serving a pre-encoded JSONSnapshot,
+and checks that all three produce the same JSON.
+
+Usage (from backend/):
+    python -m benchmarks.json_encoding [--bookings 1000] [--repeat 20]
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault('MONGO_URL', 'mongodb://localhost:27017')
+os.environ.setdefault('DB_NAME', 'intowns_bench')
+
+from fastapi.encoders import jsonable_encoder  # noqa: E402
+from fastapi.responses import JSONResponse  # noqa: E402
+from starlette.requests import Request  # noqa: E402
+
+from server import FastJSONResponse, JSONSnapshot  # noqa: E402
+
+STATUSES = ['pending', 'accepted', 'on_the_way', 'in_progress', 'completed', 'cancelled']
+
+def synthetic_bookings(count: int, seed: int = 42) -> list:
+    rng = random.Random(seed)
+    products = [
+        {'id': str(uuid.UUID(int=rng.getrandbits(128))), 'name': f'Therapy {i}', 'description': 'Relaxing full body massage therapy',
+         'price': rng.randrange(49900, 499900, 100), 'duration': f'{rng.choice([60, 90, 120])} min',
+         'category_id': str(uuid.UUID(int=rng.getrandbits(128))), 'sub_category_id': None, 'type': 'service',
+         'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'}
+        for i in range(40)
+    ]
+    user = {'id': str(uuid.UUID(int=rng.getrandbits(128))), 'email': 'priya.sharma@gmail.com', 'name': 'Priya Sharma',
+            'picture': None, 'role': 'user', 'wallet_balance': 150000, 'wallet_locked_balance': 0,
+            'created_at': datetime(2025, 3, 14, 9, 26, 53, 589000, tzinfo=timezone.utc)}
+    start = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    bookings = []
+    for _ in range(count):
+        product = rng.choice(products)
+        created = start + timedelta(seconds=rng.randrange(365 * 86400))
+        bookings.append({
+            'id': str(uuid.UUID(int=rng.getrandbits(128))),
+            'user_id': user['id'],
+            'product_id': product['id'],
+            'category_id': product['category_id'],
+            'professional_id': None,
+            'address': '221, Indiranagar 2nd Stage, Bengaluru — near metro',
+            'landmark': None,
+            'pincode': '560038',
+            'status': rng.choice(STATUSES),
+            'payment_method': rng.choice(['online', 'cod']),
+            'payment_id': None,
+            'razorpay_order_id': f'order_{rng.getrandbits(56):014x}',
+            'razorpay_payment_id': None,
+            'amount': product['price'],
+            'wallet_used': 0,
+            'coupon_code': None,
+            'discount_amount': 0,
+            'started_at': None,
+            'completed_at': None,
+            'review_given': False,
+            'created_at': created,
+            'product': product,
+            'user': user,
+        })
+    return bookings
+
+def fastapi_default(bookings: list) -> bytes:
+    return JSONResponse(jsonable_encoder(bookings)).body
+
+def fast_json(bookings: list) -> bytes:
+    return FastJSONResponse(bookings).body
+
+def time_ms(fn, repeat: int) -> list:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - started) * 1000)
+    return timings
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--bookings', type=int, default=1000)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    bookings = synthetic_bookings(args.bookings)
+
+    async def build():
+        return bookings
+    loop = asyncio.new_event_loop()
+    snapshot = JSONSnapshot(build)
+    loop.run_until_complete(snapshot.refresh())
+    request = Request({'type': 'http', 'method': 'GET', 'path': '/api/bookings', 'headers': []})
+
+    def serve_snapshot():
+        return loop.run_until_complete(snapshot.response(request)).body
+
+    reference = json.loads(fastapi_default(bookings))
+    paths = [
+        ('jsonable_encoder + json (FastAPI default)', lambda: fastapi_default(bookings)),
+        ('FastJSONResponse (orjson)', lambda: fast_json(bookings)),
+        ('pre-encoded JSONSnapshot', serve_snapshot),
+    ]
+
+    print(f"{args.bookings} bookings with embedded product and user, best/median of {args.repeat} runs\n")
+    header = f"{'path':<44} {'best ms':>9} {'median ms':>10} {'KiB':>8} {'speedup':>8} {'same':>5}"
+    print(header)
+    print('-' * len(header))
+    baseline = None
+    for name, fn in paths:
+        body = fn()
+        timings = time_ms(fn, args.repeat)
+        best = min(timings)
+        baseline = baseline or best
+        same = json.loads(body) == reference
+        print(f"{name:<44} {best:>9.3f} {statistics.median(timings):>10.3f} {len(body) / 1024:>8.1f}"
+              f" {baseline / max(best, 1e-6):>7.0f}x {'yes' if same else 'NO':>5}")
+    loop.close()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,350 @@
+"""
+End-to-end load test for the hot API paths.
+
+Starts the API (benchmarks.stub_app: Razorpay stubbed, emails only logged)
+against a local mongod, seeds a throwaway database, then drives a weighted
+mix of virtual users through catalog browsing, login, order create/verify,
+wallet topup, booking status updates, address search and admin dashboards.
+Reports throughput and p50/p95/p99 per endpoint, and can save a baseline
+and compare later runs against it.
+
+Usage (from backend/, with mongod on localhost:27017):
+    python -m benchmarks.load_test --users 50 --duration 60 --save-baseline benchmarks/baselines/local.json
+    python -m benchmarks.load_test --compare benchmarks/baselines/local.json --fail-on-regression 20
+    python -m benchmarks.load_test --url http://localhost:8001   # an already running server
+
+All virtual users share one client address, so a server passed with --url
+should run with RATE_LIMIT_ENABLED=false (stub_app's default) or budgets
+raised via RATE_LIMIT_RULES; see benchmarks/stub_app.py.
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+import uuid
+from collections import defaultdict
+from datetime import datetime, timezone, timedelta
+from pathlib import Path
+
+import httpx
+import jwt
+from motor.motor_asyncio import AsyncIOMotorClient
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+JWT_SECRET = os.environ.get('JWT_SECRET', 'your-secret-key-change-in-production')
+
+# ============= Seeding =============
+
+async def seed(mongo_url: str, db_name: str, users: int) -> dict:
+    client = AsyncIOMotorClient(mongo_url)
+    await client.drop_database(db_name)
+    db = client[db_name]
+    
+    categories = [{'id': str(uuid.uuid4()), 'name': f"Category {i}", 'parent_id': None, 'level': 1} for i in range(4)]
+    sub_categories = [
+        {'id': str(uuid.uuid4()), 'name': f"Sub {i}", 'parent_id': categories[i % 4]['id'], 'level': 2}
+        for i in range(12)
+    ]
+    products = [
+        {
+            'id': str(uuid.uuid4()),
+            'name': f"Service {i}",
+            'description': 'Relaxing home service ' * 5,
+            'price': random.choice([49900, 99900, 149900, 299900]),
+            'duration': '60 min',
+            'category_id': sub['parent_id'],
+            'sub_category_id': sub['id'],
+            'type': 'product',
+            'image': None
+        }
+        for i, sub in enumerate(sub_categories * 5)
+    ]
+    await db.categories.insert_many(categories + sub_categories)
+    await db.products.insert_many(products)
+    await db.professionals.insert_one({'id': str(uuid.uuid4()), 'name': 'Rajni', 'email': None, 'status': 'active', 'user_id': None})
+    offer = {'id': str(uuid.uuid4()), 'amount': 50000, 'cashback_percentage': 20, 'max_cashback': 10000, 'active': True,
+             'created_at': datetime.now(timezone.utc)}
+    await db.wallet_offers.insert_one(offer)
+    
+    user_docs = [
+        {
+            'id': str(uuid.uuid4()),
+            'email': f"loadtest{i}@example.com",
+            'name': f"Load Test {i}",
+            'role': 'user',
+            'wallet_balance': 1000000,
+            'wallet_locked_balance': 0,
+            'created_at': datetime.now(timezone.utc)
+        }
+        for i in range(users)
+    ]
+    await db.users.insert_many(user_docs)
+    client.close()
+    
+    return {
+        'categories': [c['id'] for c in categories],
+        'sub_categories': [c['id'] for c in sub_categories],
+        'products': [p['id'] for p in products],
+        'offer_id': offer['id'],
+        'users': user_docs
+    }
+
+def user_token(user: dict) -> str:
+    payload = {
+        'user_id': user['id'],
+        'email': user['email'],
+        'role': user['role'],
+        'exp': datetime.now(timezone.utc) + timedelta(hours=2)
+    }
+    return jwt.encode(payload, JWT_SECRET, algorithm='HS256')
+
+# ============= Virtual Users =============
+
+class Recorder:
+    def __init__(self):
+        self.latencies = defaultdict(list)
+        self.errors = defaultdict(int)
+    
+    async def call(self, client: httpx.AsyncClient, name: str, method: str, url: str, **kwargs):
+        started = time.perf_counter()
+        try:
+            response = await client.request(method, url, **kwargs)
+            ok = response.status_code < 400
+        except httpx.HTTPError:
+            response, ok = None, False
+        self.latencies[name].append((time.perf_counter() - started) * 1000)
+        if not ok:
+            self.errors[name] += 1
+        return response if ok else None
+
+class Scenarios:
+    def __init__(self, data: dict, recorder: Recorder, admin_token: str, professional_token: str):
+        self.data = data
+        self.rec = recorder
+        self.admin = {'Authorization': f"Bearer {admin_token}"}
+        self.professional = {'Authorization': f"Bearer {professional_token}"}
+        self.bookings = []
+    
+    def auth(self, user: dict) -> dict:
+        return {'Authorization': f"Bearer {user['token']}"}
+    
+    async def browse(self, client, user):
+        await self.rec.call(client, 'GET /api/config', 'GET', '/api/config')
+        await self.rec.call(client, 'GET /api/categories', 'GET', '/api/categories', params={'level': 1})
+        category = random.choice(self.data['categories'])
+        await self.rec.call(client, 'GET /api/categories', 'GET', '/api/categories', params={'parent_id': category})
+        await self.rec.call(client, 'GET /api/products', 'GET', '/api/products',
+                            params={'sub_category_id': random.choice(self.data['sub_categories'])})
+        await self.rec.call(client, 'GET /api/products/{product_id}', 'GET', f"/api/products/{random.choice(self.data['products'])}")
+    
+    async def login(self, client, user):
+        await self.rec.call(client, 'POST /api/auth/login', 'POST', '/api/auth/login', json={'username': 'admin', 'password': 'pass'})
+        await self.rec.call(client, 'GET /api/auth/me', 'GET', '/api/auth/me', headers=self.auth(user))
+    
+    async def address_search(self, client, user):
+        query = random.choice(['kora', 'indira', 'bandra', '110001', 'salt lake', 'gachi'])
+        await self.rec.call(client, 'GET /api/address/search', 'GET', '/api/address/search', params={'query': query})
+    
+    async def order(self, client, user):
+        response = await self.rec.call(client, 'POST /api/orders/create', 'POST', '/api/orders/create', headers=self.auth(user), json={
+            'product_id': random.choice(self.data['products']),
+            'address': '12 Test Street, Koramangala',
+            'pincode': '560034',
+            'payment_method': 'online'
+        })
+        if response is None:
+            return
+        order = response.json()
+        if order.get('razorpay_order_id'):
+            await self.rec.call(client, 'POST /api/orders/verify', 'POST', '/api/orders/verify', headers=self.auth(user), json={
+                'razorpay_order_id': order['razorpay_order_id'],
+                'razorpay_payment_id': f"pay_stub_{uuid.uuid4().hex[:14]}",
+                'razorpay_signature': 'stub',
+                'booking_id': order['booking_id']
+            })
+        self.bookings.append(order['booking_id'])
+        await self.rec.call(client, 'GET /api/bookings', 'GET', '/api/bookings', headers=self.auth(user))
+    
+    async def topup(self, client, user):
+        response = await self.rec.call(client, 'POST /api/wallet/topup', 'POST', '/api/wallet/topup',
+                                       headers=self.auth(user), json={'offer_id': self.data['offer_id']})
+        if response is None:
+            return
+        await self.rec.call(client, 'POST /api/wallet/topup/verify', 'POST', '/api/wallet/topup/verify', headers=self.auth(user), params={
+            'razorpay_order_id': response.json()['razorpay_order_id'],
+            'razorpay_payment_id': f"pay_stub_{uuid.uuid4().hex[:14]}",
+            'razorpay_signature': 'stub',
+            'offer_id': self.data['offer_id']
+        })
+        await self.rec.call(client, 'GET /api/wallet', 'GET', '/api/wallet', headers=self.auth(user))
+    
+    async def status_update(self, client, user):
+        if not self.bookings:
+            return
+        booking_id = random.choice(self.bookings)
+        status = random.choice(['on_the_way', 'in_progress', 'completed'])
+        await self.rec.call(client, 'PATCH /api/bookings/{booking_id}/status', 'PATCH', f"/api/bookings/{booking_id}/status",
+                            headers=self.professional, json={'status': status})
+    
+    async def admin_dashboard(self, client, user):
+        await self.rec.call(client, 'GET /api/admin/stats', 'GET', '/api/admin/stats', headers=self.admin)
+        await self.rec.call(client, 'GET /api/admin/bookings', 'GET', '/api/admin/bookings', headers=self.admin)
+        await self.rec.call(client, 'GET /api/admin/email-logs', 'GET', '/api/admin/email-logs', headers=self.admin)
+    
+    def mix(self):
+        return [
+            (self.browse, 40),
+            (self.address_search, 10),
+            (self.login, 5),
+            (self.order, 15),
+            (self.topup, 5),
+            (self.status_update, 15),
+            (self.admin_dashboard, 10)
+        ]
+
+async def virtual_user(client, scenarios: Scenarios, user: dict, deadline: float, think_ms: float):
+    actions, weights = zip(*scenarios.mix())
+    while time.perf_counter() < deadline:
+        action = random.choices(actions, weights)[0]
+        await action(client, user)
+        if think_ms:
+            await asyncio.sleep(random.uniform(0, think_ms * 2) / 1000)
+
+# ============= Reporting =============
+
+def percentile(values: list, pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+def summarize(recorder: Recorder, elapsed: float) -> dict:
+    results = {}
+    for name, latencies in sorted(recorder.latencies.items()):
+        results[name] = {
+            'count': len(latencies),
+            'errors': recorder.errors.get(name, 0),
+            'rps': round(len(latencies) / elapsed, 2),
+            'p50_ms': round(percentile(latencies, 50), 2),
+            'p95_ms': round(percentile(latencies, 95), 2),
+            'p99_ms': round(percentile(latencies, 99), 2)
+        }
+    return results
+
+def print_report(results: dict, elapsed: float, baseline: dict = None, threshold: float = None) -> list:
+    regressions = []
+    total = sum(r['count'] for r in results.values())
+    print(f"\n{total} requests in {elapsed:.1f}s ({total / elapsed:.1f} req/s)\n")
+    header = f"{'endpoint':<42} {'count':>7} {'err':>5} {'rps':>8} {'p50':>8} {'p95':>8} {'p99':>8}"
+    if baseline:
+        header += f" {'p95 vs base':>12}"
+    print(header)
+    print('-' * len(header))
+    for name, r in results.items():
+        line = f"{name:<42} {r['count']:>7} {r['errors']:>5} {r['rps']:>8.1f} {r['p50_ms']:>8.1f} {r['p95_ms']:>8.1f} {r['p99_ms']:>8.1f}"
+        base = (baseline or {}).get(name)
+        if base and base['p95_ms']:
+            change = (r['p95_ms'] - base['p95_ms']) / base['p95_ms'] * 100
+            line += f" {change:>+11.1f}%"
+            if threshold is not None and change > threshold:
+                regressions.append(name)
+        print(line)
+    return regressions
+
+# ============= Main =============
+
+def start_server(port: int, workers: int, mongo_url: str, db_name: str) -> subprocess.Popen:
+    env = {**os.environ, 'MONGO_URL': mongo_url, 'DB_NAME': db_name, 'JWT_SECRET': JWT_SECRET}
+    return subprocess.Popen(
+        [sys.executable, '-m', 'uvicorn', 'benchmarks.stub_app:app', '--port', str(port),
+         '--workers', str(workers), '--log-level', 'warning'],
+        cwd=BACKEND_DIR, env=env
+    )
+
+async def wait_until_ready(url: str, timeout: float = 30):
+    deadline = time.perf_counter() + timeout
+    async with httpx.AsyncClient(base_url=url) as client:
+        while time.perf_counter() < deadline:
+            try:
+                if (await client.get('/api/')).status_code == 200:
+                    return
+            except httpx.HTTPError:
+                pass
+            await asyncio.sleep(0.2)
+    raise RuntimeError(f"Server at {url} did not become ready")
+
+async def run(args) -> dict:
+    random.seed(args.seed)
+    data = await seed(args.mongo_url, args.db, args.users)
+    for user in data['users']:
+        user['token'] = user_token(user)
+    
+    server = None
+    url = args.url
+    if not url:
+        server = start_server(args.port, args.workers, args.mongo_url, args.db)
+        url = f"http://127.0.0.1:{args.port}"
+    try:
+        await wait_until_ready(url)
+        limits = httpx.Limits(max_connections=args.users, max_keepalive_connections=args.users)
+        async with httpx.AsyncClient(base_url=url, limits=limits, timeout=30) as client:
+            admin = await client.post('/api/auth/login', json={'username': 'admin', 'password': 'pass'})
+            professional = await client.post('/api/auth/login', json={'username': 'rajni', 'password': 'pass'})
+            recorder = Recorder()
+            scenarios = Scenarios(data, recorder, admin.json()['token'], professional.json()['token'])
+            
+            started = time.perf_counter()
+            deadline = started + args.duration
+            await asyncio.gather(*[
+                virtual_user(client, scenarios, data['users'][i % len(data['users'])], deadline, args.think_ms)
+                for i in range(args.users)
+            ])
+            elapsed = time.perf_counter() - started
+    finally:
+        if server:
+            server.terminate()
+            server.wait()
+    
+    return {'elapsed': elapsed, 'results': summarize(recorder, elapsed)}
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--users', type=int, default=20, help='concurrent virtual users')
+    parser.add_argument('--duration', type=float, default=30, help='seconds')
+    parser.add_argument('--think-ms', type=float, default=0, help='mean pause between actions')
+    parser.add_argument('--workers', type=int, default=1, help='uvicorn workers for the spawned server')
+    parser.add_argument('--port', type=int, default=8011)
+    parser.add_argument('--url', help='target an already running server instead of spawning one')
+    parser.add_argument('--mongo-url', default=os.environ.get('LOADTEST_MONGO_URL', 'mongodb://localhost:27017'))
+    parser.add_argument('--db', default='intowns_loadtest', help='database to seed (dropped first)')
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--save-baseline', help='write results to this JSON file')
+    parser.add_argument('--compare', help='baseline JSON file to compare p95 against')
+    parser.add_argument('--fail-on-regression', type=float, help='exit 1 if any p95 regresses by more than this percent')
+    args = parser.parse_args()
+    
+    report = asyncio.run(run(args))
+    baseline = json.loads(Path(args.compare).read_text())['results'] if args.compare else None
+    regressions = print_report(report['results'], report['elapsed'], baseline, args.fail_on_regression)
+    
+    if args.save_baseline:
+        path = Path(args.save_baseline)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps({
+            'created_at': datetime.now(timezone.utc).isoformat(),
+            'users': args.users,
+            'duration': args.duration,
+            'workers': args.workers,
+            **report
+        }, indent=2))
+        print(f"\nBaseline saved to {path}")
+    
+    if regressions:
+        print(f"\nFAIL: p95 regressed by more than {args.fail_on_regression}% on: {', '.join(regressions)}")
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
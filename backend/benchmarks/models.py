@@ -0,0 +1,278 @@
+"""
+Microbenchmarks for Pydantic model construction and serialization on the
+hot paths: bookings, wallet transactions and email logs built per write,
+and the login response built per login.
+
+Each model is measured through the path the server uses today and through
+alternatives: model_dump(mode='json'), model_construct() (no validation),
+a precompiled TypeAdapter over an equivalent TypedDict, and a plain
+__slots__ record. Build and dump costs are reported separately, per
+object, and each alternative is checked for producing the same document
+as the current path.
+
+Usage (from backend/):
+    python -m benchmarks.models [--number 20000] [--repeat 5]
+    python -m benchmarks.models --save-baseline benchmarks/baselines/models.json
+    python -m benchmarks.models --compare benchmarks/baselines/models.json --fail-on-regression 15
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault('MONGO_URL', 'mongodb://localhost:27017')
+os.environ.setdefault('DB_NAME', 'intowns_bench')
+
+from fastapi.encoders import jsonable_encoder  # noqa: E402
+from pydantic import TypeAdapter  # noqa: E402
+from typing_extensions import NotRequired, TypedDict  # noqa: E402
+
+from server import Booking, EmailLog, LoginResponse, User, WalletTransaction  # noqa: E402
+
+FIXED_ID = '7c9e6679-7425-40de-944b-e07fc1f90ae7'
+FIXED_AT = datetime(2025, 6, 1, 18, 30, tzinfo=timezone.utc)
+
+# Inputs shaped like the ones the server passes on each hot path
+INPUTS = {
+    'Booking': {
+        'user_id': '5f0c6f38-52b4-4f0e-9a3d-0c4b5d1e2f3a',
+        'product_id': 'b4a7d3f2-1c8e-4b6a-9f0d-2e3c4b5a6d7e',
+        'category_id': 'c1d2e3f4-a5b6-4c7d-8e9f-0a1b2c3d4e5f',
+        'address': '221, Indiranagar 2nd Stage, Bengaluru',
+        'landmark': 'Near metro station',
+        'pincode': '560038',
+        'payment_method': 'online',
+        'amount': 249900,
+        'wallet_used': 10000,
+        'coupon_code': 'WELCOME10',
+        'discount_amount': 24990,
+        'status': 'pending',
+    },
+    'WalletTransaction': {
+        'user_id': '5f0c6f38-52b4-4f0e-9a3d-0c4b5d1e2f3a',
+        'type': 'topup',
+        'amount': 100000,
+        'balance_after': 150000,
+        'description': 'Wallet top-up of ₹1000',
+        'reference_id': 'pay_29QQoUBi66xm2f',
+    },
+    'EmailLog': {
+        'to_email': 'priya.sharma@gmail.com',
+        'cc_email': None,
+        'subject': 'intowns.in - Order Confirmation',
+        'message': 'Your booking has been confirmed. Our professional will reach you at the scheduled time.',
+        'type': 'order_success',
+        'status': 'sent',
+    },
+}
+
+LOGIN_USER = {
+    'id': '5f0c6f38-52b4-4f0e-9a3d-0c4b5d1e2f3a',
+    'email': 'priya.sharma@gmail.com',
+    'name': 'Priya Sharma',
+    'picture': 'https://lh3.googleusercontent.com/a/ACg8ocJ',
+    'role': 'user',
+    'wallet_balance': 150000,
+    'wallet_locked_balance': 10000,
+    'created_at': '2025-03-14T09:26:53.589793+00:00',
+}
+LOGIN_TOKEN = 'eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9.' + 'x' * 120
+
+# ============= Alternative paths =============
+
+def typed_dict_for(model: type) -> type:
+    """A TypedDict mirroring the model's fields; fields with defaults are NotRequired"""
+    fields = {
+        name: field.annotation if field.is_required() else NotRequired[field.annotation]
+        for name, field in model.model_fields.items()
+    }
+    return TypedDict(f'{model.__name__}Doc', fields)
+
+def default_factories(model: type) -> list:
+    """(name, zero-argument callable) per field; FieldInfo.get_default() is too slow to call per object"""
+    return [
+        (name, field.default_factory or (lambda default=field.default: default))
+        for name, field in model.model_fields.items()
+    ]
+
+def fill_defaults(factories: list, doc: dict) -> dict:
+    for name, factory in factories:
+        if name not in doc:
+            doc[name] = factory()
+    return doc
+
+def slots_record_for(model: type) -> type:
+    """A __slots__ class with the model's fields and defaults, without validation"""
+    factories = default_factories(model)
+
+    def __init__(self, **kwargs):
+        for name, factory in factories:
+            setattr(self, name, kwargs[name] if name in kwargs else factory())
+
+    def to_doc(self) -> dict:
+        return {name: getattr(self, name) for name, _ in factories}
+
+    return type(f'{model.__name__}Record', (), {
+        '__slots__': tuple(name for name, _ in factories),
+        '__init__': __init__,
+        'to_doc': to_doc,
+    })
+
+def storage_variants(model: type) -> dict:
+    """name -> (build(kwargs) -> obj, dump(obj) -> MongoDB document)"""
+    adapter = TypeAdapter(typed_dict_for(model))
+    factories = default_factories(model)
+    record = slots_record_for(model)
+
+    def dump_current(obj):
+        return obj.model_dump()
+
+    def dump_typed(doc):
+        return fill_defaults(factories, dict(doc))
+
+    return {
+        'current (model_dump)': (lambda kw: model(**kw), dump_current),
+        "model_dump(mode='json')": (lambda kw: model(**kw), lambda obj: obj.model_dump(mode='json')),
+        'model_construct': (lambda kw: model.model_construct(**kw), dump_current),
+        'TypeAdapter(TypedDict)': (adapter.validate_python, dump_typed),
+        '__slots__ record': (lambda kw: record(**kw), lambda obj: obj.to_doc()),
+    }
+
+def login_variants() -> dict:
+    """name -> (build(user_data) -> obj, dump(obj) -> response body bytes)"""
+    response_adapter = TypeAdapter(LoginResponse)
+
+    class LoginDoc(TypedDict):
+        token: str
+        user: typed_dict_for(User)
+
+    login_adapter = TypeAdapter(LoginDoc)
+
+    # What FastAPI does with a returned model when the route has no response_model
+    def dump_current(obj):
+        return json.dumps(jsonable_encoder(obj), ensure_ascii=False, separators=(',', ':')).encode()
+
+    def dump_plain(obj):
+        return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode()
+
+    return {
+        'current (jsonable_encoder)': (lambda data: LoginResponse(token=LOGIN_TOKEN, user=User(**data)), dump_current),
+        'model_dump_json': (lambda data: LoginResponse(token=LOGIN_TOKEN, user=User(**data)), lambda obj: obj.model_dump_json().encode()),
+        'TypeAdapter(LoginResponse).dump_json': (
+            lambda data: response_adapter.validate_python({'token': LOGIN_TOKEN, 'user': data}),
+            response_adapter.dump_json
+        ),
+        'TypeAdapter(TypedDict).dump_json': (
+            lambda data: login_adapter.validate_python({'token': LOGIN_TOKEN, 'user': data}),
+            login_adapter.dump_json
+        ),
+        'plain dict + json.dumps': (lambda data: {'token': LOGIN_TOKEN, 'user': dict(data)}, dump_plain),
+    }
+
+# ============= Measurement =============
+
+def per_object_us(fn, args: list, number: int, repeat: int) -> float:
+    """Best-of-repeat cost of one call, in microseconds"""
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter_ns()
+        for i in range(number):
+            fn(args[i % len(args)])
+        best = min(best, (time.perf_counter_ns() - started) / number)
+    return best / 1000
+
+def normalize(output):
+    return json.loads(output) if isinstance(output, bytes) else output
+
+def bench_case(label: str, variants: dict, make_input, fixed_input, number: int, repeat: int) -> dict:
+    inputs = [make_input() for _ in range(64)]
+    _, reference_dump = next(iter(variants.values()))
+    reference_build = next(iter(variants.values()))[0]
+    reference = normalize(reference_dump(reference_build(fixed_input())))
+
+    results = {}
+    for name, (build, dump) in variants.items():
+        built = [build(kw) for kw in inputs]
+        build_us = per_object_us(build, inputs, number, repeat)
+        dump_us = per_object_us(dump, built, number, repeat)
+        total_us = per_object_us(lambda kw: dump(build(kw)), inputs, number, repeat)
+        results[f"{label} / {name}"] = {
+            'build_us': round(build_us, 3),
+            'dump_us': round(dump_us, 3),
+            'total_us': round(total_us, 3),
+            'same_output': normalize(dump(build(fixed_input()))) == reference,
+        }
+    return results
+
+def run(number: int, repeat: int) -> dict:
+    results = {}
+    for model in (Booking, WalletTransaction, EmailLog):
+        kwargs = INPUTS[model.__name__]
+        results.update(bench_case(
+            model.__name__,
+            storage_variants(model),
+            lambda: dict(kwargs),
+            lambda: {**kwargs, 'id': FIXED_ID, 'created_at': FIXED_AT},
+            number, repeat
+        ))
+    results.update(bench_case('LoginResponse', login_variants(), lambda: dict(LOGIN_USER), lambda: dict(LOGIN_USER), number, repeat))
+    return results
+
+def print_report(results: dict, baseline: dict = None, threshold: float = None) -> list:
+    regressions = []
+    header = f"{'model / path':<58} {'build µs':>9} {'dump µs':>9} {'total µs':>9} {'vs current':>11} {'same':>5}"
+    if baseline:
+        header += f" {'vs base':>9}"
+    print(header)
+    print('-' * len(header))
+    current = None
+    for name, r in results.items():
+        if name.split(' / ')[1].startswith('current'):
+            current = r['total_us']
+        speedup = current / r['total_us'] if r['total_us'] else 0
+        line = (f"{name:<58} {r['build_us']:>9.2f} {r['dump_us']:>9.2f} {r['total_us']:>9.2f}"
+                f" {speedup:>10.2f}x {'yes' if r['same_output'] else 'NO':>5}")
+        base = (baseline or {}).get(name)
+        if base and base['total_us']:
+            change = (r['total_us'] - base['total_us']) / base['total_us'] * 100
+            line += f" {change:>+8.1f}%"
+            if threshold is not None and change > threshold:
+                regressions.append(name)
+        print(line)
+    print("\nsame = output identical to the current path (model_dump(mode='json') writes created_at "
+          "as a string, which date range queries on created_at don't match)")
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--number', type=int, default=20000, help='calls per timing run')
+    parser.add_argument('--repeat', type=int, default=5, help='timing runs; the best is reported')
+    parser.add_argument('--save-baseline', help='write results to this JSON file')
+    parser.add_argument('--compare', help='baseline JSON file to compare total cost against')
+    parser.add_argument('--fail-on-regression', type=float, help='exit 1 if any total cost regresses by more than this percent')
+    args = parser.parse_args()
+
+    results = run(args.number, args.repeat)
+    baseline = json.loads(Path(args.compare).read_text())['results'] if args.compare else None
+    regressions = print_report(results, baseline, args.fail_on_regression)
+
+    if args.save_baseline:
+        path = Path(args.save_baseline)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps({
+            'created_at': datetime.now(timezone.utc).isoformat(),
+            'python': sys.version.split()[0],
+            'results': results
+        }, indent=2))
+        print(f"\nBaseline saved to {path}")
+
+    if regressions:
+        print(f"\nFAIL: per-object cost regressed by more than {args.fail_on_regression}% on: {', '.join(regressions)}")
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
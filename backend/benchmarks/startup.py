@@ -0,0 +1,82 @@
+"""
+Measure cold-start import time of server.py.
+
+Each run imports the app in a fresh interpreter with -X importtime and
+reports the cumulative import time, the slowest imported packages, and
+whether any lazily-loaded integration was pulled in at import time.
+Exits non-zero when --max-ms is exceeded or a lazy module leaks in, so it
+can guard against regressions in CI.
+
+Usage (from backend/):
+    python -m benchmarks.startup [--runs 5] [--max-ms 1500]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+# Integrations that must only be imported on first use
+LAZY_MODULES = ['razorpay', 'authlib', 'aiohttp']
+
+PROBE = (
+    "import sys, server; "
+    "print('LAZY_LOADED=' + ','.join(m for m in %r if m in sys.modules))" % LAZY_MODULES
+)
+
+def run_once() -> tuple:
+    env = dict(os.environ)
+    env.setdefault('MONGO_URL', 'mongodb://localhost:27017')
+    env.setdefault('DB_NAME', 'intowns_bench')
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', PROBE],
+        cwd=BACKEND_DIR, env=env, capture_output=True, text=True, check=True
+    )
+    
+    modules = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative_us, name = line[len('import time:'):].split('|')
+        # Nesting is encoded as indentation: ' server', '   fastapi', ...
+        modules[name.rstrip()[1:]] = int(cumulative_us)
+    
+    lazy_loaded = [m for m in result.stdout.strip().split('=', 1)[1].split(',') if m]
+    return modules.get('server', 0) / 1000, modules, lazy_loaded
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--top', type=int, default=10)
+    parser.add_argument('--max-ms', type=float, default=None, help='fail if the median import time exceeds this')
+    args = parser.parse_args()
+    
+    timings = []
+    modules = {}
+    lazy_loaded = []
+    for _ in range(args.runs):
+        total_ms, modules, lazy_loaded = run_once()
+        timings.append(total_ms)
+    
+    median = statistics.median(timings)
+    print(f"import server: median {median:.1f} ms, min {min(timings):.1f} ms, max {max(timings):.1f} ms ({args.runs} runs)")
+    print("\nSlowest direct imports (last run):")
+    # Direct imports of server.py are indented by two spaces
+    direct = {name.strip(): us for name, us in modules.items() if name.startswith('  ') and not name.startswith('   ')}
+    for name, us in sorted(direct.items(), key=lambda item: -item[1])[:args.top]:
+        print(f"  {us / 1000:8.1f} ms  {name}")
+    
+    failed = False
+    if lazy_loaded:
+        print(f"\nFAIL: lazily-loaded modules imported at startup: {', '.join(lazy_loaded)}")
+        failed = True
+    if args.max_ms is not None and median > args.max_ms:
+        print(f"\nFAIL: median import time {median:.1f} ms exceeds {args.max_ms:.1f} ms")
+        failed = True
+    sys.exit(1 if failed else 0)
+
+if __name__ == '__main__':
+    main()
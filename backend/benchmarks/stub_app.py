@@ -0,0 +1,54 @@
+"""
+The API with external providers stubbed, for load tests and benchmarks.
+
+Razorpay is replaced by an in-process stub (optionally with simulated
+latency) and Mailtrap is left unconfigured, so emails are only logged.
+
+Rate limiting is off unless RATE_LIMIT_ENABLED is set. Every virtual user
+of the load test shares one client address, and the production budgets
+(server.RATE_LIMITS, tokens per second / burst per client) would throttle
+them within the first seconds:
+
+    login           0.2/s, burst 5
+    create_order    0.5/s, burst 10
+    admin_list      2/s,   burst 30
+    address_search  5/s,   burst 30
+
+To measure the limiter too, run with RATE_LIMIT_ENABLED=true and raise the
+budgets to the expected load, e.g. RATE_LIMIT_RULES='{"login": [100, 200]}'.
+
+    uvicorn benchmarks.stub_app:app --port 8011
+"""
+import os
+import sys
+import time
+import uuid
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.pop('MAILTRAP_API_TOKEN', None)
+
+import server  # noqa: E402
+
+RAZORPAY_LATENCY_MS = float(os.environ.get('STUB_RAZORPAY_LATENCY_MS', '0'))
+
+class _StubOrders:
+    def create(self, data: dict, **options) -> dict:
+        if RAZORPAY_LATENCY_MS:
+            time.sleep(RAZORPAY_LATENCY_MS / 1000)
+        return {'id': f"order_stub_{uuid.uuid4().hex[:14]}", 'amount': data['amount'], 'currency': data.get('currency', 'INR'), 'status': 'created'}
+
+class _StubUtility:
+    def verify_payment_signature(self, params: dict) -> bool:
+        return True
+
+class StubRazorpayClient:
+    def __init__(self):
+        self.order = _StubOrders()
+        self.utility = _StubUtility()
+
+server.razorpay_client = StubRazorpayClient()
+if 'RATE_LIMIT_ENABLED' not in os.environ:
+    server.RATE_LIMIT_ENABLED = False
+
+app = server.create_app()
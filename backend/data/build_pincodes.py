@@ -0,0 +1,64 @@
+"""
+Build data/pincodes.csv.gz from India Post's All India Pincode Directory.
+
+    python data/build_pincodes.py <directory.csv | pins.json[.bz2]> [data/pincodes.csv.gz]
+
+The source is the data.gov.in CSV export (officename, pincode, district,
+statename, ...) or the same records as JSON lines (Name, Pincode, District,
+State, ...). Each post office becomes one locality row; the B.O/S.O/H.O
+suffix is dropped and district/state names are title-cased.
+"""
+import bz2
+import csv
+import gzip
+import io
+import json
+import re
+import sys
+from pathlib import Path
+
+OUTPUT_PATH = Path(__file__).parent / 'pincodes.csv.gz'
+OFFICE_SUFFIX = re.compile(r'\s+\(?(?:[BSH]\.?\s?O|G\.?\s?P\.?\s?O)\.?\)?$', re.IGNORECASE)
+
+FIELDS = {
+    'locality': ('officename', 'Name'),
+    'pincode': ('pincode', 'Pincode'),
+    'district': ('district', 'districtname', 'District'),
+    'state': ('statename', 'State'),
+}
+
+def read_source(path: str):
+    opener = bz2.open if path.endswith('.bz2') else open
+    with opener(path, 'rt', newline='', encoding='utf-8') as f:
+        if '.json' in path:
+            yield from (json.loads(line) for line in f if line.strip())
+        else:
+            yield from csv.DictReader(f)
+
+def field(row: dict, name: str) -> str:
+    for key in FIELDS[name]:
+        if row.get(key) is not None:
+            return str(row[key]).strip()
+    return ''
+
+def normalize(row: dict):
+    pincode = field(row, 'pincode')
+    locality = OFFICE_SUFFIX.sub('', field(row, 'locality')).strip()
+    district = field(row, 'district').title()
+    state = field(row, 'state').title()
+    if not (len(pincode) == 6 and pincode.isdigit() and locality and district and state):
+        return None
+    return pincode, locality, district, state
+
+def main(source: str, output: str = str(OUTPUT_PATH)):
+    records = sorted({record for record in map(normalize, read_source(source)) if record})
+    # mtime=0 keeps the output byte-identical across rebuilds
+    with open(output, 'wb') as raw, gzip.GzipFile(fileobj=raw, mode='wb', mtime=0) as gz:
+        with io.TextIOWrapper(gz, encoding='utf-8', newline='') as f:
+            writer = csv.writer(f, lineterminator='\n')
+            writer.writerow(['pincode', 'locality', 'district', 'state'])
+            writer.writerows(records)
+    print(f"Wrote {len(records)} localities to {output}")
+
+if __name__ == '__main__':
+    main(*sys.argv[1:])
@@ -0,0 +1,25 @@
+# Gunicorn settings for the Intowns API, picked up automatically when
+# running `gunicorn server:app` from this directory. Every value can be
+# overridden through the environment.
+import multiprocessing
+import os
+
+bind = os.environ.get('BIND', '0.0.0.0:8001')
+workers = int(os.environ.get('WEB_CONCURRENCY', multiprocessing.cpu_count()))
+worker_class = 'uvicorn.workers.UvicornWorker'
+
+# Resources (Mongo pool, HTTP clients, caches) are opened per worker in the
+# app lifespan, so the app must not be imported in the master before fork.
+preload_app = False
+
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', '60'))
+graceful_timeout = int(os.environ.get('GUNICORN_GRACEFUL_TIMEOUT', '30'))
+keepalive = int(os.environ.get('GUNICORN_KEEPALIVE', '5'))
+max_requests = int(os.environ.get('GUNICORN_MAX_REQUESTS', '0'))
+max_requests_jitter = int(os.environ.get('GUNICORN_MAX_REQUESTS_JITTER', '0'))
+
+def child_exit(server, worker):
+    # Drop per-worker metric files when running Prometheus in multiprocess mode
+    if os.environ.get('PROMETHEUS_MULTIPROC_DIR'):
+        from prometheus_client import multiprocess
+        multiprocess.mark_process_dead(worker.pid)
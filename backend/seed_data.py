@@ -1,8 +1,17 @@
+import argparse
 import asyncio
+import csv
+import gzip
+import hashlib
+import itertools
+import random
+import time
+from datetime import datetime, timedelta, timezone
 from motor.motor_asyncio import AsyncIOMotorClient
 import os
 from dotenv import load_dotenv
 from pathlib import Path
+from typing import Optional
 import uuid
 
 ROOT_DIR = Path(__file__).parent
@@ -12,6 +21,14 @@ mongo_url = os.environ['MONGO_URL']
 client = AsyncIOMotorClient(mongo_url)
 db = client[os.environ['DB_NAME']]
 
+# Set by --generate so catalog ids are reproducible for a given seed
+id_rng: Optional[random.Random] = None
+
+def new_id() -> str:
+    if id_rng is not None:
+        return str(uuid.UUID(int=id_rng.getrandbits(128), version=4))
+    return str(uuid.uuid4())
+
 async def seed_data():
     print("Seeding intowns.in data...")
     
@@ -25,7 +42,7 @@ async def seed_data():
     # ==================== LEVEL 1: MAIN CATEGORIES (4 TILES) ====================
     main_categories = [
         {
-            'id': str(uuid.uuid4()),
+            'id': new_id(),
             'name': 'Massage',
             'image': 'https://images.unsplash.com/photo-1649751295468-953038600bef?crop=entropy&cs=srgb&fm=jpg&q=85',
             'description': 'Relaxing massage therapies',
@@ -33,7 +50,7 @@ async def seed_data():
             'level': 1
         },
         {
-            'id': str(uuid.uuid4()),
+            'id': new_id(),
             'name': 'Therapy',
             'image': 'https://images.unsplash.com/photo-1630595632518-8217c0bceb8f?crop=entropy&cs=srgb&fm=jpg&q=85',
             'description': 'Specialized therapy services',
@@ -41,7 +58,7 @@ async def seed_data():
             'level': 1
         },
         {
-            'id': str(uuid.uuid4()),
+            'id': new_id(),
             'name': 'Bridal Makeup',
             'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?crop=entropy&cs=srgb&fm=jpg&q=85',
             'description': 'Professional bridal beauty services',
@@ -49,7 +66,7 @@ async def seed_data():
             'level': 1
         },
         {
-            'id': str(uuid.uuid4()),
+            'id': new_id(),
             'name': 'Packages',
             'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?crop=entropy&cs=srgb&fm=jpg&q=85',
             'description': 'Special combo packages',
@@ -70,52 +87,52 @@ async def seed_data():
     
     sub_categories = [
         # Massage sub-categories
-        {'id': str(uuid.uuid4()), 'name': 'Swedish Massage', 'parent_id': massage_cat, 'level': 2, 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Deep Tissue Massage', 'parent_id': massage_cat, 'level': 2, 'image': 'https://images.unsplash.com/photo-1596178060671-7a80dc8059ea?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Aromatherapy Massage', 'parent_id': massage_cat, 'level': 2, 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Thai Massage', 'parent_id': massage_cat, 'level': 2, 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Balinese Massage', 'parent_id': massage_cat, 'level': 2, 'image': 'https://images.unsplash.com/photo-1540555700478-4be289fbecef?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Hot Stone Massage', 'parent_id': massage_cat, 'level': 2, 'image': 'https://images.unsplash.com/photo-1507652313519-d4e9174996dd?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Head & Neck Massage', 'parent_id': massage_cat, 'level': 2, 'image': 'https://images.unsplash.com/photo-1519823551278-64ac92734fb1?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Foot Reflexology', 'parent_id': massage_cat, 'level': 2, 'image': 'https://images.unsplash.com/photo-1598440947619-2c35fc9aa908?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Back & Shoulder Massage', 'parent_id': massage_cat, 'level': 2, 'image': 'https://images.unsplash.com/photo-1519823551278-64ac92734fb1?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Relaxation Massage', 'parent_id': massage_cat, 'level': 2, 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
+        {'id': new_id(), 'name': 'Swedish Massage', 'parent_id': massage_cat, 'level': 2, 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
+        {'id': new_id(), 'name': 'Deep Tissue Massage', 'parent_id': massage_cat, 'level': 2, 'image': 'https://images.unsplash.com/photo-1596178060671-7a80dc8059ea?w=400'},
+        {'id': new_id(), 'name': 'Aromatherapy Massage', 'parent_id': massage_cat, 'level': 2, 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
+        {'id': new_id(), 'name': 'Thai Massage', 'parent_id': massage_cat, 'level': 2, 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
+        {'id': new_id(), 'name': 'Balinese Massage', 'parent_id': massage_cat, 'level': 2, 'image': 'https://images.unsplash.com/photo-1540555700478-4be289fbecef?w=400'},
+        {'id': new_id(), 'name': 'Hot Stone Massage', 'parent_id': massage_cat, 'level': 2, 'image': 'https://images.unsplash.com/photo-1507652313519-d4e9174996dd?w=400'},
+        {'id': new_id(), 'name': 'Head & Neck Massage', 'parent_id': massage_cat, 'level': 2, 'image': 'https://images.unsplash.com/photo-1519823551278-64ac92734fb1?w=400'},
+        {'id': new_id(), 'name': 'Foot Reflexology', 'parent_id': massage_cat, 'level': 2, 'image': 'https://images.unsplash.com/photo-1598440947619-2c35fc9aa908?w=400'},
+        {'id': new_id(), 'name': 'Back & Shoulder Massage', 'parent_id': massage_cat, 'level': 2, 'image': 'https://images.unsplash.com/photo-1519823551278-64ac92734fb1?w=400'},
+        {'id': new_id(), 'name': 'Relaxation Massage', 'parent_id': massage_cat, 'level': 2, 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
         
         # Therapy sub-categories
-        {'id': str(uuid.uuid4()), 'name': 'Physiotherapy', 'parent_id': therapy_cat, 'level': 2, 'image': 'https://images.unsplash.com/photo-1630595632518-8217c0bceb8f?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Chiropractic Therapy', 'parent_id': therapy_cat, 'level': 2, 'image': 'https://images.unsplash.com/photo-1571019613454-1cb2f99b2d8b?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Reflexology', 'parent_id': therapy_cat, 'level': 2, 'image': 'https://images.unsplash.com/photo-1598440947619-2c35fc9aa908?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Cupping Therapy', 'parent_id': therapy_cat, 'level': 2, 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Acupuncture', 'parent_id': therapy_cat, 'level': 2, 'image': 'https://images.unsplash.com/photo-1630595632518-8217c0bceb8f?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Sports Therapy', 'parent_id': therapy_cat, 'level': 2, 'image': 'https://images.unsplash.com/photo-1571019613454-1cb2f99b2d8b?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Pain Relief Therapy', 'parent_id': therapy_cat, 'level': 2, 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Recovery Therapy', 'parent_id': therapy_cat, 'level': 2, 'image': 'https://images.unsplash.com/photo-1630595632518-8217c0bceb8f?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Senior Therapy', 'parent_id': therapy_cat, 'level': 2, 'image': 'https://images.unsplash.com/photo-1630595632518-8217c0bceb8f?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Ayurvedic Therapy', 'parent_id': therapy_cat, 'level': 2, 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
+        {'id': new_id(), 'name': 'Physiotherapy', 'parent_id': therapy_cat, 'level': 2, 'image': 'https://images.unsplash.com/photo-1630595632518-8217c0bceb8f?w=400'},
+        {'id': new_id(), 'name': 'Chiropractic Therapy', 'parent_id': therapy_cat, 'level': 2, 'image': 'https://images.unsplash.com/photo-1571019613454-1cb2f99b2d8b?w=400'},
+        {'id': new_id(), 'name': 'Reflexology', 'parent_id': therapy_cat, 'level': 2, 'image': 'https://images.unsplash.com/photo-1598440947619-2c35fc9aa908?w=400'},
+        {'id': new_id(), 'name': 'Cupping Therapy', 'parent_id': therapy_cat, 'level': 2, 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
+        {'id': new_id(), 'name': 'Acupuncture', 'parent_id': therapy_cat, 'level': 2, 'image': 'https://images.unsplash.com/photo-1630595632518-8217c0bceb8f?w=400'},
+        {'id': new_id(), 'name': 'Sports Therapy', 'parent_id': therapy_cat, 'level': 2, 'image': 'https://images.unsplash.com/photo-1571019613454-1cb2f99b2d8b?w=400'},
+        {'id': new_id(), 'name': 'Pain Relief Therapy', 'parent_id': therapy_cat, 'level': 2, 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
+        {'id': new_id(), 'name': 'Recovery Therapy', 'parent_id': therapy_cat, 'level': 2, 'image': 'https://images.unsplash.com/photo-1630595632518-8217c0bceb8f?w=400'},
+        {'id': new_id(), 'name': 'Senior Therapy', 'parent_id': therapy_cat, 'level': 2, 'image': 'https://images.unsplash.com/photo-1630595632518-8217c0bceb8f?w=400'},
+        {'id': new_id(), 'name': 'Ayurvedic Therapy', 'parent_id': therapy_cat, 'level': 2, 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
         
         # Bridal Makeup sub-categories
-        {'id': str(uuid.uuid4()), 'name': 'Pre-Bridal Makeup', 'parent_id': bridal_cat, 'level': 2, 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Bridal Hair Styling', 'parent_id': bridal_cat, 'level': 2, 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Bridal Skin Care', 'parent_id': bridal_cat, 'level': 2, 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Full Bridal Package', 'parent_id': bridal_cat, 'level': 2, 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Engagement Makeup', 'parent_id': bridal_cat, 'level': 2, 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Reception Makeup', 'parent_id': bridal_cat, 'level': 2, 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Bridal Trials', 'parent_id': bridal_cat, 'level': 2, 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Photography Makeup', 'parent_id': bridal_cat, 'level': 2, 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Traditional Bridal Makeup', 'parent_id': bridal_cat, 'level': 2, 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Modern Bridal Makeup', 'parent_id': bridal_cat, 'level': 2, 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Pre-Bridal Makeup', 'parent_id': bridal_cat, 'level': 2, 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Bridal Hair Styling', 'parent_id': bridal_cat, 'level': 2, 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Bridal Skin Care', 'parent_id': bridal_cat, 'level': 2, 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Full Bridal Package', 'parent_id': bridal_cat, 'level': 2, 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Engagement Makeup', 'parent_id': bridal_cat, 'level': 2, 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Reception Makeup', 'parent_id': bridal_cat, 'level': 2, 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Bridal Trials', 'parent_id': bridal_cat, 'level': 2, 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Photography Makeup', 'parent_id': bridal_cat, 'level': 2, 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Traditional Bridal Makeup', 'parent_id': bridal_cat, 'level': 2, 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Modern Bridal Makeup', 'parent_id': bridal_cat, 'level': 2, 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
         
         # Packages sub-categories
-        {'id': str(uuid.uuid4()), 'name': 'Relaxation Packages', 'parent_id': package_cat, 'level': 2, 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Couples Packages', 'parent_id': package_cat, 'level': 2, 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Bridal Packages', 'parent_id': package_cat, 'level': 2, 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Wellness Packages', 'parent_id': package_cat, 'level': 2, 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Monthly Packages', 'parent_id': package_cat, 'level': 2, 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Premium Packages', 'parent_id': package_cat, 'level': 2, 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Stress Relief Packages', 'parent_id': package_cat, 'level': 2, 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Detox Packages', 'parent_id': package_cat, 'level': 2, 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Anti-Aging Packages', 'parent_id': package_cat, 'level': 2, 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Luxury Packages', 'parent_id': package_cat, 'level': 2, 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
+        {'id': new_id(), 'name': 'Relaxation Packages', 'parent_id': package_cat, 'level': 2, 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
+        {'id': new_id(), 'name': 'Couples Packages', 'parent_id': package_cat, 'level': 2, 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
+        {'id': new_id(), 'name': 'Bridal Packages', 'parent_id': package_cat, 'level': 2, 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Wellness Packages', 'parent_id': package_cat, 'level': 2, 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
+        {'id': new_id(), 'name': 'Monthly Packages', 'parent_id': package_cat, 'level': 2, 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
+        {'id': new_id(), 'name': 'Premium Packages', 'parent_id': package_cat, 'level': 2, 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
+        {'id': new_id(), 'name': 'Stress Relief Packages', 'parent_id': package_cat, 'level': 2, 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
+        {'id': new_id(), 'name': 'Detox Packages', 'parent_id': package_cat, 'level': 2, 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
+        {'id': new_id(), 'name': 'Anti-Aging Packages', 'parent_id': package_cat, 'level': 2, 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
+        {'id': new_id(), 'name': 'Luxury Packages', 'parent_id': package_cat, 'level': 2, 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
     ]
     
     await db.categories.insert_many(sub_categories)
@@ -129,487 +146,487 @@ async def seed_data():
     products = [
         # ===== MASSAGE PRODUCTS =====
         # Swedish Massage
-        {'id': str(uuid.uuid4()), 'name': 'Swedish Massage (30 min)', 'description': 'Gentle, flowing strokes for relaxation', 'price': 59900, 'duration': '30 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Swedish Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Swedish Massage (60 min)', 'description': 'Full body relaxation with Swedish techniques', 'price': 109900, 'duration': '60 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Swedish Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Swedish Massage (90 min)', 'description': 'Extended relaxation session', 'price': 149900, 'duration': '90 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Swedish Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Swedish Massage (120 min)', 'description': 'Ultimate relaxation experience', 'price': 189900, 'duration': '120 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Swedish Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Swedish Back Massage', 'description': 'Focused back and shoulder relief', 'price': 79900, 'duration': '45 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Swedish Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Swedish Leg Massage', 'description': 'Lower body circulation improvement', 'price': 69900, 'duration': '40 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Swedish Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Swedish Neck & Shoulder', 'description': 'Tension release for upper body', 'price': 64900, 'duration': '35 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Swedish Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Swedish Full Body Deluxe', 'description': 'Premium full body experience', 'price': 169900, 'duration': '90 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Swedish Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Swedish Aromatherapy Combo', 'description': 'Swedish with essential oils', 'price': 129900, 'duration': '70 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Swedish Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Swedish Stress Relief', 'description': 'Mental and physical relaxation', 'price': 119900, 'duration': '60 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Swedish Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
+        {'id': new_id(), 'name': 'Swedish Massage (30 min)', 'description': 'Gentle, flowing strokes for relaxation', 'price': 59900, 'duration': '30 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Swedish Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
+        {'id': new_id(), 'name': 'Swedish Massage (60 min)', 'description': 'Full body relaxation with Swedish techniques', 'price': 109900, 'duration': '60 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Swedish Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
+        {'id': new_id(), 'name': 'Swedish Massage (90 min)', 'description': 'Extended relaxation session', 'price': 149900, 'duration': '90 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Swedish Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
+        {'id': new_id(), 'name': 'Swedish Massage (120 min)', 'description': 'Ultimate relaxation experience', 'price': 189900, 'duration': '120 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Swedish Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
+        {'id': new_id(), 'name': 'Swedish Back Massage', 'description': 'Focused back and shoulder relief', 'price': 79900, 'duration': '45 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Swedish Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
+        {'id': new_id(), 'name': 'Swedish Leg Massage', 'description': 'Lower body circulation improvement', 'price': 69900, 'duration': '40 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Swedish Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
+        {'id': new_id(), 'name': 'Swedish Neck & Shoulder', 'description': 'Tension release for upper body', 'price': 64900, 'duration': '35 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Swedish Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
+        {'id': new_id(), 'name': 'Swedish Full Body Deluxe', 'description': 'Premium full body experience', 'price': 169900, 'duration': '90 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Swedish Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
+        {'id': new_id(), 'name': 'Swedish Aromatherapy Combo', 'description': 'Swedish with essential oils', 'price': 129900, 'duration': '70 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Swedish Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
+        {'id': new_id(), 'name': 'Swedish Stress Relief', 'description': 'Mental and physical relaxation', 'price': 119900, 'duration': '60 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Swedish Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
         
         # Deep Tissue Massage
-        {'id': str(uuid.uuid4()), 'name': 'Deep Tissue Massage (30 min)', 'description': 'Targeted pressure for muscle knots', 'price': 79900, 'duration': '30 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Deep Tissue Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060671-7a80dc8059ea?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Deep Tissue Massage (60 min)', 'description': 'Intensive muscle therapy', 'price': 139900, 'duration': '60 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Deep Tissue Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060671-7a80dc8059ea?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Deep Tissue Massage (90 min)', 'description': 'Extended deep muscle work', 'price': 189900, 'duration': '90 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Deep Tissue Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060671-7a80dc8059ea?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Deep Tissue Back Therapy', 'description': 'Chronic back pain relief', 'price': 119900, 'duration': '50 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Deep Tissue Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060671-7a80dc8059ea?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Deep Tissue Sports Recovery', 'description': 'Athlete muscle repair', 'price': 149900, 'duration': '70 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Deep Tissue Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060671-7a80dc8059ea?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Deep Tissue Neck & Shoulders', 'description': 'Upper body tension release', 'price': 99900, 'duration': '45 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Deep Tissue Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060671-7a80dc8059ea?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Deep Tissue Leg Therapy', 'description': 'Lower body muscle work', 'price': 109900, 'duration': '50 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Deep Tissue Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060671-7a80dc8059ea?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Deep Tissue Full Body', 'description': 'Complete muscle therapy', 'price': 199900, 'duration': '90 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Deep Tissue Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060671-7a80dc8059ea?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Deep Tissue Pain Relief', 'description': 'Chronic pain management', 'price': 159900, 'duration': '75 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Deep Tissue Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060671-7a80dc8059ea?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Deep Tissue Relaxation', 'description': 'Intense yet soothing', 'price': 129900, 'duration': '60 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Deep Tissue Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060671-7a80dc8059ea?w=400'},
+        {'id': new_id(), 'name': 'Deep Tissue Massage (30 min)', 'description': 'Targeted pressure for muscle knots', 'price': 79900, 'duration': '30 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Deep Tissue Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060671-7a80dc8059ea?w=400'},
+        {'id': new_id(), 'name': 'Deep Tissue Massage (60 min)', 'description': 'Intensive muscle therapy', 'price': 139900, 'duration': '60 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Deep Tissue Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060671-7a80dc8059ea?w=400'},
+        {'id': new_id(), 'name': 'Deep Tissue Massage (90 min)', 'description': 'Extended deep muscle work', 'price': 189900, 'duration': '90 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Deep Tissue Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060671-7a80dc8059ea?w=400'},
+        {'id': new_id(), 'name': 'Deep Tissue Back Therapy', 'description': 'Chronic back pain relief', 'price': 119900, 'duration': '50 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Deep Tissue Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060671-7a80dc8059ea?w=400'},
+        {'id': new_id(), 'name': 'Deep Tissue Sports Recovery', 'description': 'Athlete muscle repair', 'price': 149900, 'duration': '70 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Deep Tissue Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060671-7a80dc8059ea?w=400'},
+        {'id': new_id(), 'name': 'Deep Tissue Neck & Shoulders', 'description': 'Upper body tension release', 'price': 99900, 'duration': '45 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Deep Tissue Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060671-7a80dc8059ea?w=400'},
+        {'id': new_id(), 'name': 'Deep Tissue Leg Therapy', 'description': 'Lower body muscle work', 'price': 109900, 'duration': '50 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Deep Tissue Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060671-7a80dc8059ea?w=400'},
+        {'id': new_id(), 'name': 'Deep Tissue Full Body', 'description': 'Complete muscle therapy', 'price': 199900, 'duration': '90 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Deep Tissue Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060671-7a80dc8059ea?w=400'},
+        {'id': new_id(), 'name': 'Deep Tissue Pain Relief', 'description': 'Chronic pain management', 'price': 159900, 'duration': '75 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Deep Tissue Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060671-7a80dc8059ea?w=400'},
+        {'id': new_id(), 'name': 'Deep Tissue Relaxation', 'description': 'Intense yet soothing', 'price': 129900, 'duration': '60 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Deep Tissue Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060671-7a80dc8059ea?w=400'},
         
         # Aromatherapy Massage
-        {'id': str(uuid.uuid4()), 'name': 'Lavender Aromatherapy (30 min)', 'description': 'Calming lavender essential oils', 'price': 69900, 'duration': '30 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Aromatherapy Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Lavender Aromatherapy (60 min)', 'description': 'Relaxing full body with lavender', 'price': 119900, 'duration': '60 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Aromatherapy Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Eucalyptus Aromatherapy', 'description': 'Refreshing respiratory relief', 'price': 109900, 'duration': '50 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Aromatherapy Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Peppermint Aromatherapy', 'description': 'Energizing and cooling', 'price': 99900, 'duration': '45 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Aromatherapy Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Rose Aromatherapy', 'description': 'Romantic and soothing', 'price': 129900, 'duration': '60 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Aromatherapy Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Chamomile Aromatherapy', 'description': 'Sleep-inducing relaxation', 'price': 114900, 'duration': '55 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Aromatherapy Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Citrus Aromatherapy', 'description': 'Uplifting orange and lemon', 'price': 104900, 'duration': '50 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Aromatherapy Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Jasmine Aromatherapy', 'description': 'Sensual and calming', 'price': 139900, 'duration': '65 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Aromatherapy Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Sandalwood Aromatherapy', 'description': 'Grounding and meditative', 'price': 124900, 'duration': '60 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Aromatherapy Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Custom Aromatherapy Blend', 'description': 'Personalized essential oil mix', 'price': 149900, 'duration': '70 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Aromatherapy Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
+        {'id': new_id(), 'name': 'Lavender Aromatherapy (30 min)', 'description': 'Calming lavender essential oils', 'price': 69900, 'duration': '30 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Aromatherapy Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
+        {'id': new_id(), 'name': 'Lavender Aromatherapy (60 min)', 'description': 'Relaxing full body with lavender', 'price': 119900, 'duration': '60 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Aromatherapy Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
+        {'id': new_id(), 'name': 'Eucalyptus Aromatherapy', 'description': 'Refreshing respiratory relief', 'price': 109900, 'duration': '50 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Aromatherapy Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
+        {'id': new_id(), 'name': 'Peppermint Aromatherapy', 'description': 'Energizing and cooling', 'price': 99900, 'duration': '45 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Aromatherapy Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
+        {'id': new_id(), 'name': 'Rose Aromatherapy', 'description': 'Romantic and soothing', 'price': 129900, 'duration': '60 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Aromatherapy Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
+        {'id': new_id(), 'name': 'Chamomile Aromatherapy', 'description': 'Sleep-inducing relaxation', 'price': 114900, 'duration': '55 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Aromatherapy Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
+        {'id': new_id(), 'name': 'Citrus Aromatherapy', 'description': 'Uplifting orange and lemon', 'price': 104900, 'duration': '50 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Aromatherapy Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
+        {'id': new_id(), 'name': 'Jasmine Aromatherapy', 'description': 'Sensual and calming', 'price': 139900, 'duration': '65 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Aromatherapy Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
+        {'id': new_id(), 'name': 'Sandalwood Aromatherapy', 'description': 'Grounding and meditative', 'price': 124900, 'duration': '60 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Aromatherapy Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
+        {'id': new_id(), 'name': 'Custom Aromatherapy Blend', 'description': 'Personalized essential oil mix', 'price': 149900, 'duration': '70 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Aromatherapy Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
         
         # Thai Massage
-        {'id': str(uuid.uuid4()), 'name': 'Thai Massage (30 min)', 'description': 'Traditional Thai stretching', 'price': 74900, 'duration': '30 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Thai Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Thai Massage (60 min)', 'description': 'Full traditional Thai experience', 'price': 129900, 'duration': '60 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Thai Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Thai Massage (90 min)', 'description': 'Extended Thai therapy', 'price': 179900, 'duration': '90 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Thai Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Thai Foot Massage', 'description': 'Thai foot reflexology', 'price': 59900, 'duration': '40 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Thai Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Thai Back Massage', 'description': 'Thai back stretching', 'price': 89900, 'duration': '50 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Thai Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Thai Herbal Compress', 'description': 'Herbal ball therapy', 'price': 109900, 'duration': '45 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Thai Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Thai Oil Massage', 'description': 'Thai with aromatic oils', 'price': 139900, 'duration': '65 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Thai Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Thai Relaxation', 'description': 'Gentle Thai stretching', 'price': 119900, 'duration': '60 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Thai Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Thai Sports Recovery', 'description': 'Thai for athletic recovery', 'price': 149900, 'duration': '70 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Thai Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Thai Full Body Therapy', 'description': 'Complete Thai experience', 'price': 169900, 'duration': '80 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Thai Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
+        {'id': new_id(), 'name': 'Thai Massage (30 min)', 'description': 'Traditional Thai stretching', 'price': 74900, 'duration': '30 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Thai Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
+        {'id': new_id(), 'name': 'Thai Massage (60 min)', 'description': 'Full traditional Thai experience', 'price': 129900, 'duration': '60 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Thai Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
+        {'id': new_id(), 'name': 'Thai Massage (90 min)', 'description': 'Extended Thai therapy', 'price': 179900, 'duration': '90 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Thai Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
+        {'id': new_id(), 'name': 'Thai Foot Massage', 'description': 'Thai foot reflexology', 'price': 59900, 'duration': '40 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Thai Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
+        {'id': new_id(), 'name': 'Thai Back Massage', 'description': 'Thai back stretching', 'price': 89900, 'duration': '50 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Thai Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
+        {'id': new_id(), 'name': 'Thai Herbal Compress', 'description': 'Herbal ball therapy', 'price': 109900, 'duration': '45 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Thai Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
+        {'id': new_id(), 'name': 'Thai Oil Massage', 'description': 'Thai with aromatic oils', 'price': 139900, 'duration': '65 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Thai Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
+        {'id': new_id(), 'name': 'Thai Relaxation', 'description': 'Gentle Thai stretching', 'price': 119900, 'duration': '60 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Thai Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
+        {'id': new_id(), 'name': 'Thai Sports Recovery', 'description': 'Thai for athletic recovery', 'price': 149900, 'duration': '70 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Thai Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
+        {'id': new_id(), 'name': 'Thai Full Body Therapy', 'description': 'Complete Thai experience', 'price': 169900, 'duration': '80 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Thai Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
         
         # Balinese Massage
-        {'id': str(uuid.uuid4()), 'name': 'Balinese Massage (30 min)', 'description': 'Island-style relaxation', 'price': 79900, 'duration': '30 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Balinese Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1540555700478-4be289fbecef?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Balinese Massage (60 min)', 'description': 'Traditional Balinese techniques', 'price': 139900, 'duration': '60 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Balinese Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1540555700478-4be289fbecef?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Balinese Massage (90 min)', 'description': 'Extended Balinese therapy', 'price': 189900, 'duration': '90 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Balinese Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1540555700478-4be289fbecef?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Balinese Boreh Treatment', 'description': 'Herbal paste massage', 'price': 159900, 'duration': '70 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Balinese Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1540555700478-4be289fbecef?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Balinese Flower Bath', 'description': 'Floral aromatherapy massage', 'price': 149900, 'duration': '65 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Balinese Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1540555700478-4be289fbecef?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Balinese Warm Oil Massage', 'description': 'Heated oil therapy', 'price': 129900, 'duration': '60 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Balinese Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1540555700478-4be289fbecef?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Balinese Reflexology', 'description': 'Balinese foot therapy', 'price': 89900, 'duration': '45 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Balinese Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1540555700478-4be289fbecef?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Balinese Prenatal Massage', 'description': 'Safe pregnancy massage', 'price': 139900, 'duration': '60 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Balinese Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1540555700478-4be289fbecef?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Balinese Luxury Treatment', 'description': 'Premium Balinese experience', 'price': 199900, 'duration': '90 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Balinese Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1540555700478-4be289fbecef?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Balinese Healing Massage', 'description': 'Therapeutic Balinese techniques', 'price': 169900, 'duration': '75 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Balinese Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1540555700478-4be289fbecef?w=400'},
+        {'id': new_id(), 'name': 'Balinese Massage (30 min)', 'description': 'Island-style relaxation', 'price': 79900, 'duration': '30 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Balinese Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1540555700478-4be289fbecef?w=400'},
+        {'id': new_id(), 'name': 'Balinese Massage (60 min)', 'description': 'Traditional Balinese techniques', 'price': 139900, 'duration': '60 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Balinese Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1540555700478-4be289fbecef?w=400'},
+        {'id': new_id(), 'name': 'Balinese Massage (90 min)', 'description': 'Extended Balinese therapy', 'price': 189900, 'duration': '90 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Balinese Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1540555700478-4be289fbecef?w=400'},
+        {'id': new_id(), 'name': 'Balinese Boreh Treatment', 'description': 'Herbal paste massage', 'price': 159900, 'duration': '70 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Balinese Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1540555700478-4be289fbecef?w=400'},
+        {'id': new_id(), 'name': 'Balinese Flower Bath', 'description': 'Floral aromatherapy massage', 'price': 149900, 'duration': '65 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Balinese Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1540555700478-4be289fbecef?w=400'},
+        {'id': new_id(), 'name': 'Balinese Warm Oil Massage', 'description': 'Heated oil therapy', 'price': 129900, 'duration': '60 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Balinese Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1540555700478-4be289fbecef?w=400'},
+        {'id': new_id(), 'name': 'Balinese Reflexology', 'description': 'Balinese foot therapy', 'price': 89900, 'duration': '45 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Balinese Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1540555700478-4be289fbecef?w=400'},
+        {'id': new_id(), 'name': 'Balinese Prenatal Massage', 'description': 'Safe pregnancy massage', 'price': 139900, 'duration': '60 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Balinese Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1540555700478-4be289fbecef?w=400'},
+        {'id': new_id(), 'name': 'Balinese Luxury Treatment', 'description': 'Premium Balinese experience', 'price': 199900, 'duration': '90 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Balinese Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1540555700478-4be289fbecef?w=400'},
+        {'id': new_id(), 'name': 'Balinese Healing Massage', 'description': 'Therapeutic Balinese techniques', 'price': 169900, 'duration': '75 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Balinese Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1540555700478-4be289fbecef?w=400'},
         
         # Hot Stone Massage
-        {'id': str(uuid.uuid4()), 'name': 'Hot Stone Massage (30 min)', 'description': 'Heated stone therapy', 'price': 89900, 'duration': '30 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Hot Stone Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1507652313519-d4e9174996dd?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Hot Stone Massage (60 min)', 'description': 'Full body hot stone therapy', 'price': 159900, 'duration': '60 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Hot Stone Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1507652313519-d4e9174996dd?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Hot Stone Massage (90 min)', 'description': 'Extended hot stone session', 'price': 219900, 'duration': '90 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Hot Stone Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1507652313519-d4e9174996dd?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Hot Stone Back Therapy', 'description': 'Back-focused hot stone', 'price': 129900, 'duration': '50 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Hot Stone Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1507652313519-d4e9174996dd?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Hot Stone Aromatherapy', 'description': 'Hot stones with essential oils', 'price': 179900, 'duration': '70 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Hot Stone Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1507652313519-d4e9174996dd?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Hot Stone Deep Tissue', 'description': 'Heated deep muscle work', 'price': 189900, 'duration': '75 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Hot Stone Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1507652313519-d4e9174996dd?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Hot Stone Relaxation', 'description': 'Soothing heat therapy', 'price': 149900, 'duration': '65 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Hot Stone Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1507652313519-d4e9174996dd?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Hot Stone Swedish Combo', 'description': 'Swedish with hot stones', 'price': 169900, 'duration': '70 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Hot Stone Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1507652313519-d4e9174996dd?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Hot Stone Detox Massage', 'description': 'Heat-induced detoxification', 'price': 199900, 'duration': '80 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Hot Stone Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1507652313519-d4e9174996dd?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Hot Stone Luxury Treatment', 'description': 'Premium hot stone experience', 'price': 229900, 'duration': '90 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Hot Stone Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1507652313519-d4e9174996dd?w=400'},
+        {'id': new_id(), 'name': 'Hot Stone Massage (30 min)', 'description': 'Heated stone therapy', 'price': 89900, 'duration': '30 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Hot Stone Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1507652313519-d4e9174996dd?w=400'},
+        {'id': new_id(), 'name': 'Hot Stone Massage (60 min)', 'description': 'Full body hot stone therapy', 'price': 159900, 'duration': '60 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Hot Stone Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1507652313519-d4e9174996dd?w=400'},
+        {'id': new_id(), 'name': 'Hot Stone Massage (90 min)', 'description': 'Extended hot stone session', 'price': 219900, 'duration': '90 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Hot Stone Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1507652313519-d4e9174996dd?w=400'},
+        {'id': new_id(), 'name': 'Hot Stone Back Therapy', 'description': 'Back-focused hot stone', 'price': 129900, 'duration': '50 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Hot Stone Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1507652313519-d4e9174996dd?w=400'},
+        {'id': new_id(), 'name': 'Hot Stone Aromatherapy', 'description': 'Hot stones with essential oils', 'price': 179900, 'duration': '70 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Hot Stone Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1507652313519-d4e9174996dd?w=400'},
+        {'id': new_id(), 'name': 'Hot Stone Deep Tissue', 'description': 'Heated deep muscle work', 'price': 189900, 'duration': '75 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Hot Stone Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1507652313519-d4e9174996dd?w=400'},
+        {'id': new_id(), 'name': 'Hot Stone Relaxation', 'description': 'Soothing heat therapy', 'price': 149900, 'duration': '65 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Hot Stone Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1507652313519-d4e9174996dd?w=400'},
+        {'id': new_id(), 'name': 'Hot Stone Swedish Combo', 'description': 'Swedish with hot stones', 'price': 169900, 'duration': '70 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Hot Stone Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1507652313519-d4e9174996dd?w=400'},
+        {'id': new_id(), 'name': 'Hot Stone Detox Massage', 'description': 'Heat-induced detoxification', 'price': 199900, 'duration': '80 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Hot Stone Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1507652313519-d4e9174996dd?w=400'},
+        {'id': new_id(), 'name': 'Hot Stone Luxury Treatment', 'description': 'Premium hot stone experience', 'price': 229900, 'duration': '90 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Hot Stone Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1507652313519-d4e9174996dd?w=400'},
         
         # Head & Neck Massage
-        {'id': str(uuid.uuid4()), 'name': 'Head Massage (15 min)', 'description': 'Quick scalp relief', 'price': 39900, 'duration': '15 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Head & Neck Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1519823551278-64ac92734fb1?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Head Massage (30 min)', 'description': 'Relaxing head therapy', 'price': 69900, 'duration': '30 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Head & Neck Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1519823551278-64ac92734fb1?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Head Massage (45 min)', 'description': 'Extended head relaxation', 'price': 99900, 'duration': '45 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Head & Neck Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1519823551278-64ac92734fb1?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Neck & Shoulder Massage', 'description': 'Upper body tension relief', 'price': 79900, 'duration': '40 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Head & Neck Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1519823551278-64ac92734fb1?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Head & Neck Combo', 'description': 'Complete upper relief', 'price': 109900, 'duration': '50 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Head & Neck Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1519823551278-64ac92734fb1?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Migraine Relief Massage', 'description': 'Headache and migraine relief', 'price': 89900, 'duration': '45 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Head & Neck Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1519823551278-64ac92734fb1?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Scalp Treatment Massage', 'description': 'Hair and scalp therapy', 'price': 79900, 'duration': '35 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Head & Neck Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1519823551278-64ac92734fb1?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'TMJ Massage', 'description': 'Jaw tension relief', 'price': 64900, 'duration': '30 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Head & Neck Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1519823551278-64ac92734fb1?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Cervical Massage', 'description': 'Neck alignment therapy', 'price': 89900, 'duration': '40 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Head & Neck Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1519823551278-64ac92734fb1?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Head & Neck Aromatherapy', 'description': 'Essential oils for head relief', 'price': 119900, 'duration': '50 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Head & Neck Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1519823551278-64ac92734fb1?w=400'},
+        {'id': new_id(), 'name': 'Head Massage (15 min)', 'description': 'Quick scalp relief', 'price': 39900, 'duration': '15 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Head & Neck Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1519823551278-64ac92734fb1?w=400'},
+        {'id': new_id(), 'name': 'Head Massage (30 min)', 'description': 'Relaxing head therapy', 'price': 69900, 'duration': '30 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Head & Neck Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1519823551278-64ac92734fb1?w=400'},
+        {'id': new_id(), 'name': 'Head Massage (45 min)', 'description': 'Extended head relaxation', 'price': 99900, 'duration': '45 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Head & Neck Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1519823551278-64ac92734fb1?w=400'},
+        {'id': new_id(), 'name': 'Neck & Shoulder Massage', 'description': 'Upper body tension relief', 'price': 79900, 'duration': '40 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Head & Neck Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1519823551278-64ac92734fb1?w=400'},
+        {'id': new_id(), 'name': 'Head & Neck Combo', 'description': 'Complete upper relief', 'price': 109900, 'duration': '50 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Head & Neck Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1519823551278-64ac92734fb1?w=400'},
+        {'id': new_id(), 'name': 'Migraine Relief Massage', 'description': 'Headache and migraine relief', 'price': 89900, 'duration': '45 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Head & Neck Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1519823551278-64ac92734fb1?w=400'},
+        {'id': new_id(), 'name': 'Scalp Treatment Massage', 'description': 'Hair and scalp therapy', 'price': 79900, 'duration': '35 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Head & Neck Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1519823551278-64ac92734fb1?w=400'},
+        {'id': new_id(), 'name': 'TMJ Massage', 'description': 'Jaw tension relief', 'price': 64900, 'duration': '30 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Head & Neck Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1519823551278-64ac92734fb1?w=400'},
+        {'id': new_id(), 'name': 'Cervical Massage', 'description': 'Neck alignment therapy', 'price': 89900, 'duration': '40 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Head & Neck Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1519823551278-64ac92734fb1?w=400'},
+        {'id': new_id(), 'name': 'Head & Neck Aromatherapy', 'description': 'Essential oils for head relief', 'price': 119900, 'duration': '50 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Head & Neck Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1519823551278-64ac92734fb1?w=400'},
         
         # Foot Reflexology
-        {'id': str(uuid.uuid4()), 'name': 'Foot Reflexology (15 min)', 'description': 'Quick foot pressure points', 'price': 39900, 'duration': '15 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Foot Reflexology'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1598440947619-2c35fc9aa908?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Foot Reflexology (30 min)', 'description': 'Basic foot therapy', 'price': 69900, 'duration': '30 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Foot Reflexology'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1598440947619-2c35fc9aa908?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Foot Reflexology (45 min)', 'description': 'Extended foot treatment', 'price': 99900, 'duration': '45 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Foot Reflexology'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1598440947619-2c35fc9aa908?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Foot Reflexology (60 min)', 'description': 'Complete foot therapy', 'price': 129900, 'duration': '60 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Foot Reflexology'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1598440947619-2c35fc9aa908?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Foot & Calf Massage', 'description': 'Lower leg circulation', 'price': 89900, 'duration': '40 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Foot Reflexology'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1598440947619-2c35fc9aa908?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Sports Foot Recovery', 'description': 'Athlete foot therapy', 'price': 109900, 'duration': '45 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Foot Reflexology'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1598440947619-2c35fc9aa908?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Foot Detox Massage', 'description': 'Lymphatic drainage', 'price': 119900, 'duration': '50 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Foot Reflexology'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1598440947619-2c35fc9aa908?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Foot Aromatherapy', 'description': 'Essential oils for feet', 'price': 99900, 'duration': '45 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Foot Reflexology'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1598440947619-2c35fc9aa908?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Foot Warm Stone Therapy', 'description': 'Heated stone foot massage', 'price': 139900, 'duration': '55 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Foot Reflexology'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1598440947619-2c35fc9aa908?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Foot Thai Massage', 'description': 'Thai foot stretching', 'price': 109900, 'duration': '45 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Foot Reflexology'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1598440947619-2c35fc9aa908?w=400'},
+        {'id': new_id(), 'name': 'Foot Reflexology (15 min)', 'description': 'Quick foot pressure points', 'price': 39900, 'duration': '15 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Foot Reflexology'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1598440947619-2c35fc9aa908?w=400'},
+        {'id': new_id(), 'name': 'Foot Reflexology (30 min)', 'description': 'Basic foot therapy', 'price': 69900, 'duration': '30 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Foot Reflexology'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1598440947619-2c35fc9aa908?w=400'},
+        {'id': new_id(), 'name': 'Foot Reflexology (45 min)', 'description': 'Extended foot treatment', 'price': 99900, 'duration': '45 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Foot Reflexology'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1598440947619-2c35fc9aa908?w=400'},
+        {'id': new_id(), 'name': 'Foot Reflexology (60 min)', 'description': 'Complete foot therapy', 'price': 129900, 'duration': '60 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Foot Reflexology'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1598440947619-2c35fc9aa908?w=400'},
+        {'id': new_id(), 'name': 'Foot & Calf Massage', 'description': 'Lower leg circulation', 'price': 89900, 'duration': '40 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Foot Reflexology'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1598440947619-2c35fc9aa908?w=400'},
+        {'id': new_id(), 'name': 'Sports Foot Recovery', 'description': 'Athlete foot therapy', 'price': 109900, 'duration': '45 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Foot Reflexology'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1598440947619-2c35fc9aa908?w=400'},
+        {'id': new_id(), 'name': 'Foot Detox Massage', 'description': 'Lymphatic drainage', 'price': 119900, 'duration': '50 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Foot Reflexology'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1598440947619-2c35fc9aa908?w=400'},
+        {'id': new_id(), 'name': 'Foot Aromatherapy', 'description': 'Essential oils for feet', 'price': 99900, 'duration': '45 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Foot Reflexology'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1598440947619-2c35fc9aa908?w=400'},
+        {'id': new_id(), 'name': 'Foot Warm Stone Therapy', 'description': 'Heated stone foot massage', 'price': 139900, 'duration': '55 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Foot Reflexology'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1598440947619-2c35fc9aa908?w=400'},
+        {'id': new_id(), 'name': 'Foot Thai Massage', 'description': 'Thai foot stretching', 'price': 109900, 'duration': '45 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Foot Reflexology'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1598440947619-2c35fc9aa908?w=400'},
         
         # Back & Shoulder Massage
-        {'id': str(uuid.uuid4()), 'name': 'Back Massage (20 min)', 'description': 'Quick back relief', 'price': 49900, 'duration': '20 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Back & Shoulder Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1519823551278-64ac92734fb1?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Back Massage (30 min)', 'description': 'Basic back therapy', 'price': 69900, 'duration': '30 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Back & Shoulder Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1519823551278-64ac92734fb1?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Back Massage (45 min)', 'description': 'Extended back treatment', 'price': 99900, 'duration': '45 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Back & Shoulder Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1519823551278-64ac92734fb1?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Shoulder Massage', 'description': 'Shoulder tension relief', 'price': 64900, 'duration': '30 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Back & Shoulder Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1519823551278-64ac92734fb1?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Back & Shoulder Combo', 'description': 'Complete upper back relief', 'price': 109900, 'duration': '50 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Back & Shoulder Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1519823551278-64ac92734fb1?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Deep Back Massage', 'description': 'Intensive back muscle work', 'price': 129900, 'duration': '50 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Back & Shoulder Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1519823551278-64ac92734fb1?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Back Aromatherapy', 'description': 'Essential oils for back', 'price': 119900, 'duration': '45 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Back & Shoulder Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1519823551278-64ac92734fb1?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Back Hot Stone Therapy', 'description': 'Heated stones for back', 'price': 149900, 'duration': '55 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Back & Shoulder Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1519823551278-64ac92734fb1?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Back Thai Massage', 'description': 'Thai back stretching', 'price': 119900, 'duration': '45 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Back & Shoulder Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1519823551278-64ac92734fb1?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Back Sports Recovery', 'description': 'Athletic back recovery', 'price': 139900, 'duration': '55 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Back & Shoulder Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1519823551278-64ac92734fb1?w=400'},
+        {'id': new_id(), 'name': 'Back Massage (20 min)', 'description': 'Quick back relief', 'price': 49900, 'duration': '20 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Back & Shoulder Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1519823551278-64ac92734fb1?w=400'},
+        {'id': new_id(), 'name': 'Back Massage (30 min)', 'description': 'Basic back therapy', 'price': 69900, 'duration': '30 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Back & Shoulder Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1519823551278-64ac92734fb1?w=400'},
+        {'id': new_id(), 'name': 'Back Massage (45 min)', 'description': 'Extended back treatment', 'price': 99900, 'duration': '45 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Back & Shoulder Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1519823551278-64ac92734fb1?w=400'},
+        {'id': new_id(), 'name': 'Shoulder Massage', 'description': 'Shoulder tension relief', 'price': 64900, 'duration': '30 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Back & Shoulder Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1519823551278-64ac92734fb1?w=400'},
+        {'id': new_id(), 'name': 'Back & Shoulder Combo', 'description': 'Complete upper back relief', 'price': 109900, 'duration': '50 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Back & Shoulder Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1519823551278-64ac92734fb1?w=400'},
+        {'id': new_id(), 'name': 'Deep Back Massage', 'description': 'Intensive back muscle work', 'price': 129900, 'duration': '50 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Back & Shoulder Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1519823551278-64ac92734fb1?w=400'},
+        {'id': new_id(), 'name': 'Back Aromatherapy', 'description': 'Essential oils for back', 'price': 119900, 'duration': '45 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Back & Shoulder Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1519823551278-64ac92734fb1?w=400'},
+        {'id': new_id(), 'name': 'Back Hot Stone Therapy', 'description': 'Heated stones for back', 'price': 149900, 'duration': '55 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Back & Shoulder Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1519823551278-64ac92734fb1?w=400'},
+        {'id': new_id(), 'name': 'Back Thai Massage', 'description': 'Thai back stretching', 'price': 119900, 'duration': '45 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Back & Shoulder Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1519823551278-64ac92734fb1?w=400'},
+        {'id': new_id(), 'name': 'Back Sports Recovery', 'description': 'Athletic back recovery', 'price': 139900, 'duration': '55 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Back & Shoulder Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1519823551278-64ac92734fb1?w=400'},
         
         # Relaxation Massage
-        {'id': str(uuid.uuid4()), 'name': 'Relaxation Massage (30 min)', 'description': 'Light stress relief', 'price': 64900, 'duration': '30 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Relaxation Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Relaxation Massage (45 min)', 'description': 'Gentle full body relaxation', 'price': 89900, 'duration': '45 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Relaxation Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Relaxation Massage (60 min)', 'description': 'Complete relaxation therapy', 'price': 119900, 'duration': '60 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Relaxation Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Relaxation Massage (90 min)', 'description': 'Extended relaxation session', 'price': 159900, 'duration': '90 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Relaxation Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Sleep Relaxation Massage', 'description': 'Pre-sleep calming massage', 'price': 109900, 'duration': '50 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Relaxation Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Stress Relief Massage', 'description': 'Mental tension release', 'price': 129900, 'duration': '60 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Relaxation Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Meditation Massage', 'description': 'Mindful relaxation therapy', 'price': 139900, 'duration': '65 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Relaxation Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Weekend Relaxation', 'description': 'Leisurely full body massage', 'price': 149900, 'duration': '75 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Relaxation Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Luxury Relaxation', 'description': 'Premium relaxation experience', 'price': 179900, 'duration': '80 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Relaxation Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Ultimate Relaxation', 'description': 'Complete mind-body harmony', 'price': 199900, 'duration': '90 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Relaxation Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
+        {'id': new_id(), 'name': 'Relaxation Massage (30 min)', 'description': 'Light stress relief', 'price': 64900, 'duration': '30 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Relaxation Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
+        {'id': new_id(), 'name': 'Relaxation Massage (45 min)', 'description': 'Gentle full body relaxation', 'price': 89900, 'duration': '45 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Relaxation Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
+        {'id': new_id(), 'name': 'Relaxation Massage (60 min)', 'description': 'Complete relaxation therapy', 'price': 119900, 'duration': '60 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Relaxation Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
+        {'id': new_id(), 'name': 'Relaxation Massage (90 min)', 'description': 'Extended relaxation session', 'price': 159900, 'duration': '90 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Relaxation Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
+        {'id': new_id(), 'name': 'Sleep Relaxation Massage', 'description': 'Pre-sleep calming massage', 'price': 109900, 'duration': '50 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Relaxation Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
+        {'id': new_id(), 'name': 'Stress Relief Massage', 'description': 'Mental tension release', 'price': 129900, 'duration': '60 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Relaxation Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
+        {'id': new_id(), 'name': 'Meditation Massage', 'description': 'Mindful relaxation therapy', 'price': 139900, 'duration': '65 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Relaxation Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
+        {'id': new_id(), 'name': 'Weekend Relaxation', 'description': 'Leisurely full body massage', 'price': 149900, 'duration': '75 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Relaxation Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
+        {'id': new_id(), 'name': 'Luxury Relaxation', 'description': 'Premium relaxation experience', 'price': 179900, 'duration': '80 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Relaxation Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
+        {'id': new_id(), 'name': 'Ultimate Relaxation', 'description': 'Complete mind-body harmony', 'price': 199900, 'duration': '90 min', 'category_id': massage_cat, 'sub_category_id': sub_cat_map['Relaxation Massage'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
         
         # ===== THERAPY PRODUCTS =====
         # Physiotherapy
-        {'id': str(uuid.uuid4()), 'name': 'Physiotherapy Session (30 min)', 'description': 'Basic physiotherapy assessment', 'price': 89900, 'duration': '30 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Physiotherapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1630595632518-8217c0bceb8f?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Physiotherapy Session (45 min)', 'description': 'Standard physiotherapy treatment', 'price': 129900, 'duration': '45 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Physiotherapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1630595632518-8217c0bceb8f?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Physiotherapy Session (60 min)', 'description': 'Comprehensive physiotherapy', 'price': 169900, 'duration': '60 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Physiotherapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1630595632518-8217c0bceb8f?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Sports Physiotherapy', 'description': 'Athletic injury rehabilitation', 'price': 189900, 'duration': '60 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Physiotherapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1630595632518-8217c0bceb8f?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Post-Surgery Physiotherapy', 'description': 'Surgical recovery therapy', 'price': 199900, 'duration': '60 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Physiotherapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1630595632518-8217c0bceb8f?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Geriatric Physiotherapy', 'description': 'Senior mobility therapy', 'price': 149900, 'duration': '50 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Physiotherapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1630595632518-8217c0bceb8f?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Neurological Physiotherapy', 'description': 'Nervous system rehabilitation', 'price': 219900, 'duration': '70 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Physiotherapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1630595632518-8217c0bceb8f?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Pediatric Physiotherapy', 'description': 'Child development therapy', 'price': 139900, 'duration': '45 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Physiotherapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1630595632518-8217c0bceb8f?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Cardiac Physiotherapy', 'description': 'Heart rehabilitation therapy', 'price': 179900, 'duration': '55 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Physiotherapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1630595632518-8217c0bceb8f?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Respiratory Physiotherapy', 'description': 'Breathing and lung therapy', 'price': 159900, 'duration': '50 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Physiotherapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1630595632518-8217c0bceb8f?w=400'},
+        {'id': new_id(), 'name': 'Physiotherapy Session (30 min)', 'description': 'Basic physiotherapy assessment', 'price': 89900, 'duration': '30 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Physiotherapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1630595632518-8217c0bceb8f?w=400'},
+        {'id': new_id(), 'name': 'Physiotherapy Session (45 min)', 'description': 'Standard physiotherapy treatment', 'price': 129900, 'duration': '45 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Physiotherapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1630595632518-8217c0bceb8f?w=400'},
+        {'id': new_id(), 'name': 'Physiotherapy Session (60 min)', 'description': 'Comprehensive physiotherapy', 'price': 169900, 'duration': '60 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Physiotherapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1630595632518-8217c0bceb8f?w=400'},
+        {'id': new_id(), 'name': 'Sports Physiotherapy', 'description': 'Athletic injury rehabilitation', 'price': 189900, 'duration': '60 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Physiotherapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1630595632518-8217c0bceb8f?w=400'},
+        {'id': new_id(), 'name': 'Post-Surgery Physiotherapy', 'description': 'Surgical recovery therapy', 'price': 199900, 'duration': '60 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Physiotherapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1630595632518-8217c0bceb8f?w=400'},
+        {'id': new_id(), 'name': 'Geriatric Physiotherapy', 'description': 'Senior mobility therapy', 'price': 149900, 'duration': '50 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Physiotherapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1630595632518-8217c0bceb8f?w=400'},
+        {'id': new_id(), 'name': 'Neurological Physiotherapy', 'description': 'Nervous system rehabilitation', 'price': 219900, 'duration': '70 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Physiotherapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1630595632518-8217c0bceb8f?w=400'},
+        {'id': new_id(), 'name': 'Pediatric Physiotherapy', 'description': 'Child development therapy', 'price': 139900, 'duration': '45 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Physiotherapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1630595632518-8217c0bceb8f?w=400'},
+        {'id': new_id(), 'name': 'Cardiac Physiotherapy', 'description': 'Heart rehabilitation therapy', 'price': 179900, 'duration': '55 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Physiotherapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1630595632518-8217c0bceb8f?w=400'},
+        {'id': new_id(), 'name': 'Respiratory Physiotherapy', 'description': 'Breathing and lung therapy', 'price': 159900, 'duration': '50 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Physiotherapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1630595632518-8217c0bceb8f?w=400'},
         
         # Chiropractic Therapy
-        {'id': str(uuid.uuid4()), 'name': 'Chiropractic Adjustment (30 min)', 'description': 'Spinal alignment session', 'price': 99900, 'duration': '30 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Chiropractic Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1571019613454-1cb2f99b2d8b?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Chiropractic Adjustment (45 min)', 'description': 'Complete spinal therapy', 'price': 139900, 'duration': '45 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Chiropractic Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1571019613454-1cb2f99b2d8b?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Chiropractic Adjustment (60 min)', 'description': 'Extended chiropractic care', 'price': 179900, 'duration': '60 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Chiropractic Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1571019613454-1cb2f99b2d8b?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Sports Chiropractic', 'description': 'Athletic spinal care', 'price': 199900, 'duration': '60 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Chiropractic Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1571019613454-1cb2f99b2d8b?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Pediatric Chiropractic', 'description': 'Child spinal alignment', 'price': 129900, 'duration': '40 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Chiropractic Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1571019613454-1cb2f99b2d8b?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Geriatric Chiropractic', 'description': 'Senior spinal care', 'price': 149900, 'duration': '45 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Chiropractic Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1571019613454-1cb2f99b2d8b?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Prenatal Chiropractic', 'description': 'Pregnancy spinal care', 'price': 159900, 'duration': '50 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Chiropractic Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1571019613454-1cb2f99b2d8b?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Extremity Adjustment', 'description': 'Joint and limb alignment', 'price': 119900, 'duration': '40 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Chiropractic Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1571019613454-1cb2f99b2d8b?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Chiropractic Massage Combo', 'description': 'Adjustment with massage', 'price': 219900, 'duration': '75 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Chiropractic Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1571019613454-1cb2f99b2d8b?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Chiropractic Wellness Plan', 'description': 'Ongoing spinal health', 'price': 89900, 'duration': '30 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Chiropractic Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1571019613454-1cb2f99b2d8b?w=400'},
+        {'id': new_id(), 'name': 'Chiropractic Adjustment (30 min)', 'description': 'Spinal alignment session', 'price': 99900, 'duration': '30 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Chiropractic Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1571019613454-1cb2f99b2d8b?w=400'},
+        {'id': new_id(), 'name': 'Chiropractic Adjustment (45 min)', 'description': 'Complete spinal therapy', 'price': 139900, 'duration': '45 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Chiropractic Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1571019613454-1cb2f99b2d8b?w=400'},
+        {'id': new_id(), 'name': 'Chiropractic Adjustment (60 min)', 'description': 'Extended chiropractic care', 'price': 179900, 'duration': '60 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Chiropractic Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1571019613454-1cb2f99b2d8b?w=400'},
+        {'id': new_id(), 'name': 'Sports Chiropractic', 'description': 'Athletic spinal care', 'price': 199900, 'duration': '60 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Chiropractic Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1571019613454-1cb2f99b2d8b?w=400'},
+        {'id': new_id(), 'name': 'Pediatric Chiropractic', 'description': 'Child spinal alignment', 'price': 129900, 'duration': '40 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Chiropractic Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1571019613454-1cb2f99b2d8b?w=400'},
+        {'id': new_id(), 'name': 'Geriatric Chiropractic', 'description': 'Senior spinal care', 'price': 149900, 'duration': '45 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Chiropractic Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1571019613454-1cb2f99b2d8b?w=400'},
+        {'id': new_id(), 'name': 'Prenatal Chiropractic', 'description': 'Pregnancy spinal care', 'price': 159900, 'duration': '50 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Chiropractic Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1571019613454-1cb2f99b2d8b?w=400'},
+        {'id': new_id(), 'name': 'Extremity Adjustment', 'description': 'Joint and limb alignment', 'price': 119900, 'duration': '40 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Chiropractic Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1571019613454-1cb2f99b2d8b?w=400'},
+        {'id': new_id(), 'name': 'Chiropractic Massage Combo', 'description': 'Adjustment with massage', 'price': 219900, 'duration': '75 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Chiropractic Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1571019613454-1cb2f99b2d8b?w=400'},
+        {'id': new_id(), 'name': 'Chiropractic Wellness Plan', 'description': 'Ongoing spinal health', 'price': 89900, 'duration': '30 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Chiropractic Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1571019613454-1cb2f99b2d8b?w=400'},
         
         # Reflexology
-        {'id': str(uuid.uuid4()), 'name': 'Foot Reflexology (20 min)', 'description': 'Basic foot pressure therapy', 'price': 59900, 'duration': '20 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Reflexology'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1598440947619-2c35fc9aa908?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Foot Reflexology (30 min)', 'description': 'Standard foot reflexology', 'price': 79900, 'duration': '30 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Reflexology'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1598440947619-2c35fc9aa908?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Foot Reflexology (45 min)', 'description': 'Extended foot therapy', 'price': 109900, 'duration': '45 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Reflexology'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1598440947619-2c35fc9aa908?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Hand Reflexology', 'description': 'Hand pressure point therapy', 'price': 69900, 'duration': '30 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Reflexology'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1598440947619-2c35fc9aa908?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Full Body Reflexology', 'description': 'Complete reflex zone therapy', 'price': 149900, 'duration': '60 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Reflexology'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1598440947619-2c35fc9aa908?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Ear Reflexology', 'description': 'Auricular therapy', 'price': 59900, 'duration': '25 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Reflexology'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1598440947619-2c35fc9aa908?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Facial Reflexology', 'description': 'Face pressure point therapy', 'price': 79900, 'duration': '35 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Reflexology'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1598440947619-2c35fc9aa908?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Reflexology Massage Combo', 'description': 'Reflexology with massage', 'price': 129900, 'duration': '55 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Reflexology'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1598440947619-2c35fc9aa908?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Sports Reflexology', 'description': 'Athletic performance enhancement', 'price': 119900, 'duration': '45 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Reflexology'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1598440947619-2c35fc9aa908?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Therapeutic Reflexology', 'description': 'Medical condition support', 'price': 139900, 'duration': '50 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Reflexology'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1598440947619-2c35fc9aa908?w=400'},
+        {'id': new_id(), 'name': 'Foot Reflexology (20 min)', 'description': 'Basic foot pressure therapy', 'price': 59900, 'duration': '20 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Reflexology'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1598440947619-2c35fc9aa908?w=400'},
+        {'id': new_id(), 'name': 'Foot Reflexology (30 min)', 'description': 'Standard foot reflexology', 'price': 79900, 'duration': '30 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Reflexology'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1598440947619-2c35fc9aa908?w=400'},
+        {'id': new_id(), 'name': 'Foot Reflexology (45 min)', 'description': 'Extended foot therapy', 'price': 109900, 'duration': '45 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Reflexology'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1598440947619-2c35fc9aa908?w=400'},
+        {'id': new_id(), 'name': 'Hand Reflexology', 'description': 'Hand pressure point therapy', 'price': 69900, 'duration': '30 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Reflexology'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1598440947619-2c35fc9aa908?w=400'},
+        {'id': new_id(), 'name': 'Full Body Reflexology', 'description': 'Complete reflex zone therapy', 'price': 149900, 'duration': '60 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Reflexology'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1598440947619-2c35fc9aa908?w=400'},
+        {'id': new_id(), 'name': 'Ear Reflexology', 'description': 'Auricular therapy', 'price': 59900, 'duration': '25 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Reflexology'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1598440947619-2c35fc9aa908?w=400'},
+        {'id': new_id(), 'name': 'Facial Reflexology', 'description': 'Face pressure point therapy', 'price': 79900, 'duration': '35 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Reflexology'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1598440947619-2c35fc9aa908?w=400'},
+        {'id': new_id(), 'name': 'Reflexology Massage Combo', 'description': 'Reflexology with massage', 'price': 129900, 'duration': '55 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Reflexology'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1598440947619-2c35fc9aa908?w=400'},
+        {'id': new_id(), 'name': 'Sports Reflexology', 'description': 'Athletic performance enhancement', 'price': 119900, 'duration': '45 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Reflexology'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1598440947619-2c35fc9aa908?w=400'},
+        {'id': new_id(), 'name': 'Therapeutic Reflexology', 'description': 'Medical condition support', 'price': 139900, 'duration': '50 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Reflexology'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1598440947619-2c35fc9aa908?w=400'},
         
         # Cupping Therapy
-        {'id': str(uuid.uuid4()), 'name': 'Cupping Therapy (20 min)', 'description': 'Basic suction cup therapy', 'price': 69900, 'duration': '20 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Cupping Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Cupping Therapy (30 min)', 'description': 'Standard cupping session', 'price': 99900, 'duration': '30 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Cupping Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Cupping Therapy (45 min)', 'description': 'Extended cupping treatment', 'price': 139900, 'duration': '45 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Cupping Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Back Cupping', 'description': 'Back-focused cupping therapy', 'price': 119900, 'duration': '35 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Cupping Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Sports Cupping', 'description': 'Athletic recovery cupping', 'price': 149900, 'duration': '45 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Cupping Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Face Cupping', 'description': 'Facial rejuvenation cupping', 'price': 109900, 'duration': '30 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Cupping Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Cupping Massage Combo', 'description': 'Cupping with massage therapy', 'price': 169900, 'duration': '60 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Cupping Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Moving Cupping', 'description': 'Dynamic cupping technique', 'price': 159900, 'duration': '50 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Cupping Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Wet Cupping', 'description': 'Bloodletting cupping therapy', 'price': 189900, 'duration': '55 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Cupping Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Cupping Detox Therapy', 'description': 'Detoxification through cupping', 'price': 179900, 'duration': '50 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Cupping Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
+        {'id': new_id(), 'name': 'Cupping Therapy (20 min)', 'description': 'Basic suction cup therapy', 'price': 69900, 'duration': '20 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Cupping Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
+        {'id': new_id(), 'name': 'Cupping Therapy (30 min)', 'description': 'Standard cupping session', 'price': 99900, 'duration': '30 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Cupping Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
+        {'id': new_id(), 'name': 'Cupping Therapy (45 min)', 'description': 'Extended cupping treatment', 'price': 139900, 'duration': '45 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Cupping Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
+        {'id': new_id(), 'name': 'Back Cupping', 'description': 'Back-focused cupping therapy', 'price': 119900, 'duration': '35 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Cupping Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
+        {'id': new_id(), 'name': 'Sports Cupping', 'description': 'Athletic recovery cupping', 'price': 149900, 'duration': '45 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Cupping Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
+        {'id': new_id(), 'name': 'Face Cupping', 'description': 'Facial rejuvenation cupping', 'price': 109900, 'duration': '30 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Cupping Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
+        {'id': new_id(), 'name': 'Cupping Massage Combo', 'description': 'Cupping with massage therapy', 'price': 169900, 'duration': '60 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Cupping Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
+        {'id': new_id(), 'name': 'Moving Cupping', 'description': 'Dynamic cupping technique', 'price': 159900, 'duration': '50 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Cupping Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
+        {'id': new_id(), 'name': 'Wet Cupping', 'description': 'Bloodletting cupping therapy', 'price': 189900, 'duration': '55 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Cupping Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
+        {'id': new_id(), 'name': 'Cupping Detox Therapy', 'description': 'Detoxification through cupping', 'price': 179900, 'duration': '50 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Cupping Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
         
         # Acupuncture
-        {'id': str(uuid.uuid4()), 'name': 'Acupuncture Session (30 min)', 'description': 'Basic needle therapy', 'price': 109900, 'duration': '30 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Acupuncture'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1630595632518-8217c0bceb8f?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Acupuncture Session (45 min)', 'description': 'Standard acupuncture treatment', 'price': 149900, 'duration': '45 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Acupuncture'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1630595632518-8217c0bceb8f?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Acupuncture Session (60 min)', 'description': 'Comprehensive needle therapy', 'price': 189900, 'duration': '60 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Acupuncture'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1630595632518-8217c0bceb8f?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Pain Relief Acupuncture', 'description': 'Chronic pain management', 'price': 169900, 'duration': '50 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Acupuncture'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1630595632518-8217c0bceb8f?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Cosmetic Acupuncture', 'description': 'Facial rejuvenation needles', 'price': 199900, 'duration': '60 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Acupuncture'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1630595632518-8217c0bceb8f?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Sports Acupuncture', 'description': 'Athletic performance enhancement', 'price': 179900, 'duration': '55 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Acupuncture'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1630595632518-8217c0bceb8f?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Fertility Acupuncture', 'description': 'Reproductive health support', 'price': 219900, 'duration': '65 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Acupuncture'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1630595632518-8217c0bceb8f?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Stress Relief Acupuncture', 'description': 'Mental health acupuncture', 'price': 159900, 'duration': '45 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Acupuncture'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1630595632518-8217c0bceb8f?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Weight Management Acupuncture', 'description': 'Metabolic support therapy', 'price': 189900, 'duration': '55 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Acupuncture'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1630595632518-8217c0bceb8f?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Acupuncture Massage Combo', 'description': 'Needles with massage therapy', 'price': 249900, 'duration': '80 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Acupuncture'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1630595632518-8217c0bceb8f?w=400'},
+        {'id': new_id(), 'name': 'Acupuncture Session (30 min)', 'description': 'Basic needle therapy', 'price': 109900, 'duration': '30 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Acupuncture'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1630595632518-8217c0bceb8f?w=400'},
+        {'id': new_id(), 'name': 'Acupuncture Session (45 min)', 'description': 'Standard acupuncture treatment', 'price': 149900, 'duration': '45 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Acupuncture'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1630595632518-8217c0bceb8f?w=400'},
+        {'id': new_id(), 'name': 'Acupuncture Session (60 min)', 'description': 'Comprehensive needle therapy', 'price': 189900, 'duration': '60 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Acupuncture'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1630595632518-8217c0bceb8f?w=400'},
+        {'id': new_id(), 'name': 'Pain Relief Acupuncture', 'description': 'Chronic pain management', 'price': 169900, 'duration': '50 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Acupuncture'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1630595632518-8217c0bceb8f?w=400'},
+        {'id': new_id(), 'name': 'Cosmetic Acupuncture', 'description': 'Facial rejuvenation needles', 'price': 199900, 'duration': '60 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Acupuncture'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1630595632518-8217c0bceb8f?w=400'},
+        {'id': new_id(), 'name': 'Sports Acupuncture', 'description': 'Athletic performance enhancement', 'price': 179900, 'duration': '55 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Acupuncture'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1630595632518-8217c0bceb8f?w=400'},
+        {'id': new_id(), 'name': 'Fertility Acupuncture', 'description': 'Reproductive health support', 'price': 219900, 'duration': '65 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Acupuncture'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1630595632518-8217c0bceb8f?w=400'},
+        {'id': new_id(), 'name': 'Stress Relief Acupuncture', 'description': 'Mental health acupuncture', 'price': 159900, 'duration': '45 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Acupuncture'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1630595632518-8217c0bceb8f?w=400'},
+        {'id': new_id(), 'name': 'Weight Management Acupuncture', 'description': 'Metabolic support therapy', 'price': 189900, 'duration': '55 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Acupuncture'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1630595632518-8217c0bceb8f?w=400'},
+        {'id': new_id(), 'name': 'Acupuncture Massage Combo', 'description': 'Needles with massage therapy', 'price': 249900, 'duration': '80 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Acupuncture'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1630595632518-8217c0bceb8f?w=400'},
         
         # Sports Therapy
-        {'id': str(uuid.uuid4()), 'name': 'Sports Therapy Session (30 min)', 'description': 'Basic athletic therapy', 'price': 99900, 'duration': '30 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Sports Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1571019613454-1cb2f99b2d8b?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Sports Therapy Session (45 min)', 'description': 'Standard sports rehabilitation', 'price': 139900, 'duration': '45 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Sports Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1571019613454-1cb2f99b2d8b?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Sports Therapy Session (60 min)', 'description': 'Comprehensive athletic care', 'price': 179900, 'duration': '60 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Sports Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1571019613454-1cb2f99b2d8b?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Injury Rehabilitation', 'description': 'Sports injury recovery', 'price': 199900, 'duration': '60 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Sports Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1571019613454-1cb2f99b2d8b?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Performance Enhancement', 'description': 'Athletic performance optimization', 'price': 189900, 'duration': '55 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Sports Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1571019613454-1cb2f99b2d8b?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Pre-Event Preparation', 'description': 'Competition preparation therapy', 'price': 149900, 'duration': '45 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Sports Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1571019613454-1cb2f99b2d8b?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Post-Event Recovery', 'description': 'Competition recovery therapy', 'price': 169900, 'duration': '50 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Sports Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1571019613454-1cb2f99b2d8b?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Sports Massage Therapy', 'description': 'Deep tissue for athletes', 'price': 159900, 'duration': '50 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Sports Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1571019613454-1cb2f99b2d8b?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Flexibility Training', 'description': 'Range of motion improvement', 'price': 129900, 'duration': '40 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Sports Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1571019613454-1cb2f99b2d8b?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Strength Conditioning', 'description': 'Muscular strength therapy', 'price': 179900, 'duration': '55 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Sports Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1571019613454-1cb2f99b2d8b?w=400'},
+        {'id': new_id(), 'name': 'Sports Therapy Session (30 min)', 'description': 'Basic athletic therapy', 'price': 99900, 'duration': '30 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Sports Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1571019613454-1cb2f99b2d8b?w=400'},
+        {'id': new_id(), 'name': 'Sports Therapy Session (45 min)', 'description': 'Standard sports rehabilitation', 'price': 139900, 'duration': '45 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Sports Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1571019613454-1cb2f99b2d8b?w=400'},
+        {'id': new_id(), 'name': 'Sports Therapy Session (60 min)', 'description': 'Comprehensive athletic care', 'price': 179900, 'duration': '60 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Sports Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1571019613454-1cb2f99b2d8b?w=400'},
+        {'id': new_id(), 'name': 'Injury Rehabilitation', 'description': 'Sports injury recovery', 'price': 199900, 'duration': '60 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Sports Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1571019613454-1cb2f99b2d8b?w=400'},
+        {'id': new_id(), 'name': 'Performance Enhancement', 'description': 'Athletic performance optimization', 'price': 189900, 'duration': '55 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Sports Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1571019613454-1cb2f99b2d8b?w=400'},
+        {'id': new_id(), 'name': 'Pre-Event Preparation', 'description': 'Competition preparation therapy', 'price': 149900, 'duration': '45 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Sports Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1571019613454-1cb2f99b2d8b?w=400'},
+        {'id': new_id(), 'name': 'Post-Event Recovery', 'description': 'Competition recovery therapy', 'price': 169900, 'duration': '50 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Sports Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1571019613454-1cb2f99b2d8b?w=400'},
+        {'id': new_id(), 'name': 'Sports Massage Therapy', 'description': 'Deep tissue for athletes', 'price': 159900, 'duration': '50 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Sports Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1571019613454-1cb2f99b2d8b?w=400'},
+        {'id': new_id(), 'name': 'Flexibility Training', 'description': 'Range of motion improvement', 'price': 129900, 'duration': '40 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Sports Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1571019613454-1cb2f99b2d8b?w=400'},
+        {'id': new_id(), 'name': 'Strength Conditioning', 'description': 'Muscular strength therapy', 'price': 179900, 'duration': '55 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Sports Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1571019613454-1cb2f99b2d8b?w=400'},
         
         # Pain Relief Therapy
-        {'id': str(uuid.uuid4()), 'name': 'Pain Relief Session (30 min)', 'description': 'Basic pain management', 'price': 89900, 'duration': '30 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Pain Relief Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Pain Relief Session (45 min)', 'description': 'Standard pain therapy', 'price': 129900, 'duration': '45 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Pain Relief Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Pain Relief Session (60 min)', 'description': 'Comprehensive pain management', 'price': 169900, 'duration': '60 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Pain Relief Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Chronic Pain Management', 'description': 'Long-term pain relief', 'price': 189900, 'duration': '60 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Pain Relief Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Back Pain Therapy', 'description': 'Spinal pain relief', 'price': 149900, 'duration': '50 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Pain Relief Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Joint Pain Relief', 'description': 'Arthritis and joint therapy', 'price': 159900, 'duration': '55 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Pain Relief Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Headache Relief Therapy', 'description': 'Migraine and headache treatment', 'price': 119900, 'duration': '40 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Pain Relief Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Neck Pain Therapy', 'description': 'Cervical pain management', 'price': 139900, 'duration': '45 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Pain Relief Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Sciatica Relief', 'description': 'Nerve pain therapy', 'price': 179900, 'duration': '60 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Pain Relief Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Fibromyalgia Therapy', 'description': 'Chronic fatigue syndrome relief', 'price': 199900, 'duration': '65 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Pain Relief Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
+        {'id': new_id(), 'name': 'Pain Relief Session (30 min)', 'description': 'Basic pain management', 'price': 89900, 'duration': '30 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Pain Relief Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
+        {'id': new_id(), 'name': 'Pain Relief Session (45 min)', 'description': 'Standard pain therapy', 'price': 129900, 'duration': '45 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Pain Relief Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
+        {'id': new_id(), 'name': 'Pain Relief Session (60 min)', 'description': 'Comprehensive pain management', 'price': 169900, 'duration': '60 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Pain Relief Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
+        {'id': new_id(), 'name': 'Chronic Pain Management', 'description': 'Long-term pain relief', 'price': 189900, 'duration': '60 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Pain Relief Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
+        {'id': new_id(), 'name': 'Back Pain Therapy', 'description': 'Spinal pain relief', 'price': 149900, 'duration': '50 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Pain Relief Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
+        {'id': new_id(), 'name': 'Joint Pain Relief', 'description': 'Arthritis and joint therapy', 'price': 159900, 'duration': '55 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Pain Relief Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
+        {'id': new_id(), 'name': 'Headache Relief Therapy', 'description': 'Migraine and headache treatment', 'price': 119900, 'duration': '40 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Pain Relief Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
+        {'id': new_id(), 'name': 'Neck Pain Therapy', 'description': 'Cervical pain management', 'price': 139900, 'duration': '45 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Pain Relief Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
+        {'id': new_id(), 'name': 'Sciatica Relief', 'description': 'Nerve pain therapy', 'price': 179900, 'duration': '60 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Pain Relief Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
+        {'id': new_id(), 'name': 'Fibromyalgia Therapy', 'description': 'Chronic fatigue syndrome relief', 'price': 199900, 'duration': '65 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Pain Relief Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
         
         # Recovery Therapy
-        {'id': str(uuid.uuid4()), 'name': 'Recovery Session (30 min)', 'description': 'Basic post-treatment recovery', 'price': 79900, 'duration': '30 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Recovery Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1630595632518-8217c0bceb8f?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Recovery Session (45 min)', 'description': 'Standard recovery therapy', 'price': 119900, 'duration': '45 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Recovery Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1630595632518-8217c0bceb8f?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Recovery Session (60 min)', 'description': 'Comprehensive recovery care', 'price': 159900, 'duration': '60 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Recovery Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1630595632518-8217c0bceb8f?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Post-Surgery Recovery', 'description': 'Surgical wound healing', 'price': 189900, 'duration': '60 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Recovery Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1630595632518-8217c0bceb8f?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Injury Recovery', 'description': 'Trauma and injury healing', 'price': 169900, 'duration': '55 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Recovery Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1630595632518-8217c0bceb8f?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Sports Recovery', 'description': 'Athletic recovery therapy', 'price': 149900, 'duration': '50 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Recovery Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1630595632518-8217c0bceb8f?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Rehabilitation Therapy', 'description': 'Progressive recovery program', 'price': 179900, 'duration': '60 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Recovery Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1630595632518-8217c0bceb8f?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Lymphatic Drainage', 'description': 'Swelling reduction therapy', 'price': 139900, 'duration': '45 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Recovery Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1630595632518-8217c0bceb8f?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Scar Tissue Therapy', 'description': 'Scar management and reduction', 'price': 159900, 'duration': '50 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Recovery Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1630595632518-8217c0bceb8f?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Tissue Regeneration', 'description': 'Cellular repair therapy', 'price': 199900, 'duration': '65 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Recovery Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1630595632518-8217c0bceb8f?w=400'},
+        {'id': new_id(), 'name': 'Recovery Session (30 min)', 'description': 'Basic post-treatment recovery', 'price': 79900, 'duration': '30 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Recovery Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1630595632518-8217c0bceb8f?w=400'},
+        {'id': new_id(), 'name': 'Recovery Session (45 min)', 'description': 'Standard recovery therapy', 'price': 119900, 'duration': '45 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Recovery Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1630595632518-8217c0bceb8f?w=400'},
+        {'id': new_id(), 'name': 'Recovery Session (60 min)', 'description': 'Comprehensive recovery care', 'price': 159900, 'duration': '60 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Recovery Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1630595632518-8217c0bceb8f?w=400'},
+        {'id': new_id(), 'name': 'Post-Surgery Recovery', 'description': 'Surgical wound healing', 'price': 189900, 'duration': '60 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Recovery Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1630595632518-8217c0bceb8f?w=400'},
+        {'id': new_id(), 'name': 'Injury Recovery', 'description': 'Trauma and injury healing', 'price': 169900, 'duration': '55 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Recovery Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1630595632518-8217c0bceb8f?w=400'},
+        {'id': new_id(), 'name': 'Sports Recovery', 'description': 'Athletic recovery therapy', 'price': 149900, 'duration': '50 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Recovery Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1630595632518-8217c0bceb8f?w=400'},
+        {'id': new_id(), 'name': 'Rehabilitation Therapy', 'description': 'Progressive recovery program', 'price': 179900, 'duration': '60 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Recovery Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1630595632518-8217c0bceb8f?w=400'},
+        {'id': new_id(), 'name': 'Lymphatic Drainage', 'description': 'Swelling reduction therapy', 'price': 139900, 'duration': '45 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Recovery Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1630595632518-8217c0bceb8f?w=400'},
+        {'id': new_id(), 'name': 'Scar Tissue Therapy', 'description': 'Scar management and reduction', 'price': 159900, 'duration': '50 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Recovery Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1630595632518-8217c0bceb8f?w=400'},
+        {'id': new_id(), 'name': 'Tissue Regeneration', 'description': 'Cellular repair therapy', 'price': 199900, 'duration': '65 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Recovery Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1630595632518-8217c0bceb8f?w=400'},
         
         # Senior Therapy
-        {'id': str(uuid.uuid4()), 'name': 'Senior Therapy Session (30 min)', 'description': 'Gentle geriatric care', 'price': 89900, 'duration': '30 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Senior Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1630595632518-8217c0bceb8f?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Senior Therapy Session (45 min)', 'description': 'Standard senior therapy', 'price': 129900, 'duration': '45 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Senior Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1630595632518-8217c0bceb8f?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Senior Therapy Session (60 min)', 'description': 'Comprehensive geriatric care', 'price': 169900, 'duration': '60 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Senior Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1630595632518-8217c0bceb8f?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Mobility Enhancement', 'description': 'Movement and balance improvement', 'price': 149900, 'duration': '50 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Senior Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1630595632518-8217c0bceb8f?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Arthritis Management', 'description': 'Joint health therapy', 'price': 159900, 'duration': '55 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Senior Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1630595632518-8217c0bceb8f?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Fall Prevention Therapy', 'description': 'Balance and stability training', 'price': 139900, 'duration': '45 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Senior Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1630595632518-8217c0bceb8f?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Osteoporosis Care', 'description': 'Bone health therapy', 'price': 169900, 'duration': '55 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Senior Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1630595632518-8217c0bceb8f?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Cognitive Therapy', 'description': 'Mental health support', 'price': 129900, 'duration': '40 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Senior Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1630595632518-8217c0bceb8f?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Cardiac Rehabilitation', 'description': 'Heart health therapy', 'price': 189900, 'duration': '60 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Senior Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1630595632518-8217c0bceb8f?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Senior Wellness Program', 'description': 'Comprehensive geriatric care', 'price': 199900, 'duration': '65 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Senior Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1630595632518-8217c0bceb8f?w=400'},
+        {'id': new_id(), 'name': 'Senior Therapy Session (30 min)', 'description': 'Gentle geriatric care', 'price': 89900, 'duration': '30 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Senior Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1630595632518-8217c0bceb8f?w=400'},
+        {'id': new_id(), 'name': 'Senior Therapy Session (45 min)', 'description': 'Standard senior therapy', 'price': 129900, 'duration': '45 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Senior Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1630595632518-8217c0bceb8f?w=400'},
+        {'id': new_id(), 'name': 'Senior Therapy Session (60 min)', 'description': 'Comprehensive geriatric care', 'price': 169900, 'duration': '60 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Senior Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1630595632518-8217c0bceb8f?w=400'},
+        {'id': new_id(), 'name': 'Mobility Enhancement', 'description': 'Movement and balance improvement', 'price': 149900, 'duration': '50 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Senior Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1630595632518-8217c0bceb8f?w=400'},
+        {'id': new_id(), 'name': 'Arthritis Management', 'description': 'Joint health therapy', 'price': 159900, 'duration': '55 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Senior Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1630595632518-8217c0bceb8f?w=400'},
+        {'id': new_id(), 'name': 'Fall Prevention Therapy', 'description': 'Balance and stability training', 'price': 139900, 'duration': '45 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Senior Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1630595632518-8217c0bceb8f?w=400'},
+        {'id': new_id(), 'name': 'Osteoporosis Care', 'description': 'Bone health therapy', 'price': 169900, 'duration': '55 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Senior Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1630595632518-8217c0bceb8f?w=400'},
+        {'id': new_id(), 'name': 'Cognitive Therapy', 'description': 'Mental health support', 'price': 129900, 'duration': '40 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Senior Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1630595632518-8217c0bceb8f?w=400'},
+        {'id': new_id(), 'name': 'Cardiac Rehabilitation', 'description': 'Heart health therapy', 'price': 189900, 'duration': '60 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Senior Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1630595632518-8217c0bceb8f?w=400'},
+        {'id': new_id(), 'name': 'Senior Wellness Program', 'description': 'Comprehensive geriatric care', 'price': 199900, 'duration': '65 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Senior Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1630595632518-8217c0bceb8f?w=400'},
         
         # Ayurvedic Therapy
-        {'id': str(uuid.uuid4()), 'name': 'Ayurvedic Consultation (30 min)', 'description': 'Traditional medicine assessment', 'price': 79900, 'duration': '30 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Ayurvedic Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Ayurvedic Therapy (45 min)', 'description': 'Herbal and oil treatments', 'price': 119900, 'duration': '45 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Ayurvedic Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Ayurvedic Therapy (60 min)', 'description': 'Complete Ayurvedic treatment', 'price': 159900, 'duration': '60 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Ayurvedic Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Abhyanga Massage', 'description': 'Traditional oil massage', 'price': 139900, 'duration': '50 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Ayurvedic Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Panchakarma Therapy', 'description': 'Detoxification treatment', 'price': 249900, 'duration': '90 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Ayurvedic Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Shirodhara Treatment', 'description': 'Oil pouring therapy', 'price': 189900, 'duration': '60 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Ayurvedic Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Kizhi Therapy', 'description': 'Herbal poultice treatment', 'price': 199900, 'duration': '65 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Ayurvedic Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Udvartana Therapy', 'description': 'Herbal powder massage', 'price': 169900, 'duration': '55 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Ayurvedic Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Nasya Therapy', 'description': 'Nasal administration treatment', 'price': 129900, 'duration': '40 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Ayurvedic Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Ayurvedic Wellness Program', 'description': 'Comprehensive traditional care', 'price': 299900, 'duration': '120 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Ayurvedic Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
+        {'id': new_id(), 'name': 'Ayurvedic Consultation (30 min)', 'description': 'Traditional medicine assessment', 'price': 79900, 'duration': '30 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Ayurvedic Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
+        {'id': new_id(), 'name': 'Ayurvedic Therapy (45 min)', 'description': 'Herbal and oil treatments', 'price': 119900, 'duration': '45 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Ayurvedic Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
+        {'id': new_id(), 'name': 'Ayurvedic Therapy (60 min)', 'description': 'Complete Ayurvedic treatment', 'price': 159900, 'duration': '60 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Ayurvedic Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
+        {'id': new_id(), 'name': 'Abhyanga Massage', 'description': 'Traditional oil massage', 'price': 139900, 'duration': '50 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Ayurvedic Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
+        {'id': new_id(), 'name': 'Panchakarma Therapy', 'description': 'Detoxification treatment', 'price': 249900, 'duration': '90 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Ayurvedic Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
+        {'id': new_id(), 'name': 'Shirodhara Treatment', 'description': 'Oil pouring therapy', 'price': 189900, 'duration': '60 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Ayurvedic Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
+        {'id': new_id(), 'name': 'Kizhi Therapy', 'description': 'Herbal poultice treatment', 'price': 199900, 'duration': '65 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Ayurvedic Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
+        {'id': new_id(), 'name': 'Udvartana Therapy', 'description': 'Herbal powder massage', 'price': 169900, 'duration': '55 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Ayurvedic Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
+        {'id': new_id(), 'name': 'Nasya Therapy', 'description': 'Nasal administration treatment', 'price': 129900, 'duration': '40 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Ayurvedic Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
+        {'id': new_id(), 'name': 'Ayurvedic Wellness Program', 'description': 'Comprehensive traditional care', 'price': 299900, 'duration': '120 min', 'category_id': therapy_cat, 'sub_category_id': sub_cat_map['Ayurvedic Therapy'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
         
         # ===== BRIDAL MAKEUP PRODUCTS =====
         # Pre-Bridal Makeup
-        {'id': str(uuid.uuid4()), 'name': 'Pre-Bridal Consultation', 'description': 'Skin analysis and planning', 'price': 29900, 'duration': '30 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Pre-Bridal Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Pre-Bridal Skin Treatment', 'description': 'Complete bridal skin prep', 'price': 79900, 'duration': '60 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Pre-Bridal Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Pre-Bridal Facial Package', 'description': 'Advanced facial treatments', 'price': 59900, 'duration': '45 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Pre-Bridal Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Pre-Bridal Hair Treatment', 'description': 'Hair conditioning and styling prep', 'price': 49900, 'duration': '45 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Pre-Bridal Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Bridal Glow Package', 'description': 'Complete pre-bridal radiance treatment', 'price': 99900, 'duration': '90 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Pre-Bridal Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Pre-Bridal Makeup Trial', 'description': 'Test makeup session', 'price': 39900, 'duration': '60 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Pre-Bridal Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Bridal Diet Consultation', 'description': 'Nutrition planning for glow', 'price': 19900, 'duration': '30 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Pre-Bridal Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Pre-Bridal Massage', 'description': 'Relaxation before big day', 'price': 69900, 'duration': '60 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Pre-Bridal Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Bridal Wellness Package', 'description': 'Complete pre-wedding preparation', 'price': 149900, 'duration': '120 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Pre-Bridal Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Emergency Bridal Prep', 'description': 'Last-minute bridal preparation', 'price': 89900, 'duration': '75 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Pre-Bridal Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Pre-Bridal Consultation', 'description': 'Skin analysis and planning', 'price': 29900, 'duration': '30 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Pre-Bridal Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Pre-Bridal Skin Treatment', 'description': 'Complete bridal skin prep', 'price': 79900, 'duration': '60 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Pre-Bridal Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Pre-Bridal Facial Package', 'description': 'Advanced facial treatments', 'price': 59900, 'duration': '45 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Pre-Bridal Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Pre-Bridal Hair Treatment', 'description': 'Hair conditioning and styling prep', 'price': 49900, 'duration': '45 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Pre-Bridal Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Bridal Glow Package', 'description': 'Complete pre-bridal radiance treatment', 'price': 99900, 'duration': '90 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Pre-Bridal Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Pre-Bridal Makeup Trial', 'description': 'Test makeup session', 'price': 39900, 'duration': '60 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Pre-Bridal Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Bridal Diet Consultation', 'description': 'Nutrition planning for glow', 'price': 19900, 'duration': '30 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Pre-Bridal Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Pre-Bridal Massage', 'description': 'Relaxation before big day', 'price': 69900, 'duration': '60 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Pre-Bridal Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Bridal Wellness Package', 'description': 'Complete pre-wedding preparation', 'price': 149900, 'duration': '120 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Pre-Bridal Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Emergency Bridal Prep', 'description': 'Last-minute bridal preparation', 'price': 89900, 'duration': '75 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Pre-Bridal Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
         
         # Bridal Hair Styling
-        {'id': str(uuid.uuid4()), 'name': 'Basic Bridal Hair Styling', 'description': 'Simple updo or curls', 'price': 29900, 'duration': '45 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Bridal Hair Styling'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Elegant Bridal Updo', 'description': 'Sophisticated hair styling', 'price': 49900, 'duration': '60 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Bridal Hair Styling'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Traditional Bridal Hair', 'description': 'Cultural hairstyle styling', 'price': 39900, 'duration': '50 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Bridal Hair Styling'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Bridal Hair with Accessories', 'description': 'Hair styling with jewelry', 'price': 59900, 'duration': '70 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Bridal Hair Styling'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Long Hair Bridal Styling', 'description': 'Specialized long hair styling', 'price': 69900, 'duration': '75 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Bridal Hair Styling'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Short Hair Bridal Styling', 'description': 'Creative short hair styling', 'price': 44900, 'duration': '55 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Bridal Hair Styling'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Bridal Hair Extension Styling', 'description': 'Hair extensions and styling', 'price': 89900, 'duration': '90 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Bridal Hair Styling'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Bridal Hair Coloring', 'description': 'Hair color for special day', 'price': 79900, 'duration': '120 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Bridal Hair Styling'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Bridal Hair Trial', 'description': 'Test hairstyle session', 'price': 24900, 'duration': '45 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Bridal Hair Styling'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Luxury Bridal Hair Package', 'description': 'Premium hair styling experience', 'price': 99900, 'duration': '90 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Bridal Hair Styling'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Basic Bridal Hair Styling', 'description': 'Simple updo or curls', 'price': 29900, 'duration': '45 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Bridal Hair Styling'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Elegant Bridal Updo', 'description': 'Sophisticated hair styling', 'price': 49900, 'duration': '60 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Bridal Hair Styling'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Traditional Bridal Hair', 'description': 'Cultural hairstyle styling', 'price': 39900, 'duration': '50 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Bridal Hair Styling'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Bridal Hair with Accessories', 'description': 'Hair styling with jewelry', 'price': 59900, 'duration': '70 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Bridal Hair Styling'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Long Hair Bridal Styling', 'description': 'Specialized long hair styling', 'price': 69900, 'duration': '75 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Bridal Hair Styling'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Short Hair Bridal Styling', 'description': 'Creative short hair styling', 'price': 44900, 'duration': '55 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Bridal Hair Styling'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Bridal Hair Extension Styling', 'description': 'Hair extensions and styling', 'price': 89900, 'duration': '90 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Bridal Hair Styling'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Bridal Hair Coloring', 'description': 'Hair color for special day', 'price': 79900, 'duration': '120 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Bridal Hair Styling'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Bridal Hair Trial', 'description': 'Test hairstyle session', 'price': 24900, 'duration': '45 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Bridal Hair Styling'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Luxury Bridal Hair Package', 'description': 'Premium hair styling experience', 'price': 99900, 'duration': '90 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Bridal Hair Styling'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
         
         # Bridal Skin Care
-        {'id': str(uuid.uuid4()), 'name': 'Bridal Facial Basic', 'description': 'Essential bridal facial', 'price': 39900, 'duration': '45 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Bridal Skin Care'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Bridal Facial Deluxe', 'description': 'Advanced bridal facial', 'price': 69900, 'duration': '75 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Bridal Skin Care'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Bridal Skin Brightening', 'description': 'Glow enhancement treatment', 'price': 59900, 'duration': '60 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Bridal Skin Care'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Bridal Anti-Acne Treatment', 'description': 'Clear skin for wedding', 'price': 49900, 'duration': '50 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Bridal Skin Care'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Bridal Hydration Therapy', 'description': 'Deep moisturizing treatment', 'price': 54900, 'duration': '55 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Bridal Skin Care'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Bridal Pore Minimization', 'description': 'Skin texture refinement', 'price': 64900, 'duration': '65 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Bridal Skin Care'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Bridal Eye Treatment', 'description': 'Dark circle and puffiness reduction', 'price': 34900, 'duration': '30 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Bridal Skin Care'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Bridal Body Scrub', 'description': 'Full body exfoliation', 'price': 44900, 'duration': '40 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Bridal Skin Care'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Bridal Skin Detox', 'description': 'Deep cleansing treatment', 'price': 79900, 'duration': '80 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Bridal Skin Care'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Bridal Skin Package', 'description': 'Complete bridal skin preparation', 'price': 119900, 'duration': '120 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Bridal Skin Care'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Bridal Facial Basic', 'description': 'Essential bridal facial', 'price': 39900, 'duration': '45 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Bridal Skin Care'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Bridal Facial Deluxe', 'description': 'Advanced bridal facial', 'price': 69900, 'duration': '75 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Bridal Skin Care'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Bridal Skin Brightening', 'description': 'Glow enhancement treatment', 'price': 59900, 'duration': '60 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Bridal Skin Care'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Bridal Anti-Acne Treatment', 'description': 'Clear skin for wedding', 'price': 49900, 'duration': '50 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Bridal Skin Care'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Bridal Hydration Therapy', 'description': 'Deep moisturizing treatment', 'price': 54900, 'duration': '55 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Bridal Skin Care'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Bridal Pore Minimization', 'description': 'Skin texture refinement', 'price': 64900, 'duration': '65 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Bridal Skin Care'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Bridal Eye Treatment', 'description': 'Dark circle and puffiness reduction', 'price': 34900, 'duration': '30 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Bridal Skin Care'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Bridal Body Scrub', 'description': 'Full body exfoliation', 'price': 44900, 'duration': '40 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Bridal Skin Care'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Bridal Skin Detox', 'description': 'Deep cleansing treatment', 'price': 79900, 'duration': '80 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Bridal Skin Care'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Bridal Skin Package', 'description': 'Complete bridal skin preparation', 'price': 119900, 'duration': '120 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Bridal Skin Care'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
         
         # Full Bridal Package
-        {'id': str(uuid.uuid4()), 'name': 'Essential Bridal Package', 'description': 'Basic makeup, hair, and touch-up', 'price': 149900, 'duration': '180 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Full Bridal Package'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Premium Bridal Package', 'description': 'Advanced makeup, hair, and styling', 'price': 249900, 'duration': '240 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Full Bridal Package'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Luxury Bridal Package', 'description': 'Complete bridal transformation', 'price': 399900, 'duration': '300 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Full Bridal Package'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Traditional Bridal Package', 'description': 'Cultural bridal styling', 'price': 199900, 'duration': '210 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Full Bridal Package'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Modern Bridal Package', 'description': 'Contemporary bridal styling', 'price': 219900, 'duration': '220 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Full Bridal Package'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Destination Bridal Package', 'description': 'Travel-friendly bridal styling', 'price': 179900, 'duration': '200 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Full Bridal Package'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Intimate Bridal Package', 'description': 'Small wedding styling', 'price': 129900, 'duration': '160 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Full Bridal Package'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Grand Bridal Package', 'description': 'Extravagant bridal styling', 'price': 599900, 'duration': '360 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Full Bridal Package'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Bridal Package with Photography', 'description': 'Styling + pre-wedding photos', 'price': 299900, 'duration': '270 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Full Bridal Package'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'All-Inclusive Bridal Package', 'description': 'Everything for the big day', 'price': 499900, 'duration': '480 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Full Bridal Package'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Essential Bridal Package', 'description': 'Basic makeup, hair, and touch-up', 'price': 149900, 'duration': '180 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Full Bridal Package'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Premium Bridal Package', 'description': 'Advanced makeup, hair, and styling', 'price': 249900, 'duration': '240 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Full Bridal Package'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Luxury Bridal Package', 'description': 'Complete bridal transformation', 'price': 399900, 'duration': '300 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Full Bridal Package'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Traditional Bridal Package', 'description': 'Cultural bridal styling', 'price': 199900, 'duration': '210 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Full Bridal Package'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Modern Bridal Package', 'description': 'Contemporary bridal styling', 'price': 219900, 'duration': '220 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Full Bridal Package'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Destination Bridal Package', 'description': 'Travel-friendly bridal styling', 'price': 179900, 'duration': '200 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Full Bridal Package'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Intimate Bridal Package', 'description': 'Small wedding styling', 'price': 129900, 'duration': '160 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Full Bridal Package'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Grand Bridal Package', 'description': 'Extravagant bridal styling', 'price': 599900, 'duration': '360 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Full Bridal Package'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Bridal Package with Photography', 'description': 'Styling + pre-wedding photos', 'price': 299900, 'duration': '270 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Full Bridal Package'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'All-Inclusive Bridal Package', 'description': 'Everything for the big day', 'price': 499900, 'duration': '480 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Full Bridal Package'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
         
         # Engagement Makeup
-        {'id': str(uuid.uuid4()), 'name': 'Engagement Makeup Basic', 'description': 'Simple engagement makeup', 'price': 59900, 'duration': '60 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Engagement Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Engagement Makeup Elegant', 'description': 'Sophisticated engagement look', 'price': 89900, 'duration': '75 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Engagement Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Engagement Makeup Glam', 'description': 'Glamorous engagement styling', 'price': 119900, 'duration': '90 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Engagement Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Engagement Hair & Makeup', 'description': 'Complete engagement styling', 'price': 149900, 'duration': '120 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Engagement Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Engagement Makeup Trial', 'description': 'Test engagement makeup', 'price': 39900, 'duration': '60 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Engagement Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Engagement Makeup Touch-up', 'description': 'Quick engagement refresh', 'price': 29900, 'duration': '30 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Engagement Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Engagement Makeup Package', 'description': 'Makeup + hair for engagement', 'price': 179900, 'duration': '150 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Engagement Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Engagement Makeup with Henna', 'description': 'Makeup + traditional henna', 'price': 159900, 'duration': '135 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Engagement Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Engagement Makeup Express', 'description': 'Quick engagement styling', 'price': 79900, 'duration': '45 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Engagement Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Engagement Makeup Deluxe', 'description': 'Premium engagement experience', 'price': 199900, 'duration': '180 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Engagement Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Engagement Makeup Basic', 'description': 'Simple engagement makeup', 'price': 59900, 'duration': '60 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Engagement Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Engagement Makeup Elegant', 'description': 'Sophisticated engagement look', 'price': 89900, 'duration': '75 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Engagement Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Engagement Makeup Glam', 'description': 'Glamorous engagement styling', 'price': 119900, 'duration': '90 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Engagement Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Engagement Hair & Makeup', 'description': 'Complete engagement styling', 'price': 149900, 'duration': '120 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Engagement Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Engagement Makeup Trial', 'description': 'Test engagement makeup', 'price': 39900, 'duration': '60 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Engagement Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Engagement Makeup Touch-up', 'description': 'Quick engagement refresh', 'price': 29900, 'duration': '30 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Engagement Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Engagement Makeup Package', 'description': 'Makeup + hair for engagement', 'price': 179900, 'duration': '150 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Engagement Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Engagement Makeup with Henna', 'description': 'Makeup + traditional henna', 'price': 159900, 'duration': '135 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Engagement Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Engagement Makeup Express', 'description': 'Quick engagement styling', 'price': 79900, 'duration': '45 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Engagement Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Engagement Makeup Deluxe', 'description': 'Premium engagement experience', 'price': 199900, 'duration': '180 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Engagement Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
         
         # Reception Makeup
-        {'id': str(uuid.uuid4()), 'name': 'Reception Makeup Basic', 'description': 'Simple reception makeup', 'price': 69900, 'duration': '60 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Reception Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Reception Makeup Elegant', 'description': 'Sophisticated reception look', 'price': 99900, 'duration': '75 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Reception Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Reception Makeup Glam', 'description': 'Glamorous reception styling', 'price': 129900, 'duration': '90 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Reception Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Reception Hair & Makeup', 'description': 'Complete reception styling', 'price': 159900, 'duration': '120 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Reception Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Reception Makeup Trial', 'description': 'Test reception makeup', 'price': 44900, 'duration': '60 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Reception Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Reception Makeup Touch-up', 'description': 'Quick reception refresh', 'price': 34900, 'duration': '30 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Reception Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Reception Makeup Package', 'description': 'Makeup + hair for reception', 'price': 189900, 'duration': '150 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Reception Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Reception Makeup Evening', 'description': 'Evening reception styling', 'price': 139900, 'duration': '80 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Reception Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Reception Makeup Express', 'description': 'Quick reception styling', 'price': 89900, 'duration': '45 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Reception Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Reception Makeup Deluxe', 'description': 'Premium reception experience', 'price': 219900, 'duration': '180 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Reception Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Reception Makeup Basic', 'description': 'Simple reception makeup', 'price': 69900, 'duration': '60 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Reception Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Reception Makeup Elegant', 'description': 'Sophisticated reception look', 'price': 99900, 'duration': '75 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Reception Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Reception Makeup Glam', 'description': 'Glamorous reception styling', 'price': 129900, 'duration': '90 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Reception Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Reception Hair & Makeup', 'description': 'Complete reception styling', 'price': 159900, 'duration': '120 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Reception Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Reception Makeup Trial', 'description': 'Test reception makeup', 'price': 44900, 'duration': '60 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Reception Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Reception Makeup Touch-up', 'description': 'Quick reception refresh', 'price': 34900, 'duration': '30 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Reception Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Reception Makeup Package', 'description': 'Makeup + hair for reception', 'price': 189900, 'duration': '150 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Reception Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Reception Makeup Evening', 'description': 'Evening reception styling', 'price': 139900, 'duration': '80 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Reception Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Reception Makeup Express', 'description': 'Quick reception styling', 'price': 89900, 'duration': '45 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Reception Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Reception Makeup Deluxe', 'description': 'Premium reception experience', 'price': 219900, 'duration': '180 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Reception Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
         
         # Bridal Trials
-        {'id': str(uuid.uuid4()), 'name': 'Makeup Trial Basic', 'description': 'Basic makeup trial session', 'price': 39900, 'duration': '60 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Bridal Trials'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Hair Trial Basic', 'description': 'Basic hair styling trial', 'price': 29900, 'duration': '45 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Bridal Trials'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Full Trial Session', 'description': 'Complete makeup and hair trial', 'price': 69900, 'duration': '120 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Bridal Trials'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Trial Touch-up', 'description': 'Adjustments after trial', 'price': 19900, 'duration': '30 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Bridal Trials'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Multiple Trial Package', 'description': 'Multiple trial sessions', 'price': 99900, 'duration': '180 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Bridal Trials'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Express Trial', 'description': 'Quick trial session', 'price': 49900, 'duration': '45 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Bridal Trials'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Detailed Trial Consultation', 'description': 'In-depth trial with consultation', 'price': 59900, 'duration': '90 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Bridal Trials'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Trial Package Basic', 'description': 'Basic trial package', 'price': 79900, 'duration': '150 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Bridal Trials'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Trial Package Premium', 'description': 'Premium trial experience', 'price': 119900, 'duration': '180 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Bridal Trials'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Trial Follow-up', 'description': 'Post-trial adjustments', 'price': 24900, 'duration': '30 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Bridal Trials'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Makeup Trial Basic', 'description': 'Basic makeup trial session', 'price': 39900, 'duration': '60 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Bridal Trials'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Hair Trial Basic', 'description': 'Basic hair styling trial', 'price': 29900, 'duration': '45 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Bridal Trials'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Full Trial Session', 'description': 'Complete makeup and hair trial', 'price': 69900, 'duration': '120 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Bridal Trials'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Trial Touch-up', 'description': 'Adjustments after trial', 'price': 19900, 'duration': '30 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Bridal Trials'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Multiple Trial Package', 'description': 'Multiple trial sessions', 'price': 99900, 'duration': '180 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Bridal Trials'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Express Trial', 'description': 'Quick trial session', 'price': 49900, 'duration': '45 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Bridal Trials'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Detailed Trial Consultation', 'description': 'In-depth trial with consultation', 'price': 59900, 'duration': '90 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Bridal Trials'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Trial Package Basic', 'description': 'Basic trial package', 'price': 79900, 'duration': '150 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Bridal Trials'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Trial Package Premium', 'description': 'Premium trial experience', 'price': 119900, 'duration': '180 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Bridal Trials'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Trial Follow-up', 'description': 'Post-trial adjustments', 'price': 24900, 'duration': '30 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Bridal Trials'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
         
         # Photography Makeup
-        {'id': str(uuid.uuid4()), 'name': 'Photography Makeup Basic', 'description': 'Camera-ready makeup', 'price': 59900, 'duration': '60 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Photography Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Photography Makeup HD', 'description': 'High-definition photo makeup', 'price': 89900, 'duration': '75 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Photography Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Photography Hair & Makeup', 'description': 'Complete photo styling', 'price': 129900, 'duration': '120 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Photography Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Pre-Wedding Photography Makeup', 'description': 'Photo session makeup', 'price': 79900, 'duration': '70 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Photography Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Engagement Photography Makeup', 'description': 'Engagement photo styling', 'price': 69900, 'duration': '65 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Photography Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Traditional Photography Makeup', 'description': 'Cultural photo styling', 'price': 74900, 'duration': '70 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Photography Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Modern Photography Makeup', 'description': 'Contemporary photo styling', 'price': 84900, 'duration': '75 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Photography Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Photography Makeup Touch-up', 'description': 'Photo session touch-up', 'price': 29900, 'duration': '30 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Photography Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Photography Makeup Package', 'description': 'Multiple photo sessions', 'price': 159900, 'duration': '180 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Photography Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Luxury Photography Makeup', 'description': 'Premium photo styling', 'price': 119900, 'duration': '90 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Photography Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Photography Makeup Basic', 'description': 'Camera-ready makeup', 'price': 59900, 'duration': '60 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Photography Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Photography Makeup HD', 'description': 'High-definition photo makeup', 'price': 89900, 'duration': '75 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Photography Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Photography Hair & Makeup', 'description': 'Complete photo styling', 'price': 129900, 'duration': '120 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Photography Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Pre-Wedding Photography Makeup', 'description': 'Photo session makeup', 'price': 79900, 'duration': '70 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Photography Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Engagement Photography Makeup', 'description': 'Engagement photo styling', 'price': 69900, 'duration': '65 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Photography Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Traditional Photography Makeup', 'description': 'Cultural photo styling', 'price': 74900, 'duration': '70 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Photography Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Modern Photography Makeup', 'description': 'Contemporary photo styling', 'price': 84900, 'duration': '75 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Photography Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Photography Makeup Touch-up', 'description': 'Photo session touch-up', 'price': 29900, 'duration': '30 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Photography Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Photography Makeup Package', 'description': 'Multiple photo sessions', 'price': 159900, 'duration': '180 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Photography Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Luxury Photography Makeup', 'description': 'Premium photo styling', 'price': 119900, 'duration': '90 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Photography Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
         
         # Traditional Bridal Makeup
-        {'id': str(uuid.uuid4()), 'name': 'Traditional Bridal Makeup Basic', 'description': 'Simple traditional bridal look', 'price': 79900, 'duration': '90 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Traditional Bridal Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Traditional Bridal Makeup Deluxe', 'description': 'Elaborate traditional styling', 'price': 129900, 'duration': '120 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Traditional Bridal Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Traditional Bridal Hair & Makeup', 'description': 'Complete traditional bridal styling', 'price': 169900, 'duration': '150 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Traditional Bridal Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'South Indian Bridal Makeup', 'description': 'South Indian traditional styling', 'price': 119900, 'duration': '110 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Traditional Bridal Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'North Indian Bridal Makeup', 'description': 'North Indian traditional styling', 'price': 139900, 'duration': '130 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Traditional Bridal Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Bengali Bridal Makeup', 'description': 'Bengali traditional styling', 'price': 109900, 'duration': '100 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Traditional Bridal Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Gujarati Bridal Makeup', 'description': 'Gujarati traditional styling', 'price': 99900, 'duration': '95 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Traditional Bridal Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Maharashtrian Bridal Makeup', 'description': 'Maharashtrian traditional styling', 'price': 89900, 'duration': '90 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Traditional Bridal Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Traditional Bridal Package', 'description': 'Complete traditional bridal experience', 'price': 199900, 'duration': '180 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Traditional Bridal Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Traditional Bridal Trial', 'description': 'Test traditional bridal styling', 'price': 59900, 'duration': '90 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Traditional Bridal Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Traditional Bridal Makeup Basic', 'description': 'Simple traditional bridal look', 'price': 79900, 'duration': '90 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Traditional Bridal Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Traditional Bridal Makeup Deluxe', 'description': 'Elaborate traditional styling', 'price': 129900, 'duration': '120 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Traditional Bridal Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Traditional Bridal Hair & Makeup', 'description': 'Complete traditional bridal styling', 'price': 169900, 'duration': '150 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Traditional Bridal Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'South Indian Bridal Makeup', 'description': 'South Indian traditional styling', 'price': 119900, 'duration': '110 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Traditional Bridal Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'North Indian Bridal Makeup', 'description': 'North Indian traditional styling', 'price': 139900, 'duration': '130 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Traditional Bridal Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Bengali Bridal Makeup', 'description': 'Bengali traditional styling', 'price': 109900, 'duration': '100 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Traditional Bridal Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Gujarati Bridal Makeup', 'description': 'Gujarati traditional styling', 'price': 99900, 'duration': '95 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Traditional Bridal Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Maharashtrian Bridal Makeup', 'description': 'Maharashtrian traditional styling', 'price': 89900, 'duration': '90 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Traditional Bridal Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Traditional Bridal Package', 'description': 'Complete traditional bridal experience', 'price': 199900, 'duration': '180 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Traditional Bridal Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Traditional Bridal Trial', 'description': 'Test traditional bridal styling', 'price': 59900, 'duration': '90 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Traditional Bridal Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
         
         # Modern Bridal Makeup
-        {'id': str(uuid.uuid4()), 'name': 'Modern Bridal Makeup Basic', 'description': 'Simple modern bridal look', 'price': 89900, 'duration': '90 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Modern Bridal Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Modern Bridal Makeup Deluxe', 'description': 'Elaborate modern styling', 'price': 139900, 'duration': '120 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Modern Bridal Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Modern Bridal Hair & Makeup', 'description': 'Complete modern bridal styling', 'price': 179900, 'duration': '150 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Modern Bridal Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Minimalist Bridal Makeup', 'description': 'Clean, natural modern look', 'price': 109900, 'duration': '100 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Modern Bridal Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Bold Bridal Makeup', 'description': 'Dramatic modern styling', 'price': 149900, 'duration': '130 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Modern Bridal Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Contemporary Bridal Makeup', 'description': 'Trendy modern bridal look', 'price': 129900, 'duration': '115 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Modern Bridal Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Fusion Bridal Makeup', 'description': 'Traditional-modern blend', 'price': 159900, 'duration': '135 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Modern Bridal Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Modern Bridal Package', 'description': 'Complete modern bridal experience', 'price': 219900, 'duration': '180 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Modern Bridal Makeup'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Modern Bridal Trial', 'description': 'Test modern bridal styling', 'price': 69900, 'duration': '90 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Modern Bridal Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Luxury Modern Bridal Makeup', 'description': 'Premium modern bridal styling', 'price': 249900, 'duration': '160 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Modern Bridal Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Modern Bridal Makeup Basic', 'description': 'Simple modern bridal look', 'price': 89900, 'duration': '90 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Modern Bridal Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Modern Bridal Makeup Deluxe', 'description': 'Elaborate modern styling', 'price': 139900, 'duration': '120 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Modern Bridal Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Modern Bridal Hair & Makeup', 'description': 'Complete modern bridal styling', 'price': 179900, 'duration': '150 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Modern Bridal Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Minimalist Bridal Makeup', 'description': 'Clean, natural modern look', 'price': 109900, 'duration': '100 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Modern Bridal Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Bold Bridal Makeup', 'description': 'Dramatic modern styling', 'price': 149900, 'duration': '130 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Modern Bridal Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Contemporary Bridal Makeup', 'description': 'Trendy modern bridal look', 'price': 129900, 'duration': '115 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Modern Bridal Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Fusion Bridal Makeup', 'description': 'Traditional-modern blend', 'price': 159900, 'duration': '135 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Modern Bridal Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Modern Bridal Package', 'description': 'Complete modern bridal experience', 'price': 219900, 'duration': '180 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Modern Bridal Makeup'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Modern Bridal Trial', 'description': 'Test modern bridal styling', 'price': 69900, 'duration': '90 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Modern Bridal Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Luxury Modern Bridal Makeup', 'description': 'Premium modern bridal styling', 'price': 249900, 'duration': '160 min', 'category_id': bridal_cat, 'sub_category_id': sub_cat_map['Modern Bridal Makeup'], 'type': 'product', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
         
         # ===== PACKAGES =====
         # Relaxation Packages
-        {'id': str(uuid.uuid4()), 'name': 'Relaxation Starter Package', 'description': 'Swedish massage + aromatherapy', 'price': 199900, 'duration': '120 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Relaxation Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Deep Relaxation Package', 'description': 'Deep tissue + hot stone therapy', 'price': 299900, 'duration': '150 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Relaxation Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Ultimate Relaxation Package', 'description': 'Full body massage + aromatherapy + reflexology', 'price': 399900, 'duration': '180 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Relaxation Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Weekend Relaxation Package', 'description': 'Extended relaxation session', 'price': 249900, 'duration': '140 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Relaxation Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Stress-Free Relaxation Package', 'description': 'Anti-stress massage combination', 'price': 279900, 'duration': '160 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Relaxation Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Serenity Relaxation Package', 'description': 'Calming therapies combination', 'price': 319900, 'duration': '170 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Relaxation Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Tranquil Relaxation Package', 'description': 'Peaceful massage experience', 'price': 229900, 'duration': '130 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Relaxation Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Harmony Relaxation Package', 'description': 'Balanced therapy combination', 'price': 349900, 'duration': '175 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Relaxation Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Bliss Relaxation Package', 'description': 'Ultimate relaxation experience', 'price': 419900, 'duration': '190 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Relaxation Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Zen Relaxation Package', 'description': 'Mindful relaxation therapies', 'price': 289900, 'duration': '155 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Relaxation Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
+        {'id': new_id(), 'name': 'Relaxation Starter Package', 'description': 'Swedish massage + aromatherapy', 'price': 199900, 'duration': '120 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Relaxation Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
+        {'id': new_id(), 'name': 'Deep Relaxation Package', 'description': 'Deep tissue + hot stone therapy', 'price': 299900, 'duration': '150 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Relaxation Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
+        {'id': new_id(), 'name': 'Ultimate Relaxation Package', 'description': 'Full body massage + aromatherapy + reflexology', 'price': 399900, 'duration': '180 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Relaxation Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
+        {'id': new_id(), 'name': 'Weekend Relaxation Package', 'description': 'Extended relaxation session', 'price': 249900, 'duration': '140 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Relaxation Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
+        {'id': new_id(), 'name': 'Stress-Free Relaxation Package', 'description': 'Anti-stress massage combination', 'price': 279900, 'duration': '160 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Relaxation Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
+        {'id': new_id(), 'name': 'Serenity Relaxation Package', 'description': 'Calming therapies combination', 'price': 319900, 'duration': '170 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Relaxation Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
+        {'id': new_id(), 'name': 'Tranquil Relaxation Package', 'description': 'Peaceful massage experience', 'price': 229900, 'duration': '130 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Relaxation Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
+        {'id': new_id(), 'name': 'Harmony Relaxation Package', 'description': 'Balanced therapy combination', 'price': 349900, 'duration': '175 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Relaxation Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
+        {'id': new_id(), 'name': 'Bliss Relaxation Package', 'description': 'Ultimate relaxation experience', 'price': 419900, 'duration': '190 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Relaxation Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
+        {'id': new_id(), 'name': 'Zen Relaxation Package', 'description': 'Mindful relaxation therapies', 'price': 289900, 'duration': '155 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Relaxation Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
         
         # Couples Packages
-        {'id': str(uuid.uuid4()), 'name': 'Romantic Couples Package', 'description': 'Couple massage + aromatherapy', 'price': 399900, 'duration': '120 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Couples Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Intimate Couples Package', 'description': 'Private couple relaxation session', 'price': 499900, 'duration': '150 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Couples Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Luxury Couples Package', 'description': 'Premium couple experience', 'price': 699900, 'duration': '180 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Couples Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Weekend Couples Package', 'description': 'Extended couple relaxation', 'price': 599900, 'duration': '160 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Couples Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Anniversary Couples Package', 'description': 'Special celebration package', 'price': 649900, 'duration': '170 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Couples Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Spa Day Couples Package', 'description': 'Full day couple wellness', 'price': 899900, 'duration': '240 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Couples Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Therapeutic Couples Package', 'description': 'Healing couple session', 'price': 549900, 'duration': '140 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Couples Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Rejuvenation Couples Package', 'description': 'Couple revitalization therapy', 'price': 749900, 'duration': '200 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Couples Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Blissful Couples Package', 'description': 'Ultimate couple relaxation', 'price': 799900, 'duration': '210 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Couples Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Harmony Couples Package', 'description': 'Balanced couple wellness', 'price': 679900, 'duration': '180 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Couples Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
+        {'id': new_id(), 'name': 'Romantic Couples Package', 'description': 'Couple massage + aromatherapy', 'price': 399900, 'duration': '120 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Couples Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
+        {'id': new_id(), 'name': 'Intimate Couples Package', 'description': 'Private couple relaxation session', 'price': 499900, 'duration': '150 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Couples Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
+        {'id': new_id(), 'name': 'Luxury Couples Package', 'description': 'Premium couple experience', 'price': 699900, 'duration': '180 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Couples Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
+        {'id': new_id(), 'name': 'Weekend Couples Package', 'description': 'Extended couple relaxation', 'price': 599900, 'duration': '160 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Couples Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
+        {'id': new_id(), 'name': 'Anniversary Couples Package', 'description': 'Special celebration package', 'price': 649900, 'duration': '170 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Couples Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
+        {'id': new_id(), 'name': 'Spa Day Couples Package', 'description': 'Full day couple wellness', 'price': 899900, 'duration': '240 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Couples Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
+        {'id': new_id(), 'name': 'Therapeutic Couples Package', 'description': 'Healing couple session', 'price': 549900, 'duration': '140 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Couples Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
+        {'id': new_id(), 'name': 'Rejuvenation Couples Package', 'description': 'Couple revitalization therapy', 'price': 749900, 'duration': '200 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Couples Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
+        {'id': new_id(), 'name': 'Blissful Couples Package', 'description': 'Ultimate couple relaxation', 'price': 799900, 'duration': '210 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Couples Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
+        {'id': new_id(), 'name': 'Harmony Couples Package', 'description': 'Balanced couple wellness', 'price': 679900, 'duration': '180 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Couples Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1544161515-4ab6ce6db874?w=400'},
         
         # Bridal Packages
-        {'id': str(uuid.uuid4()), 'name': 'Complete Bridal Package', 'description': 'Full bridal preparation suite', 'price': 999900, 'duration': '480 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Bridal Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Luxury Bridal Package', 'description': 'Premium bridal experience', 'price': 1499900, 'duration': '600 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Bridal Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Traditional Bridal Package', 'description': 'Cultural bridal celebration', 'price': 799900, 'duration': '420 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Bridal Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Modern Bridal Package', 'description': 'Contemporary bridal styling', 'price': 899900, 'duration': '450 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Bridal Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Intimate Bridal Package', 'description': 'Small wedding styling', 'price': 599900, 'duration': '360 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Bridal Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Destination Bridal Package', 'description': 'Travel-friendly bridal package', 'price': 699900, 'duration': '390 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Bridal Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Grand Bridal Package', 'description': 'Extravagant bridal styling', 'price': 1999900, 'duration': '720 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Bridal Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Bridal Wellness Package', 'description': 'Health-focused bridal prep', 'price': 749900, 'duration': '400 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Bridal Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Bridal Glow Package', 'description': 'Radiant bridal preparation', 'price': 849900, 'duration': '430 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Bridal Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Bridal Transformation Package', 'description': 'Complete bridal metamorphosis', 'price': 1199900, 'duration': '540 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Bridal Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Complete Bridal Package', 'description': 'Full bridal preparation suite', 'price': 999900, 'duration': '480 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Bridal Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Luxury Bridal Package', 'description': 'Premium bridal experience', 'price': 1499900, 'duration': '600 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Bridal Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Traditional Bridal Package', 'description': 'Cultural bridal celebration', 'price': 799900, 'duration': '420 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Bridal Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Modern Bridal Package', 'description': 'Contemporary bridal styling', 'price': 899900, 'duration': '450 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Bridal Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Intimate Bridal Package', 'description': 'Small wedding styling', 'price': 599900, 'duration': '360 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Bridal Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Destination Bridal Package', 'description': 'Travel-friendly bridal package', 'price': 699900, 'duration': '390 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Bridal Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Grand Bridal Package', 'description': 'Extravagant bridal styling', 'price': 1999900, 'duration': '720 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Bridal Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Bridal Wellness Package', 'description': 'Health-focused bridal prep', 'price': 749900, 'duration': '400 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Bridal Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Bridal Glow Package', 'description': 'Radiant bridal preparation', 'price': 849900, 'duration': '430 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Bridal Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
+        {'id': new_id(), 'name': 'Bridal Transformation Package', 'description': 'Complete bridal metamorphosis', 'price': 1199900, 'duration': '540 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Bridal Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1596178060810-fb4bd482ee2c?w=400'},
         
         # Wellness Packages
-        {'id': str(uuid.uuid4()), 'name': 'Complete Wellness Package', 'description': 'Full body wellness assessment', 'price': 499900, 'duration': '180 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Wellness Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Holistic Wellness Package', 'description': 'Mind, body, spirit wellness', 'price': 699900, 'duration': '240 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Wellness Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Monthly Wellness Package', 'description': 'Ongoing wellness program', 'price': 1999900, 'duration': '30 days', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Wellness Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Detox Wellness Package', 'description': 'Body detoxification program', 'price': 599900, 'duration': '200 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Wellness Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Anti-Aging Wellness Package', 'description': 'Youth restoration therapies', 'price': 799900, 'duration': '270 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Wellness Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Weight Management Package', 'description': 'Health-focused weight program', 'price': 649900, 'duration': '220 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Wellness Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Stress Management Package', 'description': 'Mental health wellness', 'price': 549900, 'duration': '190 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Wellness Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Senior Wellness Package', 'description': 'Geriatric health program', 'price': 449900, 'duration': '160 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Wellness Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Sports Wellness Package', 'description': 'Athletic performance wellness', 'price': 729900, 'duration': '250 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Wellness Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Executive Wellness Package', 'description': 'Business professional wellness', 'price': 899900, 'duration': '300 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Wellness Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
+        {'id': new_id(), 'name': 'Complete Wellness Package', 'description': 'Full body wellness assessment', 'price': 499900, 'duration': '180 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Wellness Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
+        {'id': new_id(), 'name': 'Holistic Wellness Package', 'description': 'Mind, body, spirit wellness', 'price': 699900, 'duration': '240 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Wellness Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
+        {'id': new_id(), 'name': 'Monthly Wellness Package', 'description': 'Ongoing wellness program', 'price': 1999900, 'duration': '30 days', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Wellness Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
+        {'id': new_id(), 'name': 'Detox Wellness Package', 'description': 'Body detoxification program', 'price': 599900, 'duration': '200 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Wellness Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
+        {'id': new_id(), 'name': 'Anti-Aging Wellness Package', 'description': 'Youth restoration therapies', 'price': 799900, 'duration': '270 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Wellness Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
+        {'id': new_id(), 'name': 'Weight Management Package', 'description': 'Health-focused weight program', 'price': 649900, 'duration': '220 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Wellness Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
+        {'id': new_id(), 'name': 'Stress Management Package', 'description': 'Mental health wellness', 'price': 549900, 'duration': '190 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Wellness Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
+        {'id': new_id(), 'name': 'Senior Wellness Package', 'description': 'Geriatric health program', 'price': 449900, 'duration': '160 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Wellness Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
+        {'id': new_id(), 'name': 'Sports Wellness Package', 'description': 'Athletic performance wellness', 'price': 729900, 'duration': '250 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Wellness Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
+        {'id': new_id(), 'name': 'Executive Wellness Package', 'description': 'Business professional wellness', 'price': 899900, 'duration': '300 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Wellness Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
         
         # Monthly Packages
-        {'id': str(uuid.uuid4()), 'name': 'Monthly Relaxation Plan', 'description': 'Weekly relaxation sessions', 'price': 899900, 'duration': '30 days', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Monthly Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Monthly Therapy Plan', 'description': 'Ongoing therapy sessions', 'price': 1199900, 'duration': '30 days', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Monthly Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Monthly Wellness Plan', 'description': 'Complete monthly wellness', 'price': 1499900, 'duration': '30 days', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Monthly Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Monthly Bridal Plan', 'description': 'Pre-wedding preparation', 'price': 999900, 'duration': '30 days', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Monthly Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Monthly Detox Plan', 'description': 'Monthly cleansing program', 'price': 799900, 'duration': '30 days', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Monthly Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Monthly Sports Plan', 'description': 'Athletic maintenance program', 'price': 1099900, 'duration': '30 days', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Monthly Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Monthly Senior Plan', 'description': 'Senior wellness program', 'price': 699900, 'duration': '30 days', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Monthly Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Monthly Couples Plan', 'description': 'Couples wellness program', 'price': 1599900, 'duration': '30 days', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Monthly Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Monthly Premium Plan', 'description': 'Luxury monthly wellness', 'price': 1999900, 'duration': '30 days', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Monthly Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Monthly Basic Plan', 'description': 'Essential monthly care', 'price': 499900, 'duration': '30 days', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Monthly Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
+        {'id': new_id(), 'name': 'Monthly Relaxation Plan', 'description': 'Weekly relaxation sessions', 'price': 899900, 'duration': '30 days', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Monthly Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
+        {'id': new_id(), 'name': 'Monthly Therapy Plan', 'description': 'Ongoing therapy sessions', 'price': 1199900, 'duration': '30 days', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Monthly Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
+        {'id': new_id(), 'name': 'Monthly Wellness Plan', 'description': 'Complete monthly wellness', 'price': 1499900, 'duration': '30 days', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Monthly Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
+        {'id': new_id(), 'name': 'Monthly Bridal Plan', 'description': 'Pre-wedding preparation', 'price': 999900, 'duration': '30 days', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Monthly Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
+        {'id': new_id(), 'name': 'Monthly Detox Plan', 'description': 'Monthly cleansing program', 'price': 799900, 'duration': '30 days', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Monthly Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
+        {'id': new_id(), 'name': 'Monthly Sports Plan', 'description': 'Athletic maintenance program', 'price': 1099900, 'duration': '30 days', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Monthly Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
+        {'id': new_id(), 'name': 'Monthly Senior Plan', 'description': 'Senior wellness program', 'price': 699900, 'duration': '30 days', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Monthly Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
+        {'id': new_id(), 'name': 'Monthly Couples Plan', 'description': 'Couples wellness program', 'price': 1599900, 'duration': '30 days', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Monthly Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
+        {'id': new_id(), 'name': 'Monthly Premium Plan', 'description': 'Luxury monthly wellness', 'price': 1999900, 'duration': '30 days', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Monthly Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
+        {'id': new_id(), 'name': 'Monthly Basic Plan', 'description': 'Essential monthly care', 'price': 499900, 'duration': '30 days', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Monthly Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
         
         # Premium Packages
-        {'id': str(uuid.uuid4()), 'name': 'Royal Spa Experience', 'description': 'Luxury spa day at home', 'price': 1499900, 'duration': '360 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Premium Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Celebrity Wellness Package', 'description': 'Star treatment experience', 'price': 2499900, 'duration': '480 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Premium Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Executive Retreat Package', 'description': 'Business leader wellness', 'price': 1799900, 'duration': '420 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Premium Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'VIP Bridal Package', 'description': 'Ultimate bridal celebration', 'price': 3999900, 'duration': '600 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Premium Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Luxury Couples Retreat', 'description': 'Exclusive couple experience', 'price': 2999900, 'duration': '540 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Premium Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Diamond Wellness Package', 'description': 'Ultimate wellness experience', 'price': 4999900, 'duration': '720 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Premium Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Imperial Therapy Suite', 'description': 'Complete therapy collection', 'price': 3499900, 'duration': '480 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Premium Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Platinum Recovery Package', 'description': 'Advanced recovery therapies', 'price': 2799900, 'duration': '450 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Premium Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Elite Sports Package', 'description': 'Professional athlete care', 'price': 3199900, 'duration': '500 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Premium Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Presidential Wellness Suite', 'description': 'Ultimate luxury wellness', 'price': 5999900, 'duration': '800 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Premium Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
+        {'id': new_id(), 'name': 'Royal Spa Experience', 'description': 'Luxury spa day at home', 'price': 1499900, 'duration': '360 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Premium Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
+        {'id': new_id(), 'name': 'Celebrity Wellness Package', 'description': 'Star treatment experience', 'price': 2499900, 'duration': '480 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Premium Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
+        {'id': new_id(), 'name': 'Executive Retreat Package', 'description': 'Business leader wellness', 'price': 1799900, 'duration': '420 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Premium Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
+        {'id': new_id(), 'name': 'VIP Bridal Package', 'description': 'Ultimate bridal celebration', 'price': 3999900, 'duration': '600 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Premium Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
+        {'id': new_id(), 'name': 'Luxury Couples Retreat', 'description': 'Exclusive couple experience', 'price': 2999900, 'duration': '540 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Premium Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
+        {'id': new_id(), 'name': 'Diamond Wellness Package', 'description': 'Ultimate wellness experience', 'price': 4999900, 'duration': '720 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Premium Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
+        {'id': new_id(), 'name': 'Imperial Therapy Suite', 'description': 'Complete therapy collection', 'price': 3499900, 'duration': '480 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Premium Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
+        {'id': new_id(), 'name': 'Platinum Recovery Package', 'description': 'Advanced recovery therapies', 'price': 2799900, 'duration': '450 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Premium Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
+        {'id': new_id(), 'name': 'Elite Sports Package', 'description': 'Professional athlete care', 'price': 3199900, 'duration': '500 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Premium Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
+        {'id': new_id(), 'name': 'Presidential Wellness Suite', 'description': 'Ultimate luxury wellness', 'price': 5999900, 'duration': '800 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Premium Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
         
         # Stress Relief Packages
-        {'id': str(uuid.uuid4()), 'name': 'Stress Buster Package', 'description': 'Complete stress elimination', 'price': 349900, 'duration': '160 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Stress Relief Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Anxiety Relief Package', 'description': 'Mental health focused therapies', 'price': 399900, 'duration': '180 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Stress Relief Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Executive Stress Package', 'description': 'Work-related stress relief', 'price': 449900, 'duration': '200 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Stress Relief Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Weekend Stress Relief', 'description': 'Extended relaxation weekend', 'price': 529900, 'duration': '240 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Stress Relief Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Chronic Stress Package', 'description': 'Long-term stress management', 'price': 599900, 'duration': '280 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Stress Relief Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Mindfulness Stress Package', 'description': 'Meditation-focused stress relief', 'price': 379900, 'duration': '170 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Stress Relief Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Tension Release Package', 'description': 'Physical tension elimination', 'price': 419900, 'duration': '190 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Stress Relief Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Sleep Stress Package', 'description': 'Insomnia and stress relief', 'price': 469900, 'duration': '210 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Stress Relief Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Holistic Stress Package', 'description': 'Body-mind-spirit stress relief', 'price': 549900, 'duration': '260 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Stress Relief Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Emergency Stress Relief', 'description': 'Immediate stress reduction', 'price': 299900, 'duration': '120 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Stress Relief Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
+        {'id': new_id(), 'name': 'Stress Buster Package', 'description': 'Complete stress elimination', 'price': 349900, 'duration': '160 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Stress Relief Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
+        {'id': new_id(), 'name': 'Anxiety Relief Package', 'description': 'Mental health focused therapies', 'price': 399900, 'duration': '180 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Stress Relief Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
+        {'id': new_id(), 'name': 'Executive Stress Package', 'description': 'Work-related stress relief', 'price': 449900, 'duration': '200 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Stress Relief Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
+        {'id': new_id(), 'name': 'Weekend Stress Relief', 'description': 'Extended relaxation weekend', 'price': 529900, 'duration': '240 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Stress Relief Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
+        {'id': new_id(), 'name': 'Chronic Stress Package', 'description': 'Long-term stress management', 'price': 599900, 'duration': '280 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Stress Relief Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
+        {'id': new_id(), 'name': 'Mindfulness Stress Package', 'description': 'Meditation-focused stress relief', 'price': 379900, 'duration': '170 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Stress Relief Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
+        {'id': new_id(), 'name': 'Tension Release Package', 'description': 'Physical tension elimination', 'price': 419900, 'duration': '190 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Stress Relief Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
+        {'id': new_id(), 'name': 'Sleep Stress Package', 'description': 'Insomnia and stress relief', 'price': 469900, 'duration': '210 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Stress Relief Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
+        {'id': new_id(), 'name': 'Holistic Stress Package', 'description': 'Body-mind-spirit stress relief', 'price': 549900, 'duration': '260 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Stress Relief Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
+        {'id': new_id(), 'name': 'Emergency Stress Relief', 'description': 'Immediate stress reduction', 'price': 299900, 'duration': '120 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Stress Relief Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
         
         # Detox Packages
-        {'id': str(uuid.uuid4()), 'name': 'Full Body Detox Package', 'description': 'Complete detoxification program', 'price': 499900, 'duration': '200 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Detox Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Lymphatic Detox Package', 'description': 'Lymph drainage and detox', 'price': 399900, 'duration': '160 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Detox Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Ayurvedic Detox Package', 'description': 'Traditional cleansing therapies', 'price': 599900, 'duration': '240 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Detox Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Cellulite Detox Package', 'description': 'Skin and tissue detoxification', 'price': 449900, 'duration': '180 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Detox Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Liver Detox Package', 'description': 'Liver function improvement', 'price': 379900, 'duration': '150 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Detox Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Digestive Detox Package', 'description': 'Gut health and detoxification', 'price': 419900, 'duration': '170 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Detox Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Heavy Metal Detox Package', 'description': 'Toxin elimination therapy', 'price': 699900, 'duration': '280 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Detox Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Seasonal Detox Package', 'description': 'Seasonal cleansing program', 'price': 349900, 'duration': '140 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Detox Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Weight Loss Detox Package', 'description': 'Metabolic detoxification', 'price': 529900, 'duration': '220 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Detox Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Immune Boost Detox Package', 'description': 'Immunity enhancement detox', 'price': 479900, 'duration': '190 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Detox Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
+        {'id': new_id(), 'name': 'Full Body Detox Package', 'description': 'Complete detoxification program', 'price': 499900, 'duration': '200 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Detox Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
+        {'id': new_id(), 'name': 'Lymphatic Detox Package', 'description': 'Lymph drainage and detox', 'price': 399900, 'duration': '160 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Detox Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
+        {'id': new_id(), 'name': 'Ayurvedic Detox Package', 'description': 'Traditional cleansing therapies', 'price': 599900, 'duration': '240 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Detox Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
+        {'id': new_id(), 'name': 'Cellulite Detox Package', 'description': 'Skin and tissue detoxification', 'price': 449900, 'duration': '180 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Detox Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
+        {'id': new_id(), 'name': 'Liver Detox Package', 'description': 'Liver function improvement', 'price': 379900, 'duration': '150 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Detox Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
+        {'id': new_id(), 'name': 'Digestive Detox Package', 'description': 'Gut health and detoxification', 'price': 419900, 'duration': '170 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Detox Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
+        {'id': new_id(), 'name': 'Heavy Metal Detox Package', 'description': 'Toxin elimination therapy', 'price': 699900, 'duration': '280 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Detox Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
+        {'id': new_id(), 'name': 'Seasonal Detox Package', 'description': 'Seasonal cleansing program', 'price': 349900, 'duration': '140 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Detox Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
+        {'id': new_id(), 'name': 'Weight Loss Detox Package', 'description': 'Metabolic detoxification', 'price': 529900, 'duration': '220 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Detox Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
+        {'id': new_id(), 'name': 'Immune Boost Detox Package', 'description': 'Immunity enhancement detox', 'price': 479900, 'duration': '190 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Detox Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
         
         # Anti-Aging Packages
-        {'id': str(uuid.uuid4()), 'name': 'Youth Restoration Package', 'description': 'Complete anti-aging program', 'price': 899900, 'duration': '300 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Anti-Aging Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Facial Anti-Aging Package', 'description': 'Face-focused youth therapies', 'price': 649900, 'duration': '240 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Anti-Aging Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Body Anti-Aging Package', 'description': 'Full body rejuvenation', 'price': 799900, 'duration': '280 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Anti-Aging Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Collagen Boost Package', 'description': 'Skin elasticity enhancement', 'price': 699900, 'duration': '260 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Anti-Aging Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Wrinkle Reduction Package', 'description': 'Fine line and wrinkle treatment', 'price': 749900, 'duration': '270 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Anti-Aging Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Stem Cell Anti-Aging Package', 'description': 'Cellular regeneration therapy', 'price': 1199900, 'duration': '360 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Anti-Aging Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Hormone Balance Package', 'description': 'Age-related hormone therapy', 'price': 849900, 'duration': '290 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Anti-Aging Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Bone Density Package', 'description': 'Osteoporosis prevention', 'price': 599900, 'duration': '220 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Anti-Aging Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Memory Enhancement Package', 'description': 'Cognitive function improvement', 'price': 779900, 'duration': '275 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Anti-Aging Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Longevity Wellness Package', 'description': 'Comprehensive life extension', 'price': 1499900, 'duration': '420 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Anti-Aging Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
+        {'id': new_id(), 'name': 'Youth Restoration Package', 'description': 'Complete anti-aging program', 'price': 899900, 'duration': '300 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Anti-Aging Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
+        {'id': new_id(), 'name': 'Facial Anti-Aging Package', 'description': 'Face-focused youth therapies', 'price': 649900, 'duration': '240 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Anti-Aging Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
+        {'id': new_id(), 'name': 'Body Anti-Aging Package', 'description': 'Full body rejuvenation', 'price': 799900, 'duration': '280 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Anti-Aging Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
+        {'id': new_id(), 'name': 'Collagen Boost Package', 'description': 'Skin elasticity enhancement', 'price': 699900, 'duration': '260 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Anti-Aging Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
+        {'id': new_id(), 'name': 'Wrinkle Reduction Package', 'description': 'Fine line and wrinkle treatment', 'price': 749900, 'duration': '270 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Anti-Aging Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
+        {'id': new_id(), 'name': 'Stem Cell Anti-Aging Package', 'description': 'Cellular regeneration therapy', 'price': 1199900, 'duration': '360 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Anti-Aging Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
+        {'id': new_id(), 'name': 'Hormone Balance Package', 'description': 'Age-related hormone therapy', 'price': 849900, 'duration': '290 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Anti-Aging Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
+        {'id': new_id(), 'name': 'Bone Density Package', 'description': 'Osteoporosis prevention', 'price': 599900, 'duration': '220 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Anti-Aging Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
+        {'id': new_id(), 'name': 'Memory Enhancement Package', 'description': 'Cognitive function improvement', 'price': 779900, 'duration': '275 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Anti-Aging Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
+        {'id': new_id(), 'name': 'Longevity Wellness Package', 'description': 'Comprehensive life extension', 'price': 1499900, 'duration': '420 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Anti-Aging Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
         
         # Luxury Packages
-        {'id': str(uuid.uuid4()), 'name': 'Imperial Luxury Package', 'description': 'Ultimate luxury experience', 'price': 2999900, 'duration': '600 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Luxury Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Private Spa Day Package', 'description': 'Exclusive full-day wellness', 'price': 1999900, 'duration': '480 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Luxury Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Celebrity Treatment Suite', 'description': 'Star-quality wellness', 'price': 3999900, 'duration': '720 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Luxury Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Bespoke Wellness Journey', 'description': 'Customized luxury program', 'price': 4999900, 'duration': '800 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Luxury Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Palatial Home Spa', 'description': 'Palace-like home experience', 'price': 3499900, 'duration': '660 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Luxury Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Diamond Wellness Retreat', 'description': 'Ultimate luxury retreat', 'price': 5999900, 'duration': '900 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Luxury Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Royal Treatment Package', 'description': 'Monarch-quality service', 'price': 4499900, 'duration': '750 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Luxury Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Elite Executive Package', 'description': 'VIP business wellness', 'price': 2799900, 'duration': '540 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Luxury Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Luxury Family Wellness', 'description': 'Premium family experience', 'price': 6999900, 'duration': '960 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Luxury Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
-        {'id': str(uuid.uuid4()), 'name': 'Platinum Home Sanctuary', 'description': 'Ultimate home luxury spa', 'price': 7999900, 'duration': '1200 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Luxury Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
+        {'id': new_id(), 'name': 'Imperial Luxury Package', 'description': 'Ultimate luxury experience', 'price': 2999900, 'duration': '600 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Luxury Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
+        {'id': new_id(), 'name': 'Private Spa Day Package', 'description': 'Exclusive full-day wellness', 'price': 1999900, 'duration': '480 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Luxury Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
+        {'id': new_id(), 'name': 'Celebrity Treatment Suite', 'description': 'Star-quality wellness', 'price': 3999900, 'duration': '720 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Luxury Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
+        {'id': new_id(), 'name': 'Bespoke Wellness Journey', 'description': 'Customized luxury program', 'price': 4999900, 'duration': '800 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Luxury Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
+        {'id': new_id(), 'name': 'Palatial Home Spa', 'description': 'Palace-like home experience', 'price': 3499900, 'duration': '660 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Luxury Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
+        {'id': new_id(), 'name': 'Diamond Wellness Retreat', 'description': 'Ultimate luxury retreat', 'price': 5999900, 'duration': '900 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Luxury Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
+        {'id': new_id(), 'name': 'Royal Treatment Package', 'description': 'Monarch-quality service', 'price': 4499900, 'duration': '750 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Luxury Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
+        {'id': new_id(), 'name': 'Elite Executive Package', 'description': 'VIP business wellness', 'price': 2799900, 'duration': '540 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Luxury Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
+        {'id': new_id(), 'name': 'Luxury Family Wellness', 'description': 'Premium family experience', 'price': 6999900, 'duration': '960 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Luxury Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
+        {'id': new_id(), 'name': 'Platinum Home Sanctuary', 'description': 'Ultimate home luxury spa', 'price': 7999900, 'duration': '1200 min', 'category_id': package_cat, 'sub_category_id': sub_cat_map['Luxury Packages'], 'type': 'package', 'image': 'https://images.unsplash.com/photo-1600334089648-b0d9d3028eb2?w=400'},
     ]
     
     await db.products.insert_many(products)
@@ -618,7 +635,7 @@ async def seed_data():
     # ==================== DEFAULT PROFESSIONAL ====================
     
     professional = {
-        'id': str(uuid.uuid4()),
+        'id': new_id(),
         'name': 'Rajni',
         'email': None,
         'status': 'active',
@@ -631,10 +648,10 @@ async def seed_data():
     # ==================== WALLET OFFERS ====================
     
     wallet_offers = [
-        {'id': str(uuid.uuid4()), 'amount': 50000, 'cashback_percentage': 20, 'max_cashback': 10000, 'active': True, 'created_at': '2025-01-01T00:00:00Z'},
-        {'id': str(uuid.uuid4()), 'amount': 70000, 'cashback_percentage': 30, 'max_cashback': 21000, 'active': True, 'created_at': '2025-01-01T00:00:00Z'},
-        {'id': str(uuid.uuid4()), 'amount': 100000, 'cashback_percentage': 40, 'max_cashback': 40000, 'active': True, 'created_at': '2025-01-01T00:00:00Z'},
-        {'id': str(uuid.uuid4()), 'amount': 1000000, 'cashback_percentage': 100, 'max_cashback': 300000, 'active': True, 'created_at': '2025-01-01T00:00:00Z'},
+        {'id': new_id(), 'amount': 50000, 'cashback_percentage': 20, 'max_cashback': 10000, 'active': True, 'created_at': datetime(2025, 1, 1, tzinfo=timezone.utc)},
+        {'id': new_id(), 'amount': 70000, 'cashback_percentage': 30, 'max_cashback': 21000, 'active': True, 'created_at': datetime(2025, 1, 1, tzinfo=timezone.utc)},
+        {'id': new_id(), 'amount': 100000, 'cashback_percentage': 40, 'max_cashback': 40000, 'active': True, 'created_at': datetime(2025, 1, 1, tzinfo=timezone.utc)},
+        {'id': new_id(), 'amount': 1000000, 'cashback_percentage': 100, 'max_cashback': 300000, 'active': True, 'created_at': datetime(2025, 1, 1, tzinfo=timezone.utc)},
     ]
     
     await db.wallet_offers.insert_many(wallet_offers)
@@ -659,8 +676,336 @@ async def seed_data():
     print(f"   - 1 professional (Rajni)")
     print(f"   - {len(wallet_offers)} wallet offers")
     print(f"   - Wallet configuration with ₹100 welcome bonus\n")
+
+# ==================== SYNTHETIC DATA GENERATOR ====================
+#
+# python seed_data.py --generate --seed 42 --users 200000 --bookings 1000000 \
+#     --wallet-transactions 5000000 --email-logs 2000000
+#
+# Re-seeds the catalog, then fills users, professionals, bookings, wallet
+# transactions and email logs at production-like volumes. Every document
+# is derived from (seed, collection, index), so the same seed always
+# produces the same dataset regardless of batch size or concurrency.
+
+PINCODES_PATH = ROOT_DIR / 'data' / 'pincodes.csv.gz'
+RNG_BLOCK = 1000
+GENERATED_COLLECTIONS = ['users', 'bookings', 'wallet_transactions', 'email_logs', 'booking_rollups', 'admin_stats']
+
+FIRST_NAMES = ['Aarav', 'Vivaan', 'Aditya', 'Arjun', 'Rohan', 'Ishaan', 'Kabir', 'Rahul', 'Vikram', 'Karan',
+               'Ananya', 'Diya', 'Priya', 'Sneha', 'Kavya', 'Meera', 'Pooja', 'Neha', 'Riya', 'Aisha']
+LAST_NAMES = ['Sharma', 'Verma', 'Gupta', 'Singh', 'Kumar', 'Patel', 'Reddy', 'Iyer', 'Nair', 'Das',
+              'Mehta', 'Joshi', 'Chopra', 'Malhotra', 'Bose', 'Rao', 'Khan', 'Kapoor', 'Agarwal', 'Mishra']
+EMAIL_DOMAINS = ['gmail.com', 'gmail.com', 'gmail.com', 'yahoo.com', 'outlook.com', 'hotmail.com']
+
+# Bookings cluster in the evening; very few before 7am
+HOUR_WEIGHTS = [1, 1, 1, 1, 1, 2, 4, 8, 12, 14, 15, 15, 14, 13, 13, 14, 16, 19, 22, 22, 18, 12, 6, 3]
+
+# Status mix for bookings old enough to have settled vs. the last two days
+SETTLED_STATUSES = (['completed', 'cancelled', 'pending', 'accepted'], [80, 12, 5, 3])
+RECENT_STATUSES = (['pending', 'accepted', 'on_the_way', 'in_progress', 'completed', 'cancelled'], [25, 25, 10, 10, 22, 8])
+
+WALLET_TRANSACTION_TYPES = (['debit', 'topup', 'cashback', 'welcome_bonus', 'review_reward', 'credit'], [45, 22, 15, 6, 7, 5])
+TOPUP_AMOUNTS = ([50000, 70000, 100000, 200000, 500000, 1000000], [35, 20, 25, 10, 7, 3])
+EMAIL_LOG_TYPES = (['order_success', 'order_notification', 'topup', 'welcome', 'manual'], [38, 38, 12, 10, 2])
+
+def zipf_cum_weights(n: int, s: float, rng: random.Random) -> tuple:
+    """
+    Popularity ranks for n items: rank r gets weight 1/r^s.
+    Returns (items in rank order, cumulative weights) for rng.choices().
+    """
+    order = list(range(n))
+    rng.shuffle(order)
+    cum_weights = list(itertools.accumulate(1 / (rank + 1) ** s for rank in range(n)))
+    return order, cum_weights
+
+class SyntheticDataset:
+    """Deterministic generator for high-volume collections"""
+    
+    def __init__(self, seed: int, users: int, professionals: int, bookings: int,
+                 wallet_transactions: int, email_logs: int, end_date: datetime, days: int,
+                 batch_size: int):
+        self.seed = seed
+        self.counts = {
+            'users': users,
+            'professionals': professionals,
+            'bookings': bookings,
+            'wallet_transactions': wallet_transactions,
+            'email_logs': email_logs,
+        }
+        self.end_ts = end_date.timestamp()
+        self.start_ts = (end_date - timedelta(days=days)).timestamp()
+        self.batch_size = batch_size
+        self.products: list = []
+        self.pincodes: list = []
+        self.user_created: list = []
+        self.user_emails: list = []
+    
+    def rng(self, *key) -> random.Random:
+        return random.Random(':'.join(str(k) for k in (self.seed,) + key))
+    
+    def doc_id(self, collection: str, index: int) -> str:
+        digest = hashlib.md5(f'{self.seed}:{collection}:{index}'.encode()).digest()
+        return str(uuid.UUID(bytes=digest, version=4))
+    
+    def stamp(self, ts: float) -> datetime:
+        return datetime.fromtimestamp(ts, timezone.utc)
+    
+    def moment_after(self, rng: random.Random, since: float, recency: float = 0.7) -> float:
+        """A timestamp between since and end_ts, biased towards recent days and busy hours"""
+        day = since + (self.end_ts - since) * rng.random() ** recency
+        midnight = day - day % 86400
+        hour = rng.choices(range(24), weights=HOUR_WEIGHTS)[0]
+        ts = midnight + hour * 3600 + rng.randrange(3600)
+        return min(max(ts, since), self.end_ts)
+    
+    async def load_catalog(self):
+        products = await db.products.find({}, {'_id': 0, 'id': 1, 'category_id': 1, 'price': 1}).to_list(None)
+        self.products = sorted(products, key=lambda p: p['id'])
+        with gzip.open(PINCODES_PATH, 'rt', newline='', encoding='utf-8') as f:
+            self.pincodes = [row for row in csv.DictReader(f)]
+        
+        rng = self.rng('popularity')
+        self.product_rank = zipf_cum_weights(len(self.products), 1.1, rng)
+        self.pincode_rank = zipf_cum_weights(len(self.pincodes), 0.8, rng)
+        self.user_rank = zipf_cum_weights(max(self.counts['users'], 1), 0.9, rng)
+        self.professional_rank = zipf_cum_weights(max(self.counts['professionals'], 1), 0.6, rng)
+    
+    def pick(self, rng: random.Random, ranking: tuple, k: int) -> list:
+        order, cum_weights = ranking
+        return [order[i] for i in rng.choices(range(len(order)), cum_weights=cum_weights, k=k)]
+    
+    def chunks(self, collection: str, build):
+        """
+        Yield lists of up to batch_size documents.
+        Each fixed block of RNG_BLOCK documents draws from its own RNG, so
+        the output does not depend on batch_size.
+        """
+        total = self.counts[collection]
+        batch = []
+        for block_start in range(0, total, RNG_BLOCK):
+            rng = self.rng(collection, block_start // RNG_BLOCK)
+            for i in range(block_start, min(block_start + RNG_BLOCK, total)):
+                batch.append(build(rng, i))
+                if len(batch) == self.batch_size:
+                    yield batch
+                    batch = []
+        if batch:
+            yield batch
+    
+    # Signups grow over time: sqrt skews creation dates towards the end
+    def build_user(self, rng: random.Random, i: int) -> dict:
+        first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+        email = f'{first}.{last}{i}@{rng.choice(EMAIL_DOMAINS)}'.lower()
+        created = self.start_ts + (self.end_ts - self.start_ts) * rng.random() ** 0.5
+        self.user_created.append(created)
+        self.user_emails.append(email)
+        return {
+            'id': self.doc_id('users', i),
+            'email': email,
+            'name': f'{first} {last}',
+            'picture': None,
+            'role': 'user',
+            'wallet_balance': int(rng.paretovariate(1.5) * 10000) // 100 * 100 if rng.random() < 0.4 else 0,
+            'wallet_locked_balance': 10000 if rng.random() < 0.3 else 0,
+            'created_at': self.stamp(created),
+        }
+    
+    def build_professional(self, rng: random.Random, i: int) -> dict:
+        return {
+            'id': self.doc_id('professionals', i),
+            'name': f'{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}',
+            'email': None,
+            'status': 'active' if rng.random() < 0.9 else 'inactive',
+            'user_id': None,
+        }
+    
+    def build_booking(self, rng: random.Random, i: int) -> dict:
+        user = self.pick(rng, self.user_rank, 1)[0]
+        product = self.products[self.pick(rng, self.product_rank, 1)[0]]
+        pin = self.pincodes[self.pick(rng, self.pincode_rank, 1)[0]]
+        created = self.moment_after(rng, self.user_created[user])
+        
+        statuses = RECENT_STATUSES if self.end_ts - created < 2 * 86400 else SETTLED_STATUSES
+        status = rng.choices(*statuses)[0]
+        payment_method = 'cod' if rng.random() < 0.25 else 'online'
+        amount = product['price']
+        discount = amount // 10 if rng.random() < 0.1 else 0
+        wallet_used = min(amount - discount, rng.randrange(0, 30001, 500)) if rng.random() < 0.2 else 0
+        
+        booking = {
+            'id': self.doc_id('bookings', i),
+            'user_id': self.doc_id('users', user),
+            'product_id': product['id'],
+            'category_id': product.get('category_id'),
+            'professional_id': None,
+            'address': f"{rng.randrange(1, 400)}, {pin['locality']}, {pin['district']}",
+            'landmark': None,
+            'pincode': pin['pincode'],
+            'status': status,
+            'payment_method': payment_method,
+            'payment_id': None,
+            'razorpay_order_id': None,
+            'razorpay_payment_id': None,
+            'amount': amount,
+            'wallet_used': wallet_used,
+            'coupon_code': 'WELCOME10' if discount else None,
+            'discount_amount': discount,
+            'started_at': None,
+            'completed_at': None,
+            'review_given': status == 'completed' and rng.random() < 0.3,
+            'created_at': self.stamp(created),
+        }
+        if payment_method == 'online':
+            booking['razorpay_order_id'] = f'order_{rng.getrandbits(56):014x}'
+            if status != 'pending':
+                booking['razorpay_payment_id'] = f'pay_{rng.getrandbits(56):014x}'
+        if status not in ('pending', 'cancelled') and self.counts['professionals']:
+            booking['professional_id'] = self.doc_id('professionals', self.pick(rng, self.professional_rank, 1)[0])
+        if status in ('in_progress', 'completed'):
+            started = min(created + rng.randrange(3600, 3 * 86400), self.end_ts)
+            booking['started_at'] = self.stamp(started)
+            if status == 'completed':
+                booking['completed_at'] = self.stamp(min(started + rng.randrange(1800, 4 * 3600), self.end_ts))
+        return booking
+    
+    def build_wallet_transaction(self, rng: random.Random, i: int) -> dict:
+        user = self.pick(rng, self.user_rank, 1)[0]
+        type_ = rng.choices(*WALLET_TRANSACTION_TYPES)[0]
+        reference_id = None
+        if type_ == 'topup':
+            amount = rng.choices(*TOPUP_AMOUNTS)[0]
+            description = f'Wallet top-up of ₹{amount // 100}'
+            reference_id = f'pay_{rng.getrandbits(56):014x}'
+        elif type_ == 'cashback':
+            amount = rng.randrange(5000, 40001, 500)
+            description = 'Cashback on wallet top-up'
+        elif type_ == 'welcome_bonus':
+            amount = 10000
+            description = 'Welcome bonus'
+        elif type_ == 'review_reward':
+            amount = 5000
+            description = 'Reward for reviewing your booking'
+        else:
+            amount = rng.randrange(20000, 300001, 100)
+            description = 'Payment for booking' if type_ == 'debit' else 'Refund for cancelled booking'
+            if self.counts['bookings']:
+                reference_id = self.doc_id('bookings', rng.randrange(self.counts['bookings']))
+        
+        # Balances are plausible, not a replayable ledger
+        return {
+            'id': self.doc_id('wallet_transactions', i),
+            'user_id': self.doc_id('users', user),
+            'type': type_,
+            'amount': amount,
+            'balance_after': rng.randrange(0, 500001, 100),
+            'description': description,
+            'reference_id': reference_id,
+            'created_at': self.stamp(self.moment_after(rng, self.user_created[user])),
+        }
+    
+    def build_email_log(self, rng: random.Random, i: int) -> dict:
+        user = self.pick(rng, self.user_rank, 1)[0]
+        type_ = rng.choices(*EMAIL_LOG_TYPES)[0]
+        to_email = 'admin@intowns.in' if type_ == 'order_notification' else self.user_emails[user]
+        return {
+            'id': self.doc_id('email_logs', i),
+            'to_email': to_email,
+            'cc_email': None,
+            'subject': f'intowns.in - {type_.replace("_", " ").title()}',
+            'message': f'Synthetic {type_} email',
+            'type': type_,
+            'status': 'sent' if rng.random() < 0.97 else 'failed',
+            'created_at': self.stamp(self.moment_after(rng, self.user_created[user], recency=0.5)),
+        }
+
+async def insert_chunks(collection: str, chunks, concurrency: int) -> int:
+    """Insert generated chunks with up to `concurrency` insert_many calls in flight"""
+    semaphore = asyncio.Semaphore(concurrency)
+    inserted = 0
     
-    client.close()
+    async def insert(docs: list):
+        nonlocal inserted
+        try:
+            await db[collection].insert_many(docs, ordered=False)
+            inserted += len(docs)
+        finally:
+            semaphore.release()
+    
+    tasks = []
+    started = time.perf_counter()
+    for docs in chunks:
+        await semaphore.acquire()
+        tasks.append(asyncio.create_task(insert(docs)))
+    await asyncio.gather(*tasks)
+    
+    elapsed = time.perf_counter() - started
+    print(f"Inserted {inserted} {collection} in {elapsed:.1f}s ({inserted / max(elapsed, 1e-9):.0f} docs/s)")
+    return inserted
+
+async def generate_data(args):
+    global id_rng
+    print(f"Generating synthetic dataset (seed={args.seed})...")
+    
+    id_rng = random.Random(f'{args.seed}:catalog')
+    await seed_data()
+    
+    for name in GENERATED_COLLECTIONS:
+        await db[name].delete_many({})
+    
+    end_date = datetime.fromisoformat(args.end_date).replace(tzinfo=timezone.utc)
+    dataset = SyntheticDataset(
+        seed=args.seed,
+        users=args.users,
+        professionals=args.professionals,
+        bookings=args.bookings,
+        wallet_transactions=args.wallet_transactions,
+        email_logs=args.email_logs,
+        end_date=end_date,
+        days=args.days,
+        batch_size=args.batch_size,
+    )
+    await dataset.load_catalog()
+    
+    # Users first: later collections reference their ids, emails and signup dates
+    await insert_chunks('users', dataset.chunks('users', dataset.build_user), args.concurrency)
+    await insert_chunks('professionals', dataset.chunks('professionals', dataset.build_professional), args.concurrency)
+    if args.users:
+        await insert_chunks('bookings', dataset.chunks('bookings', dataset.build_booking), args.concurrency)
+        await insert_chunks('wallet_transactions', dataset.chunks('wallet_transactions', dataset.build_wallet_transaction), args.concurrency)
+        await insert_chunks('email_logs', dataset.chunks('email_logs', dataset.build_email_log), args.concurrency)
+    
+    # Derived collections the API reads instead of scanning bookings
+    import server
+    server.db = db
+    await server.backfill_booking_products(chunk_size=args.batch_size)
+    await server.backfill_booking_rollups(chunk_size=args.batch_size)
+    await server.reconcile_admin_stats()
+    print("Embedded product snapshots, rebuilt booking rollups and admin stats")
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Seed intowns.in catalog data, optionally with a synthetic production-scale dataset')
+    parser.add_argument('--generate', action='store_true', help='also generate users, bookings, wallet transactions and email logs')
+    parser.add_argument('--seed', type=int, default=1, help='RNG seed; the same seed produces the same dataset')
+    parser.add_argument('--users', type=int, default=200_000)
+    parser.add_argument('--professionals', type=int, default=50)
+    parser.add_argument('--bookings', type=int, default=1_000_000)
+    parser.add_argument('--wallet-transactions', type=int, default=5_000_000)
+    parser.add_argument('--email-logs', type=int, default=2_000_000)
+    parser.add_argument('--end-date', default='2025-12-31', help='last day covered by generated data (YYYY-MM-DD)')
+    parser.add_argument('--days', type=int, default=365, help='history length in days')
+    parser.add_argument('--batch-size', type=int, default=5000, help='documents per insert_many')
+    parser.add_argument('--concurrency', type=int, default=4, help='insert_many calls in flight')
+    return parser.parse_args(argv)
+
+async def main(argv=None):
+    args = parse_args(argv)
+    try:
+        if args.generate:
+            await generate_data(args)
+        else:
+            await seed_data()
+    finally:
+        client.close()
 
 if __name__ == '__main__':
-    asyncio.run(seed_data())
+    asyncio.run(main())
@@ -1,27 +1,76 @@
 from fastapi import FastAPI, APIRouter, HTTPException, Depends, Request
-from fastapi.responses import JSONResponse, RedirectResponse
+from fastapi.responses import JSONResponse, RedirectResponse, Response, StreamingResponse
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
 from starlette.middleware.sessions import SessionMiddleware
+from starlette.datastructures import MutableHeaders
 from motor.motor_asyncio import AsyncIOMotorClient
 import os
+import asyncio
 import logging
+from contextlib import asynccontextmanager, contextmanager
 from pathlib import Path
 from pydantic import BaseModel, Field, ConfigDict, EmailStr
 from typing import List, Optional, Dict, Any
 import uuid
+import base64
+import csv
+import gzip
+import html
+import json
+import hashlib
+import hmac
+import heapq
+import itertools
+import math
+import re
+import contextvars
+import bson
+import threading
+import time
+import zlib
+from array import array
+from bisect import bisect_left
+from collections import Counter, OrderedDict, defaultdict, deque
 from datetime import datetime, timezone, timedelta
+from email.utils import format_datetime, parsedate_to_datetime
+from xml.sax.saxutils import escape as xml_escape
 import jwt
-from authlib.integrations.starlette_client import OAuth
-import razorpay
+import orjson
+import prometheus_client
+import pymongo
+from prometheus_client import Counter as PrometheusCounter, Gauge, Histogram
+from pymongo import DeleteOne, ReturnDocument, UpdateOne, monitoring
+from pymongo.errors import DuplicateKeyError, OperationFailure, PyMongoError
 
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
 
-# MongoDB connection
-mongo_url = os.environ['MONGO_URL']
-client = AsyncIOMotorClient(mongo_url)
-db = client[os.environ['DB_NAME']]
+# MongoDB connection (opened per worker process by the app lifespan)
+MONGO_MAX_POOL_SIZE = int(os.environ.get('MONGO_MAX_POOL_SIZE', '100'))
+MONGO_MIN_POOL_SIZE = int(os.environ.get('MONGO_MIN_POOL_SIZE', '0'))
+MONGO_MAX_IDLE_TIME_MS = int(os.environ.get('MONGO_MAX_IDLE_TIME_MS', '60000'))
+MONGO_CONNECT_TIMEOUT_MS = int(os.environ.get('MONGO_CONNECT_TIMEOUT_MS', '5000'))
+MONGO_SERVER_SELECTION_TIMEOUT_MS = int(os.environ.get('MONGO_SERVER_SELECTION_TIMEOUT_MS', '5000'))
+MONGO_SOCKET_TIMEOUT_MS = int(os.environ.get('MONGO_SOCKET_TIMEOUT_MS', '30000'))
+MONGO_WAIT_QUEUE_TIMEOUT_MS = int(os.environ.get('MONGO_WAIT_QUEUE_TIMEOUT_MS', '5000'))
+
+client: Optional[AsyncIOMotorClient] = None
+db = None
+
+def create_mongo_client() -> AsyncIOMotorClient:
+    return AsyncIOMotorClient(
+        os.environ['MONGO_URL'],
+        maxPoolSize=MONGO_MAX_POOL_SIZE,
+        minPoolSize=MONGO_MIN_POOL_SIZE,
+        maxIdleTimeMS=MONGO_MAX_IDLE_TIME_MS,
+        connectTimeoutMS=MONGO_CONNECT_TIMEOUT_MS,
+        serverSelectionTimeoutMS=MONGO_SERVER_SELECTION_TIMEOUT_MS,
+        socketTimeoutMS=MONGO_SOCKET_TIMEOUT_MS,
+        waitQueueTimeoutMS=MONGO_WAIT_QUEUE_TIMEOUT_MS,
+        tz_aware=True,  # dates come back as UTC-aware datetimes
+        event_listeners=[mongo_command_metrics, query_budget_listener, pool_wait_monitor]
+    )
 
 # JWT Config
 JWT_SECRET = os.environ.get('JWT_SECRET', 'your-secret-key-change-in-production')
@@ -31,29 +80,75 @@ JWT_EXPIRATION_HOURS = 720  # 30 days
 # Razorpay Config
 RAZORPAY_KEY_ID = os.environ.get('RAZORPAY_KEY_ID', 'rzp_test_dummy')
 RAZORPAY_KEY_SECRET = os.environ.get('RAZORPAY_KEY_SECRET', 'dummy_secret')
-razorpay_client = razorpay.Client(auth=(RAZORPAY_KEY_ID, RAZORPAY_KEY_SECRET))
+razorpay_client = None  # razorpay.Client, see get_razorpay_client()
+
+def get_razorpay_client():
+    """Razorpay SDK client; the SDK is only imported on first use"""
+    global razorpay_client
+    if razorpay_client is None:
+        import razorpay
+        razorpay_client = razorpay.Client(auth=(RAZORPAY_KEY_ID, RAZORPAY_KEY_SECRET))
+    return razorpay_client
+
+RAZORPAY_TIMEOUT = float(os.environ.get('RAZORPAY_TIMEOUT', '10'))
+
+async def create_razorpay_order(amount: int) -> dict:
+    """Create a Razorpay order off the event loop, within the request's remaining budget"""
+    timeout = remaining_budget(RAZORPAY_TIMEOUT)
+    with observe_outbound('razorpay', 'order_create'):
+        return await asyncio.wait_for(
+            asyncio.to_thread(
+                get_razorpay_client().order.create,
+                {'amount': amount, 'currency': 'INR', 'payment_capture': 1},
+                timeout=timeout
+            ),
+            timeout
+        )
 
 # OAuth Setup
-oauth = OAuth()
-oauth.register(
-    name='google',
-    client_id=os.environ.get('GOOGLE_CLIENT_ID'),
-    client_secret=os.environ.get('GOOGLE_CLIENT_SECRET'),
-    server_metadata_url='https://accounts.google.com/.well-known/openid-configuration',
-    client_kwargs={'scope': 'openid email profile'}
-)
+OAUTH_METADATA_TTL = int(os.environ.get('OAUTH_METADATA_TTL', '3600'))  # seconds
+oauth = None  # authlib OAuth registry, see get_oauth()
+
+def get_oauth():
+    """OAuth registry; authlib is only imported on first use"""
+    global oauth
+    if oauth is None:
+        from authlib.integrations.starlette_client import OAuth
+        registry = OAuth()
+        registry.register(
+            name='google',
+            client_id=os.environ.get('GOOGLE_CLIENT_ID'),
+            client_secret=os.environ.get('GOOGLE_CLIENT_SECRET'),
+            server_metadata_url='https://accounts.google.com/.well-known/openid-configuration',
+            client_kwargs={'scope': 'openid email profile'}
+        )
+        oauth = registry
+    return oauth
 
-app = FastAPI()
-api_router = APIRouter(prefix="/api")
+async def refresh_oauth_metadata():
+    """
+    Prefetch Google's OpenID discovery document and JWKS so no user
+    request pays for them, and refresh both every OAUTH_METADATA_TTL
+    """
+    if not os.environ.get('GOOGLE_CLIENT_ID'):
+        return
+    
+    while True:
+        google = get_oauth().google
+        loaded_at = google.server_metadata.pop('_loaded_at', None)
+        try:
+            await google.load_server_metadata()
+            await google.fetch_jwk_set(force=True)
+            delay = OAUTH_METADATA_TTL
+        except Exception as e:
+            logger.error(f"OAuth metadata prefetch failed: {str(e)}")
+            if loaded_at is not None:
+                # Keep serving the previous metadata until a retry succeeds
+                google.server_metadata['_loaded_at'] = loaded_at
+            delay = 60
+        await asyncio.sleep(delay)
 
-app.add_middleware(SessionMiddleware, secret_key=JWT_SECRET)
-app.add_middleware(
-    CORSMiddleware,
-    allow_credentials=True,
-    allow_origins=os.environ.get('CORS_ORIGINS', '*').split(','),
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+api_router = APIRouter(prefix="/api")
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -92,6 +187,18 @@ class Product(BaseModel):
     type: str = "product"  # product or package
     image: Optional[str] = None
 
+class ProductSnapshot(BaseModel):
+    """The product as it was when booked; later edits or deletion don't change it"""
+    model_config = ConfigDict(extra="ignore")
+    id: str
+    name: str
+    price: int  # in paise
+    duration: Optional[str] = None
+    category_id: Optional[str] = None
+    sub_category_id: Optional[str] = None
+    type: str = "product"
+    image: Optional[str] = None
+
 class Professional(BaseModel):
     model_config = ConfigDict(extra="ignore")
     id: str = Field(default_factory=lambda: str(uuid.uuid4()))
@@ -105,6 +212,8 @@ class Booking(BaseModel):
     id: str = Field(default_factory=lambda: str(uuid.uuid4()))
     user_id: str
     product_id: str
+    product: Optional[ProductSnapshot] = None
+    category_id: Optional[str] = None
     professional_id: Optional[str] = None
     address: str
     landmark: Optional[str] = None
@@ -176,6 +285,8 @@ class BlogPost(BaseModel):
     meta_description: Optional[str] = None
     published: bool = False
     author_id: str
+    content_html: Optional[str] = None
+    reading_time: int = 1  # minutes
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
@@ -196,6 +307,8 @@ class EmailLog(BaseModel):
     status: str = "sent"  # sent, failed
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
+EMAIL_TYPES = ['welcome', 'topup', 'order_success', 'order_notification', 'manual']
+
 # ============= Input Models =============
 
 class UsernamePasswordLogin(BaseModel):
@@ -289,6 +402,23 @@ class SiteConfigUpdate(BaseModel):
 class ConfirmReviewRequest(BaseModel):
     booking_id: str
 
+class ServiceablePincodesRequest(BaseModel):
+    pincodes: List[str]
+
+# ============= Date Helpers =============
+
+def to_utc(value: datetime) -> datetime:
+    """Normalize a datetime to UTC, treating naive values as UTC"""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+def as_datetime(value) -> Optional[datetime]:
+    """Stored timestamps are BSON dates, or ISO strings in documents not yet migrated"""
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    return to_utc(value) if isinstance(value, datetime) else None
+
 # ============= Auth Helpers =============
 
 def create_jwt_token(user_data: dict) -> str:
@@ -330,10 +460,1858 @@ async def require_professional(user: dict = Depends(get_current_user)) -> dict:
         raise HTTPException(status_code=403, detail="Professional access required")
     return user
 
+# ============= Metrics =============
+
+HTTP_REQUEST_DURATION = Histogram(
+    'http_request_duration_seconds',
+    'HTTP request latency by route template',
+    ['method', 'route', 'status'],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+)
+HTTP_REQUESTS_IN_FLIGHT = Gauge(
+    'http_requests_in_flight',
+    'HTTP requests currently being served',
+    multiprocess_mode='livesum'
+)
+MONGO_COMMAND_DURATION = Histogram(
+    'mongo_command_duration_seconds',
+    'MongoDB command latency by collection and operation',
+    ['collection', 'command', 'outcome'],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1, 5)
+)
+REQUESTS_SHED = PrometheusCounter(
+    'http_requests_shed_total',
+    'Requests rejected by rate limiting (429) or admission control (503)',
+    ['reason', 'route']
+)
+REQUESTS_TIMED_OUT = PrometheusCounter(
+    'http_requests_timed_out_total',
+    'Requests answered with 504 because their deadline passed',
+    ['route_class']
+)
+OUTBOUND_REQUEST_DURATION = Histogram(
+    'outbound_request_duration_seconds',
+    'Latency of calls to external services',
+    ['service', 'operation', 'outcome'],
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+)
+
+class MetricsMiddleware:
+    """
+    Pure ASGI middleware recording request latency and in-flight requests.
+    Labels use the matched route template (e.g. /api/bookings/{booking_id})
+    so cardinality stays bounded.
+    """
+    
+    def __init__(self, app):
+        self.app = app
+        self._children: Dict[tuple, Any] = {}
+    
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+        
+        status_code = 500
+        
+        async def send_with_status(message):
+            nonlocal status_code
+            if message['type'] == 'http.response.start':
+                status_code = message['status']
+            await send(message)
+        
+        HTTP_REQUESTS_IN_FLIGHT.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - started
+            HTTP_REQUESTS_IN_FLIGHT.dec()
+            route = scope.get('route')
+            key = (scope['method'], route.path if route else 'unmatched', status_code)
+            child = self._children.get(key)
+            if child is None:
+                child = self._children[key] = HTTP_REQUEST_DURATION.labels(*key)
+            child.observe(elapsed)
+
+class MongoCommandMetrics(monitoring.CommandListener):
+    """pymongo command listener feeding MONGO_COMMAND_DURATION"""
+    
+    def __init__(self):
+        self._collections: Dict[tuple, str] = {}
+    
+    def started(self, event):
+        collection = event.command.get(event.command_name)
+        if not isinstance(collection, str):
+            collection = event.command.get('collection', '')
+        self._collections[(event.connection_id, event.request_id)] = collection
+    
+    def _finish(self, event, outcome: str):
+        collection = self._collections.pop((event.connection_id, event.request_id), '')
+        MONGO_COMMAND_DURATION.labels(collection, event.command_name, outcome).observe(event.duration_micros / 1e6)
+    
+    def succeeded(self, event):
+        self._finish(event, 'success')
+    
+    def failed(self, event):
+        self._finish(event, 'failure')
+
+mongo_command_metrics = MongoCommandMetrics()
+
+@contextmanager
+def observe_outbound(service: str, operation: str):
+    """Time a call to an external service"""
+    started = time.perf_counter()
+    outcome = 'success'
+    try:
+        yield
+    except BaseException:
+        outcome = 'failure'
+        raise
+    finally:
+        OUTBOUND_REQUEST_DURATION.labels(service, operation, outcome).observe(time.perf_counter() - started)
+
+METRICS_TOKEN = os.environ.get('METRICS_TOKEN')  # bearer token scrapers send; unset disables /metrics
+
+async def metrics_endpoint(request: Request) -> Response:
+    """Prometheus exposition; aggregates all workers when PROMETHEUS_MULTIPROC_DIR is set"""
+    if not METRICS_TOKEN:
+        return Response(status_code=404)
+    authorization = request.headers.get('authorization', '')
+    if not hmac.compare_digest(authorization.encode(), f'Bearer {METRICS_TOKEN}'.encode()):
+        return Response(status_code=401, headers={'WWW-Authenticate': 'Bearer'})
+    registry = prometheus_client.REGISTRY
+    if os.environ.get('PROMETHEUS_MULTIPROC_DIR'):
+        from prometheus_client import multiprocess
+        registry = prometheus_client.CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    return Response(prometheus_client.generate_latest(registry), media_type=prometheus_client.CONTENT_TYPE_LATEST)
+
+# ============= Query Budgets =============
+
+QUERY_DEBUG = os.environ.get('QUERY_DEBUG', 'false').lower() == 'true'
+QUERY_BUDGET_MAX_QUERIES = int(os.environ.get('QUERY_BUDGET_MAX_QUERIES', '25'))
+QUERY_BUDGET_MAX_BYTES = int(os.environ.get('QUERY_BUDGET_MAX_BYTES', '0'))  # 0 disables the bytes budget
+
+class QueryStats:
+    __slots__ = ('queries', 'bytes', 'track_bytes')
+    
+    def __init__(self, track_bytes: bool = False):
+        self.queries = 0
+        self.bytes = 0
+        self.track_bytes = track_bytes
+
+current_query_stats: contextvars.ContextVar = contextvars.ContextVar('current_query_stats', default=None)
+
+class QueryBudgetListener(monitoring.CommandListener):
+    """
+    Attributes Mongo round trips (and reply sizes) to the current request.
+    Motor runs commands with a copy of the caller's context, so the
+    request's QueryStats object is visible from the executor thread.
+    """
+    
+    def started(self, event):
+        pass
+    
+    def succeeded(self, event):
+        stats = current_query_stats.get()
+        if stats is not None:
+            stats.queries += 1
+            if stats.track_bytes:
+                stats.bytes += len(bson.encode(event.reply))
+    
+    def failed(self, event):
+        stats = current_query_stats.get()
+        if stats is not None:
+            stats.queries += 1
+
+query_budget_listener = QueryBudgetListener()
+
+class QueryBudgetMiddleware:
+    """
+    Counts Mongo round trips per request. In debug mode the totals are
+    returned as X-Query-Count / X-Query-Bytes headers; requests over
+    budget are always logged.
+    """
+    
+    def __init__(self, app):
+        self.app = app
+    
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+        
+        debug = QUERY_DEBUG
+        stats = QueryStats(track_bytes=debug or QUERY_BUDGET_MAX_BYTES > 0)
+        token = current_query_stats.set(stats)
+        
+        async def send_with_headers(message):
+            if debug and message['type'] == 'http.response.start':
+                headers = list(message.get('headers', []))
+                headers.append((b'x-query-count', str(stats.queries).encode()))
+                headers.append((b'x-query-bytes', str(stats.bytes).encode()))
+                message = {**message, 'headers': headers}
+            await send(message)
+        
+        try:
+            await self.app(scope, receive, send_with_headers)
+        finally:
+            current_query_stats.reset(token)
+            over_queries = stats.queries > QUERY_BUDGET_MAX_QUERIES
+            over_bytes = QUERY_BUDGET_MAX_BYTES > 0 and stats.bytes > QUERY_BUDGET_MAX_BYTES
+            if over_queries or over_bytes:
+                route = scope.get('route')
+                logger.warning(
+                    f"Query budget exceeded: {scope['method']} {route.path if route else scope['path']} "
+                    f"made {stats.queries} queries returning {stats.bytes} bytes "
+                    f"(budget {QUERY_BUDGET_MAX_QUERIES} queries, {QUERY_BUDGET_MAX_BYTES or 'unlimited'} bytes)"
+                )
+
+# ============= Request Deadlines =============
+
+# Time budget per route class, in seconds. REQUEST_DEADLINES='{"admin": 30}' overrides.
+REQUEST_DEADLINES = {
+    'default': 5,
+    'search': 4,
+    'payment': 15,
+    'admin': 15,
+    'maintenance': 600,
+    **json.loads(os.environ.get('REQUEST_DEADLINES', '{}'))
+}
+# The first matching path prefix picks the route class
+DEADLINE_ROUTE_CLASSES = [
+    ('/api/address/search', 'search'),
+    ('/api/orders/', 'payment'),
+    ('/api/wallet/topup', 'payment'),
+    ('/api/admin/analytics/backfill', 'maintenance'),
+    ('/api/admin/bookings/backfill-products', 'maintenance'),
+    ('/api/admin/migrations/', 'maintenance'),
+    ('/api/admin/', 'admin'),
+]
+DEADLINE_EXEMPT_PATHS = {'/metrics'}
+DEADLINE_GRACE = 0.5  # seconds for Mongo timeouts to surface before the request is cancelled
+
+current_deadline: contextvars.ContextVar = contextvars.ContextVar('current_deadline', default=None)
+
+class DeadlineExceeded(Exception):
+    """The request's time budget ran out before the work finished"""
+
+def remaining_budget(cap: Optional[float] = None) -> Optional[float]:
+    """
+    Seconds left before the current request's deadline, at most cap.
+    None when there is neither a deadline nor a cap; raises
+    DeadlineExceeded once the deadline has passed.
+    """
+    deadline = current_deadline.get()
+    if deadline is None:
+        return cap
+    remaining = deadline - time.monotonic()
+    if remaining <= 0:
+        raise DeadlineExceeded("Request deadline exceeded")
+    return remaining if cap is None else min(cap, remaining)
+
+def deadline_class(path: str) -> str:
+    for prefix, route_class in DEADLINE_ROUTE_CLASSES:
+        if path.startswith(prefix):
+            return route_class
+    return 'default'
+
+_detached_tasks: set = set()
+
+async def run_to_completion(coro):
+    """
+    Await a multi-step write sequence that must not be left half done. It
+    runs in its own task, outside the request's deadline and Mongo timeout.
+    If the request is cancelled meanwhile (e.g. by its deadline), this keeps
+    waiting and returns the result anyway: a client told to retry a write
+    that went through would repeat it. Code after it must not query Mongo,
+    whose timeout may have expired by then.
+    """
+    task = asyncio.create_task(coro, context=contextvars.Context())
+    _detached_tasks.add(task)
+    task.add_done_callback(_detached_tasks.discard)
+    while True:
+        try:
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            if task.cancelled():
+                raise
+
+def is_timeout(exc: BaseException) -> bool:
+    if isinstance(exc, PyMongoError):
+        return exc.timeout
+    return isinstance(exc, (DeadlineExceeded, TimeoutError))
+
+class DeadlineMiddleware:
+    """
+    Gives each request a deadline by route class. Mongo operations inherit
+    it through pymongo.timeout(), which sends the remaining time as
+    maxTimeMS and also bounds pool checkout and socket reads; outbound
+    calls take remaining_budget() as their timeout. Work still running
+    shortly after the deadline is cancelled, and a request that timed out
+    before it started responding gets a 504.
+    """
+    
+    def __init__(self, app):
+        self.app = app
+    
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http' or scope['path'] in DEADLINE_EXEMPT_PATHS:
+            await self.app(scope, receive, send)
+            return
+        
+        route_class = deadline_class(scope['path'])
+        budget = REQUEST_DEADLINES[route_class]
+        token = current_deadline.set(time.monotonic() + budget)
+        response_started = False
+        
+        async def send_tracking_start(message):
+            nonlocal response_started
+            if message['type'] == 'http.response.start':
+                response_started = True
+            await send(message)
+        
+        try:
+            with pymongo.timeout(budget):
+                async with asyncio.timeout(budget + DEADLINE_GRACE):
+                    await self.app(scope, receive, send_tracking_start)
+        except Exception as e:
+            if response_started or not is_timeout(e):
+                raise
+            REQUESTS_TIMED_OUT.labels(route_class).inc()
+            logger.warning(f"Deadline exceeded: {scope['method']} {scope['path']} ({budget}s budget): {str(e) or type(e).__name__}")
+            response = JSONResponse({'detail': 'Request timed out, please retry'}, status_code=504)
+            await response(scope, receive, send)
+        finally:
+            current_deadline.reset(token)
+
+# ============= Request Profiling =============
+
+PROFILE_LATENCY_THRESHOLD_MS = int(os.environ.get('PROFILE_LATENCY_THRESHOLD_MS', '0'))  # 0 disables
+PROFILE_SAMPLE_INTERVAL_MS = float(os.environ.get('PROFILE_SAMPLE_INTERVAL_MS', '5'))
+PROFILE_BUFFER_SIZE = int(os.environ.get('PROFILE_BUFFER_SIZE', '20'))
+PROFILE_MAX_STACKS = 50
+
+def coroutine_stack(coro) -> List[str]:
+    """Frames of a suspended coroutine chain, outermost first, ending at the awaited object"""
+    stack = []
+    while coro is not None:
+        frame = getattr(coro, 'cr_frame', None) or getattr(coro, 'gi_frame', None)
+        if frame is None:
+            stack.append(f"<await {type(coro).__name__}>")
+            break
+        code = frame.f_code
+        stack.append(f"{code.co_name} ({Path(code.co_filename).name}:{frame.f_lineno})")
+        coro = getattr(coro, 'cr_await', None) or getattr(coro, 'gi_yieldfrom', None)
+    return stack
+
+class RequestSampler:
+    """
+    Samples where a request's task is suspended every interval seconds.
+    Samples run on the event loop, so they land on await points; time the
+    loop was too busy to sample is reported as '<event loop busy>'.
+    """
+    
+    def __init__(self, task: asyncio.Task, interval: float):
+        self.task = task
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self.samples = 0
+        self._loop = asyncio.get_running_loop()
+        self._expected: Optional[float] = None
+        self._handle = None
+    
+    def start(self):
+        self._sample()
+    
+    def stop(self):
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+    
+    def _sample(self):
+        now = self._loop.time()
+        if self._expected is not None and now - self._expected > self.interval:
+            missed = int((now - self._expected) / self.interval)
+            self.stacks['<event loop busy>'] += missed
+            self.samples += missed
+        
+        stack = coroutine_stack(self.task.get_coro())
+        if stack:
+            self.stacks[';'.join(stack)] += 1
+            self.samples += 1
+        
+        self._expected = now + self.interval
+        self._handle = self._loop.call_later(self.interval, self._sample)
+
+class ProfileStore:
+    """Keeps the PROFILE_BUFFER_SIZE slowest profiles captured by this worker"""
+    
+    def __init__(self, size: int):
+        self.size = size
+        self._heap: list = []
+        self._seq = itertools.count()
+    
+    def add(self, profile: dict):
+        entry = (profile['duration_ms'], next(self._seq), profile)
+        if len(self._heap) < self.size:
+            heapq.heappush(self._heap, entry)
+        elif entry[0] > self._heap[0][0]:
+            heapq.heapreplace(self._heap, entry)
+    
+    def list(self) -> List[dict]:
+        return [profile for _, _, profile in sorted(self._heap, key=lambda e: -e[0])]
+    
+    def get(self, profile_id: str) -> Optional[dict]:
+        return next((p for _, _, p in self._heap if p['id'] == profile_id), None)
+
+profile_store = ProfileStore(PROFILE_BUFFER_SIZE)
+
+class ProfilingMiddleware:
+    """
+    Opt-in sampling profiler. A request is profiled when an admin sends
+    X-Profile: 1, or once it has run longer than PROFILE_LATENCY_THRESHOLD_MS
+    (sampling starts at that point). Untriggered requests only pay for one
+    header lookup and, with a threshold set, one timer.
+    """
+    
+    def __init__(self, app):
+        self.app = app
+    
+    @staticmethod
+    def _admin_requested(scope) -> bool:
+        headers = dict(scope['headers'])
+        if headers.get(b'x-profile') != b'1':
+            return False
+        auth_header = headers.get(b'authorization', b'').decode()
+        if not auth_header.startswith('Bearer '):
+            return False
+        try:
+            return verify_jwt_token(auth_header.split(' ')[1]).get('role') == 'admin'
+        except HTTPException:
+            return False
+    
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+        
+        requested = self._admin_requested(scope)
+        threshold = PROFILE_LATENCY_THRESHOLD_MS / 1000
+        if not requested and threshold <= 0:
+            await self.app(scope, receive, send)
+            return
+        
+        loop = asyncio.get_running_loop()
+        sampler = RequestSampler(asyncio.current_task(), PROFILE_SAMPLE_INTERVAL_MS / 1000)
+        timer = None
+        if requested:
+            sampler.start()
+        else:
+            timer = loop.call_later(threshold, sampler.start)
+        
+        status_code = 500
+        
+        async def send_with_status(message):
+            nonlocal status_code
+            if message['type'] == 'http.response.start':
+                status_code = message['status']
+            await send(message)
+        
+        started = time.perf_counter()
+        started_at = datetime.now(timezone.utc)
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            duration = time.perf_counter() - started
+            if timer is not None:
+                timer.cancel()
+            sampler.stop()
+            if requested or duration >= threshold:
+                route = scope.get('route')
+                profile_store.add({
+                    'id': str(uuid.uuid4()),
+                    'method': scope['method'],
+                    'path': scope['path'],
+                    'route': route.path if route else None,
+                    'status': status_code,
+                    'trigger': 'header' if requested else 'threshold',
+                    'started_at': started_at.isoformat(),
+                    'duration_ms': round(duration * 1000, 2),
+                    'interval_ms': PROFILE_SAMPLE_INTERVAL_MS,
+                    'samples': sampler.samples,
+                    'stacks': [
+                        {'stack': stack, 'samples': count}
+                        for stack, count in sampler.stacks.most_common(PROFILE_MAX_STACKS)
+                    ]
+                })
+
+# ============= Rate Limiting =============
+
+RATE_LIMIT_ENABLED = os.environ.get('RATE_LIMIT_ENABLED', 'true').lower() == 'true'
+RATE_LIMIT_BACKEND = os.environ.get('RATE_LIMIT_BACKEND', 'memory')  # memory or redis
+RATE_LIMIT_REDIS_URL = os.environ.get('RATE_LIMIT_REDIS_URL', 'redis://localhost:6379/0')
+# Per-route budgets: (tokens refilled per second, bucket size), per client.
+# RATE_LIMIT_RULES='{"login": [0.5, 10]}' overrides individual routes.
+RATE_LIMITS = {
+    'address_search': (5, 30),
+    'login': (0.2, 5),
+    'create_order': (0.5, 10),
+    'admin_list': (2, 30),
+    **{name: tuple(rule) for name, rule in json.loads(os.environ.get('RATE_LIMIT_RULES', '{}')).items()}
+}
+
+MAX_IN_FLIGHT_REQUESTS = int(os.environ.get('MAX_IN_FLIGHT_REQUESTS', '200'))  # per worker, 0 = off
+POOL_WAIT_SHED_MS = float(os.environ.get('POOL_WAIT_SHED_MS', '250'))  # 0 = off
+POOL_WAIT_WINDOW = 1.0  # seconds of checkout samples considered
+ADMISSION_EXEMPT_PATHS = {'/metrics', '/api/'}
+
+class MemoryRateLimitBackend:
+    """Token buckets held in this process; limits apply per worker"""
+    
+    def __init__(self, max_keys: int = 100_000):
+        self.max_keys = max_keys
+        self._buckets: OrderedDict = OrderedDict()
+    
+    async def take(self, key: str, rate: float, burst: float, cost: float = 1) -> tuple:
+        """Spend cost tokens; returns (allowed, seconds until enough tokens)"""
+        now = time.monotonic()
+        tokens, updated_at = self._buckets.pop(key, (burst, now))
+        tokens = min(burst, tokens + (now - updated_at) * rate)
+        allowed = tokens >= cost
+        if allowed:
+            tokens -= cost
+        self._buckets[key] = (tokens, now)
+        if len(self._buckets) > self.max_keys:
+            self._buckets.popitem(last=False)
+        return allowed, 0 if allowed else (cost - tokens) / rate
+    
+    async def close(self):
+        pass
+
+class RedisRateLimitBackend:
+    """
+    Token buckets shared by all workers and hosts, kept in Redis (or any
+    server speaking its protocol) and updated atomically by a Lua script.
+    """
+    
+    SCRIPT = """
+    local rate, burst, cost = tonumber(ARGV[1]), tonumber(ARGV[2]), tonumber(ARGV[3])
+    local clock = redis.call('TIME')
+    local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+    local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+    local tokens = tonumber(state[1]) or burst
+    local ts = tonumber(state[2]) or now
+    tokens = math.min(burst, tokens + math.max(0, now - ts) * rate)
+    local allowed = 0
+    if tokens >= cost then
+        tokens = tokens - cost
+        allowed = 1
+    end
+    redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+    redis.call('EXPIRE', KEYS[1], math.ceil(burst / rate) + 1)
+    return {allowed, tostring(tokens)}
+    """
+    
+    def __init__(self, url: str):
+        import redis.asyncio  # optional dependency, only needed for this backend
+        self._redis = redis.asyncio.from_url(url)
+        self._script = self._redis.register_script(self.SCRIPT)
+    
+    async def take(self, key: str, rate: float, burst: float, cost: float = 1) -> tuple:
+        allowed, tokens = await self._script(keys=[f'ratelimit:{key}'], args=[rate, burst, cost])
+        return bool(allowed), 0 if allowed else (cost - float(tokens)) / rate
+    
+    async def close(self):
+        await self._redis.aclose()
+
+def create_rate_limit_backend():
+    if RATE_LIMIT_BACKEND == 'redis':
+        return RedisRateLimitBackend(RATE_LIMIT_REDIS_URL)
+    return MemoryRateLimitBackend()
+
+rate_limit_backend = MemoryRateLimitBackend()
+
+def rate_limit_key(request: Request) -> str:
+    """Signed-in clients are limited by user id, everyone else by IP"""
+    auth_header = request.headers.get('authorization', '')
+    if auth_header.startswith('Bearer '):
+        try:
+            payload = jwt.decode(auth_header[7:], JWT_SECRET, algorithms=[JWT_ALGORITHM])
+            return f"user:{payload['user_id']}"
+        except (jwt.InvalidTokenError, KeyError):
+            pass
+    return f"ip:{request.client.host if request.client else 'unknown'}"
+
+class RateLimit:
+    """Route dependency enforcing the RATE_LIMITS budget `name` per client"""
+    
+    def __init__(self, name: str):
+        self.name = name
+    
+    async def __call__(self, request: Request):
+        if not RATE_LIMIT_ENABLED:
+            return
+        rate, burst = RATE_LIMITS[self.name]
+        try:
+            allowed, retry_after = await rate_limit_backend.take(f'{self.name}:{rate_limit_key(request)}', rate, burst)
+        except Exception as e:
+            # A broken shared backend must not take the API down with it
+            logger.warning(f"Rate limit backend error, allowing request: {str(e)}")
+            return
+        if not allowed:
+            REQUESTS_SHED.labels('rate_limit', self.name).inc()
+            raise HTTPException(
+                status_code=429,
+                detail="Too many requests, please retry shortly",
+                headers={'Retry-After': str(max(1, math.ceil(retry_after)))}
+            )
+
+class PoolWaitMonitor(monitoring.ConnectionPoolListener):
+    """Records how long recent Mongo connection checkouts waited for the pool"""
+    
+    def __init__(self):
+        self._started = threading.local()
+        self._samples: deque = deque(maxlen=512)
+    
+    def connection_check_out_started(self, event):
+        self._started.at = time.perf_counter()
+    
+    def connection_checked_out(self, event):
+        started = getattr(self._started, 'at', None)
+        if started is not None:
+            now = time.perf_counter()
+            self._samples.append((now, (now - started) * 1000))
+    
+    def connection_check_out_failed(self, event):
+        self.connection_checked_out(event)
+    
+    def recent_wait_ms(self) -> float:
+        """Mean checkout wait over the last POOL_WAIT_WINDOW seconds"""
+        cutoff = time.perf_counter() - POOL_WAIT_WINDOW
+        waits = [wait for at, wait in list(self._samples) if at >= cutoff]
+        return sum(waits) / len(waits) if waits else 0.0
+    
+    def pool_created(self, event): pass
+    def pool_ready(self, event): pass
+    def pool_cleared(self, event): pass
+    def pool_closed(self, event): pass
+    def connection_created(self, event): pass
+    def connection_ready(self, event): pass
+    def connection_closed(self, event): pass
+    def connection_checked_in(self, event): pass
+
+pool_wait_monitor = PoolWaitMonitor()
+
+class AdmissionControlMiddleware:
+    """
+    Sheds load instead of queueing it: while MAX_IN_FLIGHT_REQUESTS are
+    already being served, or recent Mongo pool checkouts waited longer than
+    POOL_WAIT_SHED_MS on average, new requests get an immediate 503.
+    """
+    
+    def __init__(self, app):
+        self.app = app
+        self.in_flight = 0
+    
+    def overloaded(self) -> Optional[str]:
+        if MAX_IN_FLIGHT_REQUESTS and self.in_flight >= MAX_IN_FLIGHT_REQUESTS:
+            return 'in_flight'
+        if POOL_WAIT_SHED_MS and pool_wait_monitor.recent_wait_ms() > POOL_WAIT_SHED_MS:
+            return 'pool_wait'
+        return None
+    
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http' or scope['path'] in ADMISSION_EXEMPT_PATHS:
+            await self.app(scope, receive, send)
+            return
+        
+        reason = self.overloaded()
+        if reason:
+            REQUESTS_SHED.labels(reason, 'all').inc()
+            response = JSONResponse(
+                {'detail': 'Server is busy, please retry shortly'},
+                status_code=503,
+                headers={'Retry-After': '1'}
+            )
+            await response(scope, receive, send)
+            return
+        
+        self.in_flight += 1
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.in_flight -= 1
+
+# ============= Batched Writes =============
+
+class BatchWriter:
+    """
+    Write-behind buffer for append-only collections.
+    Coalesces inserts into insert_many batches, flushed when the batch is
+    full or the oldest queued document has waited max_delay seconds.
+    Batches holding a synchronous (wait=True) insert are flushed as soon
+    as the queue is drained, group-commit style.
+    """
+    
+    _STOP = object()
+    
+    def __init__(self, collection_name: str, max_batch: int = 200, max_delay: float = 0.05):
+        self.collection_name = collection_name
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+    
+    def start(self):
+        if self._task is None:
+            self._queue = asyncio.Queue()
+            self._task = asyncio.create_task(self._run())
+    
+    async def insert(self, document: dict, wait: bool = False):
+        """
+        Queue a document for insertion.
+        With wait=True, returns only once the batch holding the document
+        has been acknowledged by MongoDB (raises if the write failed).
+        """
+        if self._task is None:
+            # Writer not running (e.g. scripts, shutdown): write directly
+            await db[self.collection_name].insert_one(document)
+            return
+        
+        future = asyncio.get_running_loop().create_future() if wait else None
+        self._queue.put_nowait((document, future))
+        if future:
+            await future
+    
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        stopping = False
+        while not stopping:
+            item = await self._queue.get()
+            if item is self._STOP:
+                return
+            batch = [item]
+            deadline = loop.time() + self.max_delay
+            while len(batch) < self.max_batch:
+                if not self._queue.empty():
+                    item = self._queue.get_nowait()
+                else:
+                    # Someone is waiting on this batch: commit what we have.
+                    # Writes arriving meanwhile queue up for the next batch.
+                    timeout = deadline - loop.time()
+                    if timeout <= 0 or any(future for _, future in batch):
+                        break
+                    try:
+                        item = await asyncio.wait_for(self._queue.get(), timeout)
+                    except asyncio.TimeoutError:
+                        break
+                if item is self._STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+            await self._flush(batch)
+    
+    async def _flush(self, batch: list):
+        try:
+            await db[self.collection_name].insert_many([doc for doc, _ in batch], ordered=False)
+            error = None
+        except Exception as e:
+            logger.error(f"Batch insert into {self.collection_name} failed: {str(e)}")
+            error = e
+        
+        for _, future in batch:
+            if future and not future.done():
+                if error:
+                    future.set_exception(error)
+                else:
+                    future.set_result(None)
+    
+    async def close(self):
+        """Flush everything still queued and stop the background task"""
+        if self._task is None:
+            return
+        # A sentinel rather than task.cancel(): wait_for() can swallow a
+        # cancellation that races with a queue item on Python < 3.12
+        self._queue.put_nowait(self._STOP)
+        await self._task
+        self._task = None
+        
+        pending = []
+        while not self._queue.empty():
+            pending.append(self._queue.get_nowait())
+        for i in range(0, len(pending), self.max_batch):
+            await self._flush(pending[i:i + self.max_batch])
+
+BATCH_WRITE_MAX_SIZE = int(os.environ.get('BATCH_WRITE_MAX_SIZE', '200'))
+BATCH_WRITE_MAX_DELAY_MS = int(os.environ.get('BATCH_WRITE_MAX_DELAY_MS', '50'))
+
+email_log_writer = BatchWriter('email_logs', BATCH_WRITE_MAX_SIZE, BATCH_WRITE_MAX_DELAY_MS / 1000)
+wallet_transaction_writer = BatchWriter('wallet_transactions', BATCH_WRITE_MAX_SIZE, BATCH_WRITE_MAX_DELAY_MS / 1000)
+
+# ============= Response Compression =============
+
+COMPRESSION_MIN_SIZE = int(os.environ.get('COMPRESSION_MIN_SIZE', '1024'))  # bytes
+COMPRESSION_TYPES = set(os.environ.get(
+    'COMPRESSION_TYPES',
+    'application/json,text/html,text/plain,text/css,text/xml,application/xml,'
+    'application/rss+xml,application/javascript,image/svg+xml'
+).split(','))
+GZIP_LEVEL = int(os.environ.get('GZIP_LEVEL', '6'))
+BROTLI_QUALITY = int(os.environ.get('BROTLI_QUALITY', '4'))
+# Snapshots are compressed once per change, so they can afford denser settings
+SNAPSHOT_GZIP_LEVEL = int(os.environ.get('SNAPSHOT_GZIP_LEVEL', '9'))
+SNAPSHOT_BROTLI_QUALITY = int(os.environ.get('SNAPSHOT_BROTLI_QUALITY', '9'))
+
+try:
+    import brotli
+except ImportError:  # optional; gzip only without it
+    brotli = None
+
+def available_encodings() -> List[str]:
+    return ['br', 'gzip'] if brotli else ['gzip']
+
+def accepted_encoding(accept_encoding: str) -> Optional[str]:
+    """Pick the preferred encoding (br, then gzip) allowed by an Accept-Encoding header"""
+    accepted = {}
+    for part in accept_encoding.lower().split(','):
+        name, _, params = part.partition(';')
+        q = 1.0
+        params = params.strip()
+        if params.startswith('q='):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        accepted[name.strip()] = q
+    wildcard = accepted.get('*', 0)
+    for encoding in available_encodings():
+        if accepted.get(encoding, wildcard) > 0:
+            return encoding
+    return None
+
+def compress_body(body: bytes, encoding: str, snapshot: bool = False) -> bytes:
+    if encoding == 'br':
+        return brotli.compress(body, quality=SNAPSHOT_BROTLI_QUALITY if snapshot else BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=SNAPSHOT_GZIP_LEVEL if snapshot else GZIP_LEVEL, mtime=0)
+
+class StreamCompressor:
+    """Incremental br/gzip compressor for streamed response bodies"""
+    
+    def __init__(self, encoding: str):
+        if encoding == 'br':
+            compressor = brotli.Compressor(quality=BROTLI_QUALITY)
+            self.compress, self.finish = compressor.process, compressor.finish
+        else:
+            compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 31)  # 31: gzip container
+            self.compress, self.finish = compressor.compress, compressor.flush
+
+def is_compressible(headers: MutableHeaders) -> bool:
+    content_type = headers.get('content-type', '').split(';', 1)[0].strip()
+    return content_type in COMPRESSION_TYPES
+
+class CompressionMiddleware:
+    """
+    Compresses responses with brotli or gzip, per Accept-Encoding.
+    Only allowlisted content types of at least COMPRESSION_MIN_SIZE bytes
+    are compressed (streamed bodies always are); responses that already
+    carry a Content-Encoding, such as pre-compressed snapshots, pass
+    through untouched.
+    """
+    
+    def __init__(self, app, minimum_size: int = COMPRESSION_MIN_SIZE):
+        self.app = app
+        self.minimum_size = minimum_size
+    
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+        
+        encoding = None
+        for key, value in scope['headers']:
+            if key == b'accept-encoding':
+                encoding = accepted_encoding(value.decode('latin-1'))
+                break
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        
+        start_message = None
+        compressor = None
+        passthrough = False
+        
+        async def send_compressed(message):
+            nonlocal start_message, compressor, passthrough
+            if message['type'] == 'http.response.start':
+                start_message = message
+                return
+            if message['type'] != 'http.response.body' or passthrough:
+                await send(message)
+                return
+            
+            body = message.get('body', b'')
+            more_body = message.get('more_body', False)
+            if compressor is None:
+                headers = MutableHeaders(raw=list(start_message['headers']))
+                compressible = is_compressible(headers)
+                if compressible and 'accept-encoding' not in headers.get('vary', '').lower():
+                    headers.add_vary_header('Accept-Encoding')
+                if (not compressible or 'content-encoding' in headers
+                        or start_message['status'] in (204, 304)
+                        or (not more_body and len(body) < self.minimum_size)):
+                    passthrough = True
+                    await send({**start_message, 'headers': headers.raw})
+                    await send(message)
+                    return
+                
+                headers['Content-Encoding'] = encoding
+                etag = headers.get('etag')
+                if etag and not etag.startswith('W/'):
+                    headers['ETag'] = f'W/{etag}'
+                if not more_body:
+                    body = compress_body(body, encoding)
+                    headers['Content-Length'] = str(len(body))
+                    passthrough = True
+                    await send({**start_message, 'headers': headers.raw})
+                    await send({'type': 'http.response.body', 'body': body})
+                    return
+                
+                if 'content-length' in headers:
+                    del headers['Content-Length']
+                compressor = StreamCompressor(encoding)
+                await send({**start_message, 'headers': headers.raw})
+            
+            data = compressor.compress(body)
+            if not more_body:
+                data += compressor.finish()
+            if data or not more_body:
+                await send({'type': 'http.response.body', 'body': data, 'more_body': more_body})
+        
+        await self.app(scope, receive, send_compressed)
+
+# ============= Cache Helpers =============
+
+class TTLCache:
+    """Small LRU cache whose entries expire after ttl seconds"""
+    
+    def __init__(self, maxsize: int = 1024, ttl: float = 300):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict = OrderedDict()
+    
+    def get(self, key, default=None):
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._data[key]
+            return default
+        self._data.move_to_end(key)
+        return value
+    
+    def set(self, key, value):
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+    
+    def pop(self, key, default=None):
+        entry = self._data.pop(key, None)
+        return entry[1] if entry else default
+    
+    def clear(self):
+        self._data.clear()
+    
+    def __len__(self):
+        return len(self._data)
+
+def _json_default(obj):
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode='json')
+    return str(obj)
+
+def encode_json(data) -> bytes:
+    """Serialize to compact JSON bytes with orjson's C encoder"""
+    return orjson.dumps(data, default=_json_default, option=orjson.OPT_NON_STR_KEYS)
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSONResponse rendered by orjson.
+    Return it directly from list endpoints so FastAPI skips jsonable_encoder;
+    bytes content is assumed to be encoded JSON already and sent as is.
+    """
+    
+    def render(self, content) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        return encode_json(content)
+
+class Snapshot:
+    """
+    Pre-encoded payload with an ETag and Last-Modified, kept until
+    invalidated. Compressed variants are built alongside the raw bytes,
+    so compression is paid once per change, not once per request.
+    """
+    
+    media_type = 'application/json'
+    
+    def __init__(self):
+        self.body: Optional[bytes] = None
+        self.etag: Optional[str] = None
+        self.last_modified: Optional[datetime] = None
+        self.variants: Dict[str, bytes] = {}
+        self.headers: Dict[str, str] = {}
+        self.version = 0  # bumped on every invalidation
+    
+    async def store(self, body: bytes, headers: Optional[Dict[str, str]] = None, version: Optional[int] = None):
+        """Cache body; with `version`, only if the snapshot has not been invalidated since"""
+        variants = {}
+        if len(body) >= COMPRESSION_MIN_SIZE:
+            encodings = available_encodings()
+            compressed = await asyncio.gather(*[
+                asyncio.to_thread(compress_body, body, encoding, True) for encoding in encodings
+            ])
+            variants = dict(zip(encodings, compressed))
+        if version is not None and version != self.version:
+            return
+        self.body = body
+        self.variants = variants
+        self.headers = headers or {}
+        self.etag = f'"{hashlib.sha1(body).hexdigest()[:20]}"'
+        self.last_modified = datetime.now(timezone.utc).replace(microsecond=0)
+    
+    def invalidate(self):
+        self.body = None
+        self.etag = None
+        self.variants = {}
+        self.version += 1
+    
+    def not_modified(self, request: Request, etag: str) -> bool:
+        if_none_match = request.headers.get('if-none-match')
+        if if_none_match is not None:
+            return if_none_match == etag
+        if_modified_since = request.headers.get('if-modified-since')
+        if if_modified_since:
+            try:
+                return self.last_modified <= parsedate_to_datetime(if_modified_since)
+            except (TypeError, ValueError):
+                return False
+        return False
+    
+    def cached_response(self, request: Request) -> Response:
+        body, etag = self.body, self.etag
+        headers = {
+            **self.headers,
+            'Cache-Control': 'no-cache',
+            'Vary': 'Accept-Encoding',
+            'Last-Modified': format_datetime(self.last_modified, usegmt=True)
+        }
+        encoding = accepted_encoding(request.headers.get('accept-encoding', ''))
+        if encoding in self.variants:
+            body = self.variants[encoding]
+            etag = f'{etag[:-1]}-{encoding}"'
+        headers['ETag'] = etag
+        if self.not_modified(request, etag):
+            return Response(status_code=304, headers=headers)
+        if body is not self.body:
+            headers['Content-Encoding'] = encoding
+        return Response(content=body, media_type=self.media_type, headers=headers)
+
+class JSONSnapshot(Snapshot):
+    """
+    Snapshot of the JSON-encoded result of `builder`, built on first use,
+    so serving it costs no database or serialization work.
+    """
+    
+    def __init__(self, builder, headers=None):
+        super().__init__()
+        self.builder = builder
+        self.headers_for = headers  # optional headers(data) -> dict, sent with the payload
+        self._lock = asyncio.Lock()
+    
+    async def refresh(self) -> tuple:
+        """Build and cache the payload, unless invalidated while building; returns (body, headers)"""
+        version = self.version
+        data = await self.builder()
+        body = encode_json(data)
+        headers = self.headers_for(data) if self.headers_for else None
+        await self.store(body, headers, version=version)
+        return body, headers
+    
+    async def response(self, request: Request) -> Response:
+        if self.body is None:
+            async with self._lock:
+                if self.body is None:
+                    body, headers = await self.refresh()
+                    if self.body is None:
+                        # Invalidated mid-build: serve this copy but don't cache it
+                        return Response(content=body, media_type=self.media_type,
+                                        headers={**(headers or {}), 'Cache-Control': 'no-cache'})
+        return self.cached_response(request)
+
+class StreamedSnapshot(Snapshot):
+    """
+    Snapshot of a document produced chunk by chunk by `producer`, an async
+    generator of bytes. A request that finds no cached copy is streamed the
+    chunks as they are generated; the result is cached unless the snapshot
+    was invalidated meanwhile.
+    """
+    
+    def __init__(self, producer, media_type: str):
+        super().__init__()
+        self.producer = producer
+        self.media_type = media_type
+        self._store_task: Optional[asyncio.Task] = None
+    
+    async def response(self, request: Request) -> Response:
+        if self.body is not None:
+            return self.cached_response(request)
+        
+        version = self.version
+        
+        async def stream():
+            chunks = []
+            async for chunk in self.producer():
+                chunks.append(chunk)
+                yield chunk
+            if self.body is None:
+                # Compressing the variants should not hold up this response
+                self._store_task = asyncio.create_task(self.store(b''.join(chunks), version=version))
+        
+        return StreamingResponse(stream(), media_type=self.media_type, headers={'Cache-Control': 'no-cache'})
+
+# ============= Cache Invalidation =============
+
+CACHE_WATCHED_COLLECTIONS = [
+    'products', 'categories', 'coupons', 'site_config',
+    'wallet_config', 'wallet_offers', 'users', 'serviceable_pincodes', 'blog_posts'
+]
+CACHE_POLL_INTERVAL = float(os.environ.get('CACHE_POLL_INTERVAL', '2'))  # seconds
+
+class InvalidationBus:
+    """
+    Fans out collection changes to in-process caches across workers.
+    Tails MongoDB change streams (resuming from the last token after
+    errors) when running against a replica set; otherwise polls the
+    per-collection counters in cache_versions, bumped by notify().
+    """
+    
+    def __init__(self, collections: List[str]):
+        self.collections = collections
+        self.mode: Optional[str] = None  # change_stream or polling
+        self._handlers: Dict[str, list] = defaultdict(list)
+        self._resume_tokens: Dict[str, Any] = {}
+        self._versions: Dict[str, int] = {}
+        self._tasks: List[asyncio.Task] = []
+    
+    def register(self, collection: str, handler):
+        """Register handler(collection), sync or async, to run when collection changes"""
+        self._handlers[collection].append(handler)
+    
+    async def invalidate(self, collection: str):
+        for handler in self._handlers.get(collection, []):
+            try:
+                result = handler(collection)
+                if asyncio.iscoroutine(result):
+                    await result
+            except Exception as e:
+                logger.error(f"Cache invalidation for {collection} failed: {str(e)}")
+    
+    async def notify(self, collection: str):
+        """Called after writing to a watched collection"""
+        await self.invalidate(collection)
+        if self.mode == 'polling':
+            doc = await db.cache_versions.find_one_and_update(
+                {'collection': collection},
+                {'$inc': {'version': 1}},
+                upsert=True,
+                return_document=ReturnDocument.AFTER
+            )
+            self._versions[collection] = doc['version']
+    
+    async def start(self):
+        if self._tasks:
+            return
+        if await self._supports_change_streams():
+            self.mode = 'change_stream'
+            for collection in self.collections:
+                self._tasks.append(asyncio.create_task(self._watch(collection)))
+        else:
+            self.mode = 'polling'
+            await self._check_versions(initial=True)
+            self._tasks.append(asyncio.create_task(self._poll()))
+        logger.info(f"Cache invalidation bus started ({self.mode})")
+    
+    async def close(self):
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self.mode = None
+    
+    async def _supports_change_streams(self) -> bool:
+        try:
+            hello = await client.admin.command('hello')
+        except Exception:
+            return False
+        return 'setName' in hello or hello.get('msg') == 'isdbgrid'
+    
+    async def _watch(self, collection: str):
+        while True:
+            try:
+                resume_after = self._resume_tokens.get(collection)
+                async with db[collection].watch(resume_after=resume_after) as stream:
+                    async for _ in stream:
+                        self._resume_tokens[collection] = stream.resume_token
+                        await self.invalidate(collection)
+            except asyncio.CancelledError:
+                raise
+            except OperationFailure as e:
+                # Resume point fell off the oplog: drop it and assume everything changed
+                logger.error(f"Change stream on {collection} failed: {str(e)}")
+                self._resume_tokens.pop(collection, None)
+                await self.invalidate(collection)
+                await asyncio.sleep(1)
+            except Exception as e:
+                logger.error(f"Change stream on {collection} interrupted: {str(e)}")
+                await asyncio.sleep(1)
+    
+    async def _check_versions(self, initial: bool = False):
+        docs = await db.cache_versions.find(
+            {'collection': {'$in': self.collections}},
+            {'_id': 0}
+        ).to_list(None)
+        for doc in docs:
+            collection = doc['collection']
+            if self._versions.get(collection) != doc['version']:
+                self._versions[collection] = doc['version']
+                if not initial:
+                    await self.invalidate(collection)
+    
+    async def _poll(self):
+        while True:
+            await asyncio.sleep(CACHE_POLL_INTERVAL)
+            try:
+                await self._check_versions()
+            except Exception as e:
+                logger.error(f"Cache version polling failed: {str(e)}")
+
+invalidation_bus = InvalidationBus(CACHE_WATCHED_COLLECTIONS)
+
+# ============= Address Index =============
+
+# India Post's All India Pincode Directory, rebuilt with data/build_pincodes.py
+ADDRESS_INDEX_PATH = os.environ.get('ADDRESS_INDEX_PATH', str(ROOT_DIR / 'data' / 'pincodes.csv.gz'))
+
+def normalize_query(query: str) -> str:
+    return ' '.join(query.lower().replace(',', ' ').split())
+
+class AddressIndex:
+    """
+    Offline pincode/locality index for address autocomplete.
+    Every pincode and every word-suffix of a locality or district name is
+    stored in one sorted key list; a query is answered by binary searching
+    for its prefix and scanning the matching run.
+    """
+    
+    def __init__(self):
+        self._records: List[tuple] = []  # (pincode, locality, district, state)
+        self._keys: List[str] = []
+        self._ids = array('I')
+    
+    def load(self, path: str):
+        """Load a CSV (optionally gzipped) with pincode,locality,district,state columns"""
+        records = []
+        opener = gzip.open if path.endswith('.gz') else open
+        try:
+            with opener(path, 'rt', newline='', encoding='utf-8') as f:
+                for row in csv.DictReader(f):
+                    records.append((
+                        row['pincode'].strip(),
+                        row['locality'].strip(),
+                        row['district'].strip(),
+                        row['state'].strip()
+                    ))
+        except FileNotFoundError:
+            logger.warning(f"Address index file not found: {path}")
+        self.build(records)
+    
+    def build(self, records: List[tuple]):
+        entries = []
+        for record_id, (pincode, locality, district, _) in enumerate(records):
+            terms = {pincode}
+            for text in (locality, district):
+                words = normalize_query(text).split()
+                for i in range(len(words)):
+                    terms.add(' '.join(words[i:]))
+            entries.extend((term, record_id) for term in terms)
+        entries.sort()
+        
+        self._records = records
+        self._keys = [term for term, _ in entries]
+        self._ids = array('I', (record_id for _, record_id in entries))
+    
+    def search(self, query: str, limit: int = 5) -> list:
+        prefix = normalize_query(query)
+        if not prefix:
+            return []
+        
+        results = []
+        seen = set()
+        pos = bisect_left(self._keys, prefix)
+        while pos < len(self._keys) and self._keys[pos].startswith(prefix):
+            record_id = self._ids[pos]
+            pos += 1
+            if record_id in seen:
+                continue
+            seen.add(record_id)
+            results.append(self._suggestion(record_id))
+            if len(results) >= limit:
+                break
+        return results
+    
+    def _suggestion(self, record_id: int) -> dict:
+        pincode, locality, district, state = self._records[record_id]
+        parts = [locality] if locality == district else [locality, district]
+        return {
+            'description': f"{', '.join(parts)}, {state} {pincode}",
+            'place_id': f"pin-{pincode}-{record_id}",
+            'lat': '',
+            'lon': '',
+            'pincode': pincode
+        }
+    
+    def __len__(self):
+        return len(self._records)
+
+address_index = AddressIndex()
+
+# ============= Admin Stats Counters =============
+
+REVENUE_STATUSES = ['accepted', 'on_the_way', 'in_progress', 'completed']
+STATS_RECONCILE_INTERVAL = int(os.environ.get('STATS_RECONCILE_INTERVAL', '3600'))  # seconds
+
+async def bump_admin_stats(**deltas):
+    """Apply incremental changes to the admin stats document"""
+    deltas = {k: v for k, v in deltas.items() if v}
+    if deltas:
+        await db.admin_stats.update_one({'key': 'global'}, {'$inc': deltas}, upsert=True)
+
+async def reconcile_admin_stats() -> dict:
+    """Recompute the admin stats from scratch to correct any drift"""
+    total_bookings = await db.bookings.count_documents({})
+    total_users = await db.users.count_documents({'role': 'user'})
+    total_revenue = await db.bookings.aggregate([
+        {'$match': {'status': {'$in': REVENUE_STATUSES}}},
+        {'$group': {'_id': None, 'total': {'$sum': '$amount'}}}
+    ]).to_list(1)
+    total_wallet = await db.users.aggregate([
+        {'$group': {'_id': None, 'total': {'$sum': '$wallet_balance'}}}
+    ]).to_list(1)
+    
+    stats = {
+        'total_bookings': total_bookings,
+        'total_users': total_users,
+        'total_revenue': total_revenue[0]['total'] if total_revenue else 0,
+        'total_wallet_balance': total_wallet[0]['total'] if total_wallet else 0
+    }
+    await db.admin_stats.update_one(
+        {'key': 'global'},
+        {'$set': {**stats, 'reconciled_at': datetime.now(timezone.utc)}},
+        upsert=True
+    )
+    return stats
+
+async def reconcile_admin_stats_periodically():
+    while True:
+        try:
+            await reconcile_admin_stats()
+        except Exception as e:
+            logger.error(f"Admin stats reconciliation failed: {str(e)}")
+        await asyncio.sleep(STATS_RECONCILE_INTERVAL)
+
+# ============= Booking Rollups =============
+
+def rollup_bucket(booking: dict) -> str:
+    return f"{booking.get('category_id') or 'none'}|{booking.get('professional_id') or 'none'}|{booking['status']}"
+
+def rollup_date(booking: dict) -> str:
+    created_at = booking['created_at']
+    if isinstance(created_at, datetime):
+        return to_utc(created_at).date().isoformat()
+    return created_at[:10]
+
+async def add_booking_to_rollup(booking: dict):
+    """Count a new booking in its daily rollup bucket"""
+    bucket = rollup_bucket(booking)
+    await db.booking_rollups.update_one(
+        {'date': rollup_date(booking)},
+        {'$inc': {
+            f'buckets.{bucket}.bookings': 1,
+            f'buckets.{bucket}.revenue': booking['amount'],
+            'epoch': 1
+        }},
+        upsert=True
+    )
+
+async def update_booking_rollup(booking: dict, changes: dict):
+    """Move a booking between rollup buckets after its status or professional changes"""
+    old_bucket = rollup_bucket(booking)
+    new_bucket = rollup_bucket({**booking, **changes})
+    if old_bucket == new_bucket:
+        return
+    await db.booking_rollups.update_one(
+        {'date': rollup_date(booking)},
+        {'$inc': {
+            f'buckets.{old_bucket}.bookings': -1,
+            f'buckets.{old_bucket}.revenue': -booking['amount'],
+            f'buckets.{new_bucket}.bookings': 1,
+            f'buckets.{new_bucket}.revenue': booking['amount'],
+            'epoch': 1
+        }},
+        upsert=True
+    )
+
+ROLLUP_BACKFILL_RETRIES = 3
+
+async def scan_rollup_days(query: dict, product_categories: dict, chunk_size: int) -> tuple:
+    """
+    Count the bookings matching query into per-day buckets, reading
+    chunk_size at a time in _id order. Bookings from before category_id was
+    stored get it from their product, in memory and in the collection, so
+    later update_booking_rollup() calls move them out of the same bucket.
+    """
+    days = defaultdict(lambda: defaultdict(lambda: {'bookings': 0, 'revenue': 0}))
+    projection = {'_id': 1, 'product_id': 1, 'category_id': 1, 'professional_id': 1, 'status': 1, 'amount': 1, 'created_at': 1}
+    last_id = None
+    processed = 0
+    while True:
+        chunk_query = {**query, '_id': {'$gt': last_id}} if last_id is not None else query
+        chunk = await db.bookings.find(chunk_query, projection).sort('_id', 1).limit(chunk_size).to_list(chunk_size)
+        if not chunk:
+            break
+        categorized = []
+        for booking in chunk:
+            if not booking.get('category_id'):
+                booking['category_id'] = product_categories.get(booking.get('product_id'))
+                if booking['category_id']:
+                    categorized.append(UpdateOne(
+                        {'_id': booking['_id'], 'category_id': {'$in': [None, '']}},
+                        {'$set': {'category_id': booking['category_id']}}
+                    ))
+            bucket = days[rollup_date(booking)][rollup_bucket(booking)]
+            bucket['bookings'] += 1
+            bucket['revenue'] += booking.get('amount', 0)
+        if categorized:
+            await db.bookings.bulk_write(categorized, ordered=False)
+        processed += len(chunk)
+        last_id = chunk[-1]['_id']
+    return days, processed
+
+async def rollup_epochs(dates: Optional[List[str]] = None) -> Dict[str, Optional[int]]:
+    query = {'date': {'$in': dates}} if dates is not None else {}
+    docs = await db.booking_rollups.find(query, {'_id': 0, 'date': 1, 'epoch': 1}).to_list(None)
+    return {doc['date']: doc.get('epoch') for doc in docs}
+
+async def write_rollup_days(dates: List[str], days: dict, epochs: dict) -> List[str]:
+    """
+    Set the recomputed buckets of `dates` in one bulk write, each guarded by
+    the epoch read before counting. Returns the dates an $inc touched in the
+    meantime, which need counting again.
+    """
+    ops = []
+    for date in dates:
+        buckets = days.get(date)
+        if date in epochs:
+            guard = {'date': date, 'epoch': epochs[date]}
+            ops.append(UpdateOne(guard, {'$set': {'buckets': buckets}}) if buckets else DeleteOne(guard))
+        elif buckets:
+            ops.append(UpdateOne({'date': date}, {'$setOnInsert': {'buckets': buckets}}, upsert=True))
+    if ops:
+        await db.booking_rollups.bulk_write(ops, ordered=False)
+    current = await rollup_epochs(dates)
+    return [date for date, epoch in current.items() if epoch != epochs.get(date)]
+
+async def backfill_booking_rollups(chunk_size: int = 1000) -> int:
+    """
+    Rebuild all daily rollups from the bookings collection while bookings
+    keep coming in. Every $inc on a rollup also bumps its epoch, so a day
+    is only overwritten if no booking touched it since it was counted;
+    days that were touched are counted again.
+    """
+    products = await db.products.find({}, {'_id': 0, 'id': 1, 'category_id': 1}).to_list(None)
+    product_categories = {p['id']: p.get('category_id') for p in products}
+    
+    epochs = await rollup_epochs()
+    days, processed = await scan_rollup_days({}, product_categories, chunk_size)
+    stale = await write_rollup_days(sorted(set(days) | set(epochs)), days, epochs)
+    
+    for _ in range(ROLLUP_BACKFILL_RETRIES):
+        if not stale:
+            break
+        epochs = await rollup_epochs(stale)
+        days = {}
+        for date in stale:
+            start = datetime.fromisoformat(date).replace(tzinfo=timezone.utc)
+            query = date_range('created_at', start, start + timedelta(days=1))
+            day, _ = await scan_rollup_days(query, product_categories, chunk_size)
+            days.update(day)
+        stale = await write_rollup_days(stale, days, epochs)
+    
+    if stale:
+        logger.warning(f"Booking rollups kept changing during backfill, rerun it for: {', '.join(stale)}")
+    return processed
+
+async def backfill_booking_products(chunk_size: int = 1000) -> int:
+    """
+    Embed product snapshots in bookings created before create_order stored
+    them. Bookings whose product has since been deleted get product: None.
+    Only bookings without the field are touched, so it can be rerun or resumed.
+    """
+    snapshots = {
+        product['id']: ProductSnapshot(**product).model_dump()
+        async for product in db.products.find({}, {'_id': 0})
+    }
+    
+    last_id = None
+    updated = 0
+    while True:
+        query = {'product': {'$exists': False}}
+        if last_id is not None:
+            query['_id'] = {'$gt': last_id}
+        chunk = await db.bookings.find(query, {'_id': 1, 'product_id': 1}).sort('_id', 1).limit(chunk_size).to_list(chunk_size)
+        if not chunk:
+            break
+        await db.bookings.bulk_write([
+            UpdateOne(
+                {'_id': booking['_id'], 'product': {'$exists': False}},
+                {'$set': {'product': snapshots.get(booking.get('product_id'))}}
+            )
+            for booking in chunk
+        ], ordered=False)
+        updated += len(chunk)
+        last_id = chunk[-1]['_id']
+    return updated
+
+# ============= Date Storage =============
+
+# Timestamps are stored as BSON dates. Until migrate_dates() has run, older
+# documents may still hold ISO strings; with DATES_DUAL_READ on, range
+# queries match both. In a descending sort every date comes before every
+# string, which is also chronological since all strings predate the switch.
+DATES_DUAL_READ = os.environ.get('DATES_DUAL_READ', 'true').lower() == 'true'
+DATE_MIGRATION_PAUSE = float(os.environ.get('DATE_MIGRATION_PAUSE_MS', '0')) / 1000  # between chunks
+DATE_MIGRATION_STOP_MARGIN = 10  # seconds of request budget kept back to report progress
+
+DATE_FIELDS = {
+    'bookings': ['created_at', 'started_at', 'completed_at'],
+    'wallet_transactions': ['created_at'],
+    'email_logs': ['created_at'],
+    'coupons': ['created_at', 'expiry_date'],
+    'wallet_offers': ['created_at'],
+    'blog_posts': ['created_at', 'updated_at'],
+    'users': ['created_at'],
+    'serviceable_pincodes': ['created_at'],
+    'site_config': ['updated_at'],
+    'admin_stats': ['reconciled_at'],
+}
+
+# Indexes behind the newest-first lists and date-range queries
+DATE_INDEXES = {
+    'bookings': [[('created_at', -1)], [('user_id', 1), ('created_at', -1)]],
+    'wallet_transactions': [[('user_id', 1), ('created_at', -1)]],
+    'email_logs': [[('created_at', -1)]],
+    'blog_posts': [[('published', 1), ('created_at', -1), ('id', -1)]],
+}
+
+def date_range(field: str, since: Optional[datetime] = None, until: Optional[datetime] = None) -> dict:
+    """Filter for since <= field < until, also matching unmigrated ISO strings while DATES_DUAL_READ is on"""
+    bounds = {}
+    if since:
+        bounds['$gte'] = to_utc(since)
+    if until:
+        bounds['$lt'] = to_utc(until)
+    if not bounds:
+        return {}
+    if not DATES_DUAL_READ:
+        return {field: bounds}
+    legacy = {op: value.isoformat() for op, value in bounds.items()}
+    return {'$or': [{field: bounds}, {field: legacy}]}
+
+async def ensure_indexes():
+    for collection, indexes in DATE_INDEXES.items():
+        for keys in indexes:
+            try:
+                await db[collection].create_index(keys)
+            except Exception as e:
+                logger.error(f"Creating index {keys} on {collection} failed: {str(e)}")
+
+async def migrate_collection_dates(collection: str, fields: List[str], chunk_size: int) -> dict:
+    """
+    Convert one collection's ISO string timestamps to BSON dates, chunk_size
+    documents at a time in _id order. Progress is checkpointed in the
+    migrations collection, so an interrupted run resumes where it stopped.
+    Each update only applies if the field still holds the string that was
+    read, so concurrent writes are never overwritten.
+    """
+    key = f'dates:{collection}'
+    state = await db.migrations.find_one({'id': key}, {'_id': 0}) or {'id': key, 'converted': 0, 'skipped': 0}
+    legacy = {'$or': [{field: {'$type': 'string'}} for field in fields]}
+    last_id = state.get('last_id')
+    
+    while not state.get('done'):
+        budget = remaining_budget()
+        if budget is not None and budget < DATE_MIGRATION_STOP_MARGIN:
+            break
+        query = {**legacy, '_id': {'$gt': last_id}} if last_id is not None else legacy
+        chunk = await db[collection].find(query, {'_id': 1, **{field: 1 for field in fields}}).sort('_id', 1).limit(chunk_size).to_list(chunk_size)
+        if not chunk:
+            state['done'] = True
+            state['finished_at'] = datetime.now(timezone.utc)
+            await db.migrations.update_one({'id': key}, {'$set': state}, upsert=True)
+            break
+        
+        updates = []
+        for doc in chunk:
+            for field in fields:
+                value = doc.get(field)
+                if not isinstance(value, str):
+                    continue
+                try:
+                    parsed = as_datetime(value)
+                except ValueError:
+                    state['skipped'] += 1
+                    continue
+                updates.append(UpdateOne({'_id': doc['_id'], field: value}, {'$set': {field: parsed}}))
+        if updates:
+            await db[collection].bulk_write(updates, ordered=False)
+        
+        last_id = chunk[-1]['_id']
+        state['last_id'] = last_id
+        state['converted'] += len(updates)
+        await db.migrations.update_one({'id': key}, {'$set': state}, upsert=True)
+        if DATE_MIGRATION_PAUSE:
+            await asyncio.sleep(DATE_MIGRATION_PAUSE)
+    
+    return {
+        'converted': state['converted'],
+        'skipped': state['skipped'],
+        'done': bool(state.get('done'))
+    }
+
+async def migrate_dates(chunk_size: int = 1000, restart: bool = False) -> dict:
+    """
+    Convert ISO string timestamps in every DATE_FIELDS collection. Safe to run
+    while the app serves traffic; rerun until done, then set DATES_DUAL_READ=false.
+    restart=True clears checkpoints to pick up strings written by older workers.
+    """
+    if restart:
+        await db.migrations.delete_many({'id': {'$regex': '^dates:'}})
+    progress = {}
+    for collection, fields in DATE_FIELDS.items():
+        progress[collection] = await migrate_collection_dates(collection, fields, chunk_size)
+        if not progress[collection]['done']:
+            break
+    return progress
+
+# ============= Serviceability =============
+
+# Off: every pincode is served. On: orders need a pincode in the configured
+# list, and an empty list serves nowhere.
+SERVICEABILITY_CHECK_ENABLED = os.environ.get('SERVICEABILITY_CHECK_ENABLED', 'false').lower() == 'true'
+
+class PincodeSet:
+    """Bitmap over the 6-digit pincode space (125 KB) with O(1) membership"""
+    
+    def __init__(self):
+        self._bits = bytearray(1000000 // 8)
+        self._count = 0
+    
+    @staticmethod
+    def parse(pincode: Optional[str]) -> Optional[int]:
+        pincode = (pincode or '').strip()
+        if len(pincode) != 6 or not pincode.isdigit() or pincode[0] == '0':
+            return None
+        return int(pincode)
+    
+    def __contains__(self, pincode: str) -> bool:
+        value = self.parse(pincode)
+        if value is None:
+            return False
+        return bool(self._bits[value >> 3] & (1 << (value & 7)))
+    
+    def add(self, pincode: str):
+        value = self.parse(pincode)
+        if value is not None and pincode not in self:
+            self._bits[value >> 3] |= 1 << (value & 7)
+            self._count += 1
+    
+    def discard(self, pincode: str):
+        value = self.parse(pincode)
+        if value is not None and pincode in self:
+            self._bits[value >> 3] &= ~(1 << (value & 7)) & 0xFF
+            self._count -= 1
+    
+    def replace(self, pincodes: List[str]):
+        self._bits = bytearray(len(self._bits))
+        self._count = 0
+        for pincode in pincodes:
+            self.add(pincode)
+    
+    def __len__(self):
+        return self._count
+
+serviceable_pincodes = PincodeSet()
+
+async def load_serviceable_pincodes():
+    docs = await db.serviceable_pincodes.find({}, {'_id': 0, 'pincode': 1}).to_list(None)
+    serviceable_pincodes.replace([doc['pincode'] for doc in docs])
+
+invalidation_bus.register('serviceable_pincodes', lambda _: load_serviceable_pincodes())
+
+def is_serviceable(pincode: Optional[str]) -> bool:
+    if not SERVICEABILITY_CHECK_ENABLED:
+        return True
+    return pincode in serviceable_pincodes
+
+# ============= Nominatim Client =============
+
+NOMINATIM_URL = os.environ.get('NOMINATIM_URL', 'https://nominatim.openstreetmap.org/search')
+NOMINATIM_TIMEOUT = float(os.environ.get('NOMINATIM_TIMEOUT', '3'))
+NOMINATIM_MIN_INTERVAL = float(os.environ.get('NOMINATIM_MIN_INTERVAL', '1'))  # usage policy: max 1 req/sec, across all workers
+NOMINATIM_POOL_SIZE = int(os.environ.get('NOMINATIM_POOL_SIZE', '10'))
+
+class NominatimClient:
+    """
+    Long-lived Nominatim client for address autocomplete.
+    Reuses one pooled session, caches results per normalized query,
+    coalesces identical in-flight queries and spaces upstream requests
+    to respect Nominatim's rate limit. The spacing is shared by every
+    worker and host through a slot document in Mongo.
+    """
+    
+    def __init__(self, cache_size: int = 2048, cache_ttl: float = 24 * 3600):
+        self.cache = TTLCache(cache_size, cache_ttl)
+        self.pool_size = NOMINATIM_POOL_SIZE
+        self._session = None  # aiohttp.ClientSession
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._rate_lock = asyncio.Lock()
+    
+    async def start(self):
+        if self._session is None:
+            import aiohttp
+            self._session = aiohttp.ClientSession(
+                headers={'User-Agent': 'Intowns-App/1.0'},
+                timeout=aiohttp.ClientTimeout(total=NOMINATIM_TIMEOUT, connect=NOMINATIM_TIMEOUT / 2),
+                connector=aiohttp.TCPConnector(limit=self.pool_size, ttl_dns_cache=300, keepalive_timeout=60)
+            )
+    
+    async def close(self):
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+    
+    async def search(self, query: str) -> list:
+        key = normalize_query(query)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+        
+        # Singleflight: share the upstream call between identical queries
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            return await asyncio.wait_for(asyncio.shield(inflight), remaining_budget())
+        
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            suggestions = await self._fetch(key)
+            self.cache.set(key, suggestions)
+            future.set_result(suggestions)
+            return suggestions
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # consumed here; avoids "never retrieved" warnings
+            raise
+        except asyncio.CancelledError:
+            # The leading request ran out of time; don't leave followers waiting on it
+            future.set_exception(DeadlineExceeded("Nominatim lookup cancelled"))
+            future.exception()
+            raise
+        finally:
+            del self._inflight[key]
+    
+    async def _wait_for_slot(self):
+        async with self._rate_lock:
+            delay = await self._reserve_slot() - time.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+    
+    async def _reserve_slot(self) -> float:
+        """
+        Claim the next free upstream slot (a unix time) by compare-and-set
+        on the shared slot document. Raises DeadlineExceeded, without
+        claiming, when that slot comes after the request deadline.
+        """
+        while True:
+            state = await db.upstream_slots.find_one({'_id': 'nominatim'})
+            next_free = state['next_at'] if state else 0.0
+            now = time.time()
+            slot = max(next_free, now)
+            remaining = remaining_budget()
+            if remaining is not None and slot - now >= remaining:
+                raise DeadlineExceeded("No Nominatim slot before the request deadline")
+            try:
+                result = await db.upstream_slots.update_one(
+                    {'_id': 'nominatim', 'next_at': next_free},
+                    {'$set': {'next_at': slot + NOMINATIM_MIN_INTERVAL}},
+                    upsert=state is None
+                )
+            except DuplicateKeyError:
+                continue  # another worker created the document first
+            if state is None or result.modified_count:
+                return slot
+    
+    async def _fetch(self, query: str) -> list:
+        await self.start()
+        await self._wait_for_slot()
+        params = {
+            'q': query,
+            'format': 'json',
+            'addressdetails': '1',
+            'limit': '5',
+            'countrycodes': 'in'
+        }
+        import aiohttp
+        timeout = aiohttp.ClientTimeout(total=remaining_budget(NOMINATIM_TIMEOUT), connect=NOMINATIM_TIMEOUT / 2)
+        with observe_outbound('nominatim', 'search'):
+            async with self._session.get(NOMINATIM_URL, params=params, timeout=timeout) as response:
+                if response.status != 200:
+                    raise RuntimeError(f"Nominatim returned HTTP {response.status}")
+                data = await response.json()
+        
+        return [
+            {
+                'description': item.get('display_name', ''),
+                'place_id': item.get('place_id', ''),
+                'lat': item.get('lat', ''),
+                'lon': item.get('lon', '')
+            }
+            for item in data
+        ]
+
+nominatim_client = NominatimClient()
+
 # ============= Wallet Helpers =============
 
-async def add_wallet_transaction(user_id: str, trans_type: str, amount: int, description: str, reference_id: Optional[str] = None):
-    """Helper function to add wallet transaction"""
+async def add_wallet_transaction(user_id: str, trans_type: str, amount: int, description: str, reference_id: Optional[str] = None, durable: bool = True):
+    """
+    Helper function to add wallet transaction
+    Ledger entries are acknowledged before returning unless durable=False
+    """
     user = await db.users.find_one({'id': user_id}, {'_id': 0})
     if not user:
         return
@@ -350,11 +2328,47 @@ async def add_wallet_transaction(user_id: str, trans_type: str, amount: int, des
     )
     
     trans_dict = transaction.model_dump()
-    trans_dict['created_at'] = trans_dict['created_at'].isoformat()
-    await db.wallet_transactions.insert_one(trans_dict)
+    await wallet_transaction_writer.insert(trans_dict, wait=durable)
     
     return transaction
 
+async def debit_wallet_for_booking(user: dict, booking_id: str, wallet_used: int):
+    """Pay wallet_used from the welcome bonus first (up to its per-booking cap), then the regular balance"""
+    wallet_config = await get_wallet_config()
+    locked_used = 0
+    
+    user_locked = user.get('wallet_locked_balance', 0)
+    
+    # Calculate how much came from locked balance
+    if user_locked > 0:
+        locked_used = min(
+            user_locked,
+            wallet_config.welcome_bonus_max_deduction,
+            wallet_used
+        )
+    
+    regular_used = wallet_used - locked_used
+    
+    # Update user wallet
+    update_data = {}
+    if locked_used > 0:
+        update_data['wallet_locked_balance'] = user_locked - locked_used
+    if regular_used > 0:
+        update_data['wallet_balance'] = user.get('wallet_balance', 0) - regular_used
+    
+    if update_data:
+        await db.users.update_one({'id': user['id']}, {'$set': update_data})
+        await bump_admin_stats(total_wallet_balance=-regular_used)
+    
+    # Add transaction
+    await add_wallet_transaction(
+        user['id'],
+        'debit',
+        -wallet_used,
+        f"Used for booking #{booking_id[:8]}",
+        booking_id
+    )
+
 async def get_wallet_config():
     """Get wallet configuration"""
     config = await db.wallet_config.find_one({}, {'_id': 0})
@@ -362,6 +2376,7 @@ async def get_wallet_config():
         # Create default config
         default_config = WalletConfig()
         await db.wallet_config.insert_one(default_config.model_dump())
+        await invalidation_bus.notify('wallet_config')
         return default_config
     return WalletConfig(**config)
 
@@ -385,8 +2400,7 @@ async def send_system_email(to_email: str, subject: str, message: str, cc_email:
         status="sent"
     )
     email_data = email_log.model_dump()
-    email_data['created_at'] = email_data['created_at'].isoformat()
-    await db.email_logs.insert_one(email_data)
+    await email_log_writer.insert(email_data)
     
     if not mailtrap_token or not mailtrap_token.strip():
         # Log email if Mailtrap not configured
@@ -524,7 +2538,7 @@ Intowns.in Admin System
 
 # ============= Auth Routes =============
 
-@api_router.post("/auth/login")
+@api_router.post("/auth/login", dependencies=[Depends(RateLimit('login'))])
 async def username_password_login(credentials: UsernamePasswordLogin):
     """Simple username/password login for admin and employees"""
     # Hardcoded credentials (in production, use hashed passwords in DB)
@@ -539,7 +2553,7 @@ async def username_password_login(credentials: UsernamePasswordLogin):
                 'role': 'admin',
                 'wallet_balance': 0,
                 'wallet_locked_balance': 0,
-                'created_at': datetime.now(timezone.utc).isoformat()
+                'created_at': datetime.now(timezone.utc)
             }
         },
         'rajni': {
@@ -552,7 +2566,7 @@ async def username_password_login(credentials: UsernamePasswordLogin):
                 'role': 'professional',
                 'wallet_balance': 0,
                 'wallet_locked_balance': 0,
-                'created_at': datetime.now(timezone.utc).isoformat()
+                'created_at': datetime.now(timezone.utc)
             }
         }
     }
@@ -588,17 +2602,17 @@ async def username_password_login(credentials: UsernamePasswordLogin):
     
     jwt_token = create_jwt_token(user_data)
     
-    return LoginResponse(token=jwt_token, user=User(**user_data))
+    return FastJSONResponse(LoginResponse(token=jwt_token, user=User(**user_data)))
 
 @api_router.get("/auth/google")
 async def google_login(request: Request):
     redirect_uri = request.url_for('google_callback')
-    return await oauth.google.authorize_redirect(request, redirect_uri)
+    return await get_oauth().google.authorize_redirect(request, redirect_uri)
 
 @api_router.get("/auth/google/callback")
 async def google_callback(request: Request):
     try:
-        token = await oauth.google.authorize_access_token(request)
+        token = await get_oauth().google.authorize_access_token(request)
         user_info = token.get('userinfo')
         
         if not user_info:
@@ -619,9 +2633,10 @@ async def google_callback(request: Request):
                 'role': 'user',
                 'wallet_balance': 0,
                 'wallet_locked_balance': 0,
-                'created_at': datetime.now(timezone.utc).isoformat()
+                'created_at': datetime.now(timezone.utc)
             }
             await db.users.insert_one(user_data)
+            await bump_admin_stats(total_users=1)
             
             # Add welcome bonus
             wallet_config = await get_wallet_config()
@@ -680,12 +2695,28 @@ async def create_category(category: CategoryCreate):
     cat_dict = category.model_dump()
     cat_obj = Category(**cat_dict)
     await db.categories.insert_one(cat_obj.model_dump())
+    await invalidation_bus.notify('categories')
     return cat_obj
 
 # ============= Product Routes =============
 
+# Pre-encoded product lists, one per filter combination
+product_list_snapshots = TTLCache(maxsize=256, ttl=3600)
+invalidation_bus.register('products', lambda _: product_list_snapshots.clear())
+
+def product_list_snapshot(query: dict) -> JSONSnapshot:
+    key = tuple(sorted(query.items()))
+    snapshot = product_list_snapshots.get(key)
+    if snapshot is None:
+        async def build():
+            return await db.products.find(query, {'_id': 0}).to_list(1000)
+        snapshot = JSONSnapshot(build)
+        product_list_snapshots.set(key, snapshot)
+    return snapshot
+
 @api_router.get("/products")
 async def get_products(
+    request: Request,
     category_id: Optional[str] = None,
     sub_category_id: Optional[str] = None,
     type: Optional[str] = None
@@ -697,8 +2728,7 @@ async def get_products(
         query['sub_category_id'] = sub_category_id
     if type:
         query['type'] = type
-    products = await db.products.find(query, {'_id': 0}).to_list(1000)
-    return products
+    return await product_list_snapshot(query).response(request)
 
 @api_router.get("/products/{product_id}")
 async def get_product(product_id: str):
@@ -712,6 +2742,7 @@ async def create_product(product: ProductCreate):
     prod_dict = product.model_dump()
     prod_obj = Product(**prod_dict)
     await db.products.insert_one(prod_obj.model_dump())
+    await invalidation_bus.notify('products')
     return prod_obj
 
 # ============= Coupon Routes =============
@@ -731,11 +2762,8 @@ async def create_coupon(coupon: CouponCreate):
     coupon_dict = coupon.model_dump()
     coupon_obj = Coupon(**coupon_dict)
     coupon_data = coupon_obj.model_dump()
-    if coupon_data.get('created_at'):
-        coupon_data['created_at'] = coupon_data['created_at'].isoformat()
-    if coupon_data.get('expiry_date'):
-        coupon_data['expiry_date'] = coupon_data['expiry_date'].isoformat()
     await db.coupons.insert_one(coupon_data)
+    await invalidation_bus.notify('coupons')
     return coupon_obj
 
 @api_router.post("/coupons/validate")
@@ -750,8 +2778,7 @@ async def validate_coupon(req: ValidateCouponRequest, user: dict = Depends(get_c
     
     # Check expiry
     if coupon.get('expiry_date'):
-        expiry = datetime.fromisoformat(coupon['expiry_date']) if isinstance(coupon['expiry_date'], str) else coupon['expiry_date']
-        if expiry < datetime.now(timezone.utc):
+        if as_datetime(coupon['expiry_date']) < datetime.now(timezone.utc):
             raise HTTPException(status_code=400, detail="Coupon has expired")
     
     # Check usage limit
@@ -788,6 +2815,8 @@ async def update_coupon(coupon_id: str, active: bool):
     )
     if result.matched_count == 0:
         raise HTTPException(status_code=404, detail="Coupon not found")
+    await invalidation_bus.notify('coupons')
+    
     return {'success': True}
 
 @api_router.delete("/coupons/{coupon_id}", dependencies=[Depends(require_admin)])
@@ -795,6 +2824,8 @@ async def delete_coupon(coupon_id: str):
     result = await db.coupons.delete_one({'id': coupon_id})
     if result.deleted_count == 0:
         raise HTTPException(status_code=404, detail="Coupon not found")
+    await invalidation_bus.notify('coupons')
+    
     return {'success': True}
 
 # ============= Wallet Routes =============
@@ -821,8 +2852,8 @@ async def get_wallet_offers():
 async def create_wallet_offer(offer: WalletOfferCreate):
     offer_obj = WalletOffer(**offer.model_dump())
     offer_data = offer_obj.model_dump()
-    offer_data['created_at'] = offer_data['created_at'].isoformat()
     await db.wallet_offers.insert_one(offer_data)
+    await invalidation_bus.notify('wallet_offers')
     return offer_obj
 
 @api_router.post("/wallet/topup")
@@ -838,11 +2869,7 @@ async def topup_wallet(req: WalletTopupRequest, user: dict = Depends(get_current
         cashback = offer['max_cashback']
     
     # Create Razorpay order for topup
-    razorpay_order = razorpay_client.order.create({
-        'amount': offer['amount'],
-        'currency': 'INR',
-        'payment_capture': 1
-    })
+    razorpay_order = await create_razorpay_order(offer['amount'])
     
     return {
         'razorpay_order_id': razorpay_order['id'],
@@ -868,7 +2895,7 @@ async def verify_topup(
     }
     
     try:
-        razorpay_client.utility.verify_payment_signature(params_dict)
+        get_razorpay_client().utility.verify_payment_signature(params_dict)
     except:
         raise HTTPException(status_code=400, detail="Payment verification failed")
     
@@ -889,6 +2916,7 @@ async def verify_topup(
         {'id': user['id']},
         {'$inc': {'wallet_balance': total_credit}}
     )
+    await bump_admin_stats(total_wallet_balance=total_credit)
     
     # Add transactions
     await add_wallet_transaction(
@@ -926,12 +2954,23 @@ async def get_wallet_config_route():
 async def update_wallet_config(config: WalletConfig):
     await db.wallet_config.delete_many({})
     await db.wallet_config.insert_one(config.model_dump())
+    await invalidation_bus.notify('wallet_config')
     return config
 
 # ============= Payment & Booking Routes =============
 
-@api_router.post("/orders/create")
+async def pick_professional() -> Optional[dict]:
+    """Professional auto-assigned to newly accepted bookings"""
+    return await db.professionals.find_one({'status': 'active'}, {'_id': 0})
+
+@api_router.post("/orders/create", dependencies=[Depends(RateLimit('create_order'))])
 async def create_order(req: CreateOrderRequest, user: dict = Depends(get_current_user)):
+    if SERVICEABILITY_CHECK_ENABLED:
+        if not (req.pincode or '').strip():
+            raise HTTPException(status_code=400, detail="Pincode is required")
+        if not is_serviceable(req.pincode):
+            raise HTTPException(status_code=400, detail="Sorry, we don't serve this pincode yet")
+    
     # Get product
     product = await db.products.find_one({'id': req.product_id}, {'_id': 0})
     if not product:
@@ -985,6 +3024,8 @@ async def create_order(req: CreateOrderRequest, user: dict = Depends(get_current
     booking = Booking(
         user_id=user['id'],
         product_id=req.product_id,
+        product=ProductSnapshot(**product),
+        category_id=product.get('category_id'),
         address=req.address,
         landmark=req.landmark,
         pincode=req.pincode,
@@ -998,67 +3039,33 @@ async def create_order(req: CreateOrderRequest, user: dict = Depends(get_current
     
     # If payment required and method is online, create Razorpay order
     if final_amount > 0 and req.payment_method == 'online':
-        razorpay_order = razorpay_client.order.create({
-            'amount': final_amount,
-            'currency': 'INR',
-            'payment_capture': 1
-        })
+        razorpay_order = await create_razorpay_order(final_amount)
         booking.razorpay_order_id = razorpay_order['id']
     
     booking_dict = booking.model_dump()
-    booking_dict['created_at'] = booking_dict['created_at'].isoformat()
-    await db.bookings.insert_one(booking_dict)
-    
-    # For COD or zero amount, auto-accept the booking
-    if req.payment_method == 'cod' or final_amount == 0:
-        # Auto-assign professional
-        professionals = await db.professionals.find({'status': 'active'}, {'_id': 0}).to_list(100)
-        professional_id = professionals[0]['id'] if professionals else None
+    auto_accept = req.payment_method == 'cod' or final_amount == 0
+    
+    async def place_booking():
+        await db.bookings.insert_one(booking_dict)
+        await bump_admin_stats(total_bookings=1)
+        await add_booking_to_rollup(booking_dict)
+        if not auto_accept:
+            return
         
+        professional = await pick_professional()
+        accept_data = {
+            'status': 'accepted',
+            'professional_id': professional['id'] if professional else None
+        }
         await db.bookings.update_one(
             {'id': booking.id},
-            {'$set': {
-                'status': 'accepted',
-                'professional_id': professional_id
-            }}
+            {'$set': accept_data}
         )
+        await bump_admin_stats(total_revenue=cart_value)
+        await update_booking_rollup(booking_dict, accept_data)
         
-        # Deduct wallet if used
         if wallet_used > 0:
-            wallet_config = await get_wallet_config()
-            locked_used = 0
-            regular_used = 0
-            
-            user_locked = user.get('wallet_locked_balance', 0)
-            
-            # Calculate how much came from locked balance
-            if user_locked > 0:
-                locked_used = min(
-                    user_locked,
-                    wallet_config.welcome_bonus_max_deduction,
-                    wallet_used
-                )
-            
-            regular_used = wallet_used - locked_used
-            
-            # Update user wallet
-            update_data = {}
-            if locked_used > 0:
-                update_data['wallet_locked_balance'] = user.get('wallet_locked_balance', 0) - locked_used
-            if regular_used > 0:
-                update_data['wallet_balance'] = user.get('wallet_balance', 0) - regular_used
-            
-            if update_data:
-                await db.users.update_one({'id': user['id']}, {'$set': update_data})
-            
-            # Add transaction
-            await add_wallet_transaction(
-                user['id'],
-                'debit',
-                -wallet_used,
-                f"Used for booking #{booking.id[:8]}",
-                booking.id
-            )
+            await debit_wallet_for_booking(user, booking.id, wallet_used)
         
         # Update coupon usage
         if req.coupon_code:
@@ -1066,10 +3073,11 @@ async def create_order(req: CreateOrderRequest, user: dict = Depends(get_current
                 {'code': req.coupon_code},
                 {'$inc': {'used_count': 1}}
             )
-        
-        # Get booking details for email
-        product = await db.products.find_one({'id': booking.product_id}, {'_id': 0})
-        
+    
+    await run_to_completion(place_booking())
+    
+    # For COD or zero amount, the booking is accepted straight away
+    if auto_accept:
         # Send order success email to customer
         await send_order_success_email(
             user['email'],
@@ -1113,7 +3121,7 @@ async def verify_payment(req: VerifyPaymentRequest, user: dict = Depends(get_cur
     }
     
     try:
-        razorpay_client.utility.verify_payment_signature(params_dict)
+        get_razorpay_client().utility.verify_payment_signature(params_dict)
     except:
         raise HTTPException(status_code=400, detail="Payment verification failed")
     
@@ -1122,68 +3130,54 @@ async def verify_payment(req: VerifyPaymentRequest, user: dict = Depends(get_cur
     if not booking:
         raise HTTPException(status_code=404, detail="Booking not found")
     
-    # Deduct wallet if used
-    if booking.get('wallet_used', 0) > 0:
-        wallet_config = await get_wallet_config()
-        locked_used = 0
-        regular_used = 0
-        
-        user_locked = user.get('wallet_locked_balance', 0)
-        
-        # Calculate how much came from locked balance
-        if user_locked > 0:
-            locked_used = min(
-                user_locked,
-                wallet_config.welcome_bonus_max_deduction,
-                booking['wallet_used']
-            )
+    async def claim_and_settle():
+        # Claim the booking before touching the wallet, so a retried verify
+        # (e.g. after a timeout) can't debit it twice
+        claimed = await db.bookings.find_one_and_update(
+            {'id': req.booking_id, 'payment_id': None},
+            {'$set': {'razorpay_payment_id': req.razorpay_payment_id, 'payment_id': req.razorpay_payment_id}},
+            projection={'_id': 0}
+        )
+        if not claimed:
+            return None, None
         
-        regular_used = booking['wallet_used'] - locked_used
+        professional = await pick_professional()
+        payment_data = {
+            'razorpay_payment_id': req.razorpay_payment_id,
+            'payment_id': req.razorpay_payment_id,
+            'status': 'accepted',
+            'professional_id': professional['id'] if professional else None
+        }
         
-        # Update user wallet
-        update_data = {}
-        if locked_used > 0:
-            update_data['wallet_locked_balance'] = user.get('wallet_locked_balance', 0) - locked_used
-        if regular_used > 0:
-            update_data['wallet_balance'] = user.get('wallet_balance', 0) - regular_used
+        if claimed.get('wallet_used', 0) > 0:
+            await debit_wallet_for_booking(user, claimed['id'], claimed['wallet_used'])
         
-        if update_data:
-            await db.users.update_one({'id': user['id']}, {'$set': update_data})
+        # Update coupon usage
+        if claimed.get('coupon_code'):
+            await db.coupons.update_one(
+                {'code': claimed['coupon_code']},
+                {'$inc': {'used_count': 1}}
+            )
         
-        # Add transaction
-        await add_wallet_transaction(
-            user['id'],
-            'debit',
-            -booking['wallet_used'],
-            f"Used for booking #{booking['id'][:8]}",
-            booking['id']
-        )
-    
-    # Update coupon usage
-    if booking.get('coupon_code'):
-        await db.coupons.update_one(
-            {'code': booking['coupon_code']},
-            {'$inc': {'used_count': 1}}
+        await db.bookings.update_one(
+            {'id': req.booking_id},
+            {'$set': payment_data}
         )
+        if claimed.get('status') not in REVENUE_STATUSES:
+            await bump_admin_stats(total_revenue=claimed['amount'])
+        await update_booking_rollup(claimed, payment_data)
+        
+        # Booking details for the emails
+        updated = await db.bookings.find_one({'id': req.booking_id}, {'_id': 0})
+        await attach_missing_products([updated])
+        return updated, professional
     
-    # Auto-assign professional
-    professionals = await db.professionals.find({'status': 'active'}, {'_id': 0}).to_list(100)
-    professional_id = professionals[0]['id'] if professionals else None
-    professional_name = professionals[0]['name'] if professionals else None
-    
-    await db.bookings.update_one(
-        {'id': req.booking_id},
-        {'$set': {
-            'razorpay_payment_id': req.razorpay_payment_id,
-            'payment_id': req.razorpay_payment_id,
-            'status': 'accepted',
-            'professional_id': professional_id
-        }}
-    )
-    
-    # Get booking details for email
-    updated_booking = await db.bookings.find_one({'id': req.booking_id}, {'_id': 0})
-    product = await db.products.find_one({'id': updated_booking['product_id']}, {'_id': 0})
+    # Claim through settlement is one unit: a deadline can't leave it claimed but unpaid
+    updated_booking, professional = await run_to_completion(claim_and_settle())
+    if not updated_booking:
+        return {'success': True, 'booking_id': req.booking_id}
+    product = updated_booking['product'] or {'name': 'Deleted service'}
+    professional_name = professional['name'] if professional else None
     
     # Send order success email to customer
     await send_order_success_email(
@@ -1213,6 +3207,27 @@ async def verify_payment(req: VerifyPaymentRequest, user: dict = Depends(get_cur
 
 # ============= Booking Routes =============
 
+async def find_by_ids(collection: str, ids) -> Dict[str, dict]:
+    """Fetch documents by id in one round trip, keyed by id"""
+    ids = list({i for i in ids if i})
+    if not ids:
+        return {}
+    docs = await db[collection].find({'id': {'$in': ids}}, {'_id': 0}).to_list(len(ids))
+    return {doc['id']: doc for doc in docs}
+
+async def attach_missing_products(bookings: list) -> list:
+    """
+    Until backfill_booking_products has run, look up the product of bookings
+    stored without one, in a single query. Deleted products become None.
+    """
+    missing = [b for b in bookings if 'product' not in b]
+    if missing:
+        products = await find_by_ids('products', [b.get('product_id') for b in missing])
+        for booking in missing:
+            product = products.get(booking.get('product_id'))
+            booking['product'] = ProductSnapshot(**product).model_dump() if product else None
+    return bookings
+
 @api_router.get("/bookings")
 async def get_bookings(user: dict = Depends(get_current_user)):
     query = {}
@@ -1225,15 +3240,13 @@ async def get_bookings(user: dict = Depends(get_current_user)):
     
     bookings = await db.bookings.find(query, {'_id': 0}).sort('created_at', -1).to_list(1000)
     
-    # Populate product and user details
+    # Populate user details; the product is embedded at booking time
+    users = await find_by_ids('users', [b['user_id'] for b in bookings])
     for booking in bookings:
-        product = await db.products.find_one({'id': booking['product_id']}, {'_id': 0})
-        booking['product'] = product
-        
-        user_data = await db.users.find_one({'id': booking['user_id']}, {'_id': 0})
-        booking['user'] = user_data
+        booking['user'] = users.get(booking['user_id'])
+    await attach_missing_products(bookings)
     
-    return bookings
+    return FastJSONResponse(bookings)
 
 @api_router.get("/bookings/{booking_id}")
 async def get_booking(booking_id: str, user: dict = Depends(get_current_user)):
@@ -1242,11 +3255,9 @@ async def get_booking(booking_id: str, user: dict = Depends(get_current_user)):
         raise HTTPException(status_code=404, detail="Booking not found")
     
     # Populate details
-    product = await db.products.find_one({'id': booking['product_id']}, {'_id': 0})
-    booking['product'] = product
-    
     user_data = await db.users.find_one({'id': booking['user_id']}, {'_id': 0})
     booking['user'] = user_data
+    await attach_missing_products([booking])
     
     return booking
 
@@ -1264,11 +3275,11 @@ async def update_booking_status(
     
     # Track start time
     if req.status == 'in_progress' and not booking.get('started_at'):
-        update_data['started_at'] = datetime.now(timezone.utc).isoformat()
+        update_data['started_at'] = datetime.now(timezone.utc)
     
     # Track completion time and record COD payment
     if req.status == 'completed' and not booking.get('completed_at'):
-        update_data['completed_at'] = datetime.now(timezone.utc).isoformat()
+        update_data['completed_at'] = datetime.now(timezone.utc)
         
         # For COD bookings, record payment when completed
         if booking.get('payment_method') == 'cod' and not booking.get('payment_id'):
@@ -1279,6 +3290,12 @@ async def update_booking_status(
         {'$set': update_data}
     )
     
+    was_revenue = booking.get('status') in REVENUE_STATUSES
+    is_revenue = req.status in REVENUE_STATUSES
+    if was_revenue != is_revenue:
+        await bump_admin_stats(total_revenue=booking['amount'] if is_revenue else -booking['amount'])
+    await update_booking_rollup(booking, update_data)
+    
     return {'success': True}
 
 @api_router.post("/bookings/{booking_id}/confirm-review")
@@ -1300,6 +3317,7 @@ async def confirm_review(
         {'id': booking['user_id']},
         {'$inc': {'wallet_balance': reward_amount}}
     )
+    await bump_admin_stats(total_wallet_balance=reward_amount)
     
     # Mark review as given
     await db.bookings.update_one(
@@ -1327,18 +3345,148 @@ async def get_professionals():
 
 # ============= Blog Routes =============
 
+BLOG_PAGE_SIZE = int(os.environ.get('BLOG_PAGE_SIZE', '20'))
+BLOG_EXCERPT_LENGTH = 160  # characters
+BLOG_WORDS_PER_MINUTE = 200
+# Fields needed to render a post card; the list never ships content
+BLOG_CARD_PROJECTION = {
+    '_id': 0, 'id': 1, 'title': 1, 'slug': 1, 'excerpt': 1, 'featured_image': 1,
+    'reading_time': 1, 'published': 1, 'created_at': 1, 'updated_at': 1
+}
+HTML_BLOCK_TAG = re.compile(r'<(p|div|h[1-6]|ul|ol|br|img|blockquote|pre|table|section|article|figure)\b', re.I)
+HTML_TAG = re.compile(r'</?[a-zA-Z][^>]*>')
+
+def render_blog_html(content: str) -> str:
+    """
+    Content with block-level HTML is kept as written; otherwise blank lines
+    become paragraphs and line breaks <br>, escaping text that has no tags.
+    """
+    if HTML_BLOCK_TAG.search(content):
+        return content
+    if not HTML_TAG.search(content):
+        content = html.escape(content)
+    paragraphs = [p.strip() for p in re.split(r'\n\s*\n', content) if p.strip()]
+    return ''.join(f"<p>{p.replace(chr(10), '<br>')}</p>" for p in paragraphs)
+
+def render_blog_post(post: dict) -> dict:
+    """
+    Fields derived from a post's content, computed at write time: HTML,
+    reading time and, unless an excerpt was written by hand, the excerpt.
+    """
+    content_html = render_blog_html(post['content'])
+    text = ' '.join(html.unescape(HTML_TAG.sub(' ', content_html)).split())
+    text = re.sub(r' ([.,;:!?])', r'\1', text)  # left behind by closing inline tags
+    derived = {
+        'content_html': content_html,
+        'reading_time': max(1, math.ceil(len(text.split()) / BLOG_WORDS_PER_MINUTE)),
+        'excerpt_auto': not post.get('excerpt') or post.get('excerpt_auto', False)
+    }
+    if derived['excerpt_auto']:
+        excerpt = text
+        if len(text) > BLOG_EXCERPT_LENGTH:
+            excerpt = text[:BLOG_EXCERPT_LENGTH].rsplit(' ', 1)[0].rstrip(' ,.;:') + '…'
+        derived['excerpt'] = excerpt
+    return derived
+
+async def render_legacy_blog_posts():
+    """Fill in derived fields for posts written before they were precomputed"""
+    rendered = 0
+    async for post in db.blog_posts.find({'content_html': {'$exists': False}}, {'_id': 0, 'id': 1, 'content': 1, 'excerpt': 1}):
+        await db.blog_posts.update_one({'id': post['id']}, {'$set': render_blog_post(post)})
+        rendered += 1
+    if rendered:
+        await invalidation_bus.notify('blog_posts')
+        logger.info(f"Rendered {rendered} legacy blog posts")
+
+def encode_blog_cursor(post: dict) -> str:
+    created_at = post['created_at']
+    if isinstance(created_at, datetime):
+        cursor = f"{created_at.isoformat()}|{post['id']}|date"
+    else:
+        cursor = f"{created_at}|{post['id']}"  # not yet migrated
+    return base64.urlsafe_b64encode(cursor.encode()).decode()
+
+def decode_blog_cursor(cursor: str) -> tuple:
+    try:
+        created_at, post_id, *kind = base64.urlsafe_b64decode(cursor.encode()).decode().split('|')
+        if kind == ['date']:
+            created_at = datetime.fromisoformat(created_at)
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return created_at, post_id
+
+async def fetch_blog_page(query: dict, after: Optional[tuple], limit: int) -> list:
+    """Newest first; `after` is the (created_at, id) of the last post on the previous page"""
+    if after:
+        created_at, post_id = after
+        older = [
+            {'created_at': {'$lt': created_at}},
+            {'created_at': created_at, 'id': {'$lt': post_id}}
+        ]
+        if DATES_DUAL_READ and isinstance(created_at, datetime):
+            # Posts still holding ISO strings sort after every date, newest first
+            older.append({'created_at': {'$type': 'string'}})
+        query = {**query, '$or': older}
+    return await db.blog_posts.find(query, BLOG_CARD_PROJECTION).sort(
+        [('created_at', -1), ('id', -1)]
+    ).limit(limit).to_list(limit)
+
+def blog_page_headers(posts: list, limit: int) -> dict:
+    return {'X-Next-Cursor': encode_blog_cursor(posts[-1])} if len(posts) == limit else {}
+
+# Pre-encoded published pages and posts, dropped whenever any post changes
+blog_page_snapshots = TTLCache(maxsize=128, ttl=3600)
+blog_post_snapshots = TTLCache(maxsize=512, ttl=3600)
+
+def clear_blog_snapshots(_):
+    blog_page_snapshots.clear()
+    blog_post_snapshots.clear()
+
+invalidation_bus.register('blog_posts', clear_blog_snapshots)
+
+def blog_page_snapshot(after: Optional[tuple], limit: int) -> JSONSnapshot:
+    key = (after, limit)
+    snapshot = blog_page_snapshots.get(key)
+    if snapshot is None:
+        async def build():
+            return await fetch_blog_page({'published': True}, after, limit)
+        snapshot = JSONSnapshot(build, headers=lambda posts: blog_page_headers(posts, limit))
+        blog_page_snapshots.set(key, snapshot)
+    return snapshot
+
+def blog_post_snapshot(slug: str) -> JSONSnapshot:
+    snapshot = blog_post_snapshots.get(slug)
+    if snapshot is None:
+        async def build():
+            post = await db.blog_posts.find_one({'slug': slug, 'published': True}, {'_id': 0, 'excerpt_auto': 0})
+            if not post:
+                raise HTTPException(status_code=404, detail="Blog post not found")
+            if 'content_html' not in post:
+                post.update(render_blog_post(post))
+                post.pop('excerpt_auto')
+            return post
+        snapshot = JSONSnapshot(build)
+        blog_post_snapshots.set(slug, snapshot)
+    return snapshot
+
 @api_router.get("/blog")
-async def get_blog_posts(published_only: bool = True):
-    query = {'published': True} if published_only else {}
-    posts = await db.blog_posts.find(query, {'_id': 0}).sort('created_at', -1).to_list(100)
-    return posts
+async def get_blog_posts(
+    request: Request,
+    published_only: bool = True,
+    cursor: Optional[str] = None,
+    limit: int = BLOG_PAGE_SIZE
+):
+    """Post cards, newest first; the cursor for the next page is returned in X-Next-Cursor"""
+    limit = max(1, min(limit, 100))
+    after = decode_blog_cursor(cursor) if cursor else None
+    if published_only:
+        return await blog_page_snapshot(after, limit).response(request)
+    posts = await fetch_blog_page({}, after, limit)
+    return FastJSONResponse(posts, headers=blog_page_headers(posts, limit))
 
 @api_router.get("/blog/{slug}")
-async def get_blog_post_by_slug(slug: str):
-    post = await db.blog_posts.find_one({'slug': slug, 'published': True}, {'_id': 0})
-    if not post:
-        raise HTTPException(status_code=404, detail="Blog post not found")
-    return post
+async def get_blog_post_by_slug(slug: str, request: Request):
+    return await blog_post_snapshot(slug).response(request)
 
 @api_router.post("/blog", dependencies=[Depends(require_admin)])
 async def create_blog_post(post: BlogPostCreate, user: dict = Depends(get_current_user)):
@@ -1348,17 +3496,27 @@ async def create_blog_post(post: BlogPostCreate, user: dict = Depends(get_curren
         raise HTTPException(status_code=400, detail="Slug already exists")
     
     post_dict = post.model_dump()
-    post_obj = BlogPost(**post_dict, author_id=user['id'])
+    derived = render_blog_post(post_dict)
+    post_obj = BlogPost(**{**post_dict, **derived}, author_id=user['id'])
     post_data = post_obj.model_dump()
-    post_data['created_at'] = post_data['created_at'].isoformat()
-    post_data['updated_at'] = post_data['updated_at'].isoformat()
+    post_data['excerpt_auto'] = derived['excerpt_auto']
     await db.blog_posts.insert_one(post_data)
+    await invalidation_bus.notify('blog_posts')
     return post_obj
 
 @api_router.patch("/blog/{post_id}", dependencies=[Depends(require_admin)])
 async def update_blog_post(post_id: str, post: BlogPostUpdate):
     update_data = {k: v for k, v in post.model_dump().items() if v is not None}
-    update_data['updated_at'] = datetime.now(timezone.utc).isoformat()
+    update_data['updated_at'] = datetime.now(timezone.utc)
+    
+    if 'content' in update_data or 'excerpt' in update_data:
+        existing = await db.blog_posts.find_one({'id': post_id}, {'_id': 0, 'content': 1, 'excerpt': 1, 'excerpt_auto': 1})
+        if not existing:
+            raise HTTPException(status_code=404, detail="Blog post not found")
+        merged = {**existing, **update_data}
+        if 'excerpt' in update_data:
+            merged['excerpt_auto'] = False
+        update_data.update(render_blog_post(merged))
     
     result = await db.blog_posts.update_one(
         {'id': post_id},
@@ -1368,6 +3526,7 @@ async def update_blog_post(post_id: str, post: BlogPostUpdate):
     if result.matched_count == 0:
         raise HTTPException(status_code=404, detail="Blog post not found")
     
+    await invalidation_bus.notify('blog_posts')
     return {'success': True}
 
 @api_router.delete("/blog/{post_id}", dependencies=[Depends(require_admin)])
@@ -1375,8 +3534,102 @@ async def delete_blog_post(post_id: str):
     result = await db.blog_posts.delete_one({'id': post_id})
     if result.deleted_count == 0:
         raise HTTPException(status_code=404, detail="Blog post not found")
+    await invalidation_bus.notify('blog_posts')
     return {'success': True}
 
+# ============= SEO Feeds =============
+
+SITE_URL = os.environ.get('FRONTEND_URL', 'http://localhost:3000').rstrip('/')
+# Public page paths; {id}/{slug} are filled per entry. The sitemap only lists
+# pages the frontend serves: category, product and blog pages are left out
+# until their path is configured.
+SITEMAP_CATEGORY_PATH = os.environ.get('SITEMAP_CATEGORY_PATH', '')
+SITEMAP_PRODUCT_PATH = os.environ.get('SITEMAP_PRODUCT_PATH', '')
+SITEMAP_BLOG_ENABLED = os.environ.get('SITEMAP_BLOG_ENABLED', 'false').lower() == 'true'
+BLOG_POST_PATH = os.environ.get('BLOG_POST_PATH', '/blog/{slug}')
+RSS_MAX_ITEMS = int(os.environ.get('RSS_MAX_ITEMS', '50'))
+FEED_CHUNK_SIZE = 500  # entries per streamed chunk
+
+seo_router = APIRouter()
+
+def sitemap_url(path: str, lastmod=None) -> str:
+    entry = f'<url><loc>{xml_escape(SITE_URL + path)}</loc>'
+    modified = as_datetime(lastmod)
+    if modified:
+        entry += f'<lastmod>{modified.date().isoformat()}</lastmod>'
+    return entry + '</url>\n'
+
+async def chunked(cursor, render):
+    """Render cursor documents into byte chunks of FEED_CHUNK_SIZE entries"""
+    entries = []
+    async for doc in cursor:
+        entries.append(render(doc))
+        if len(entries) >= FEED_CHUNK_SIZE:
+            yield ''.join(entries).encode()
+            entries = []
+    if entries:
+        yield ''.join(entries).encode()
+
+async def generate_sitemap():
+    yield (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+        + sitemap_url('/') + (sitemap_url('/blog') if SITEMAP_BLOG_ENABLED else '')
+    ).encode()
+    sources = []
+    if SITEMAP_CATEGORY_PATH:
+        sources.append((db.categories.find({}, {'_id': 0, 'id': 1}).sort('id', 1),
+                        lambda c: sitemap_url(SITEMAP_CATEGORY_PATH.format(id=c['id']))))
+    if SITEMAP_PRODUCT_PATH:
+        sources.append((db.products.find({}, {'_id': 0, 'id': 1}).sort('id', 1),
+                        lambda p: sitemap_url(SITEMAP_PRODUCT_PATH.format(id=p['id']))))
+    if SITEMAP_BLOG_ENABLED:
+        sources.append((db.blog_posts.find({'published': True}, {'_id': 0, 'slug': 1, 'updated_at': 1}).sort('slug', 1),
+                        lambda b: sitemap_url(BLOG_POST_PATH.format(slug=b['slug']), b.get('updated_at'))))
+    for cursor, render in sources:
+        async for chunk in chunked(cursor, render):
+            yield chunk
+    yield b'</urlset>\n'
+
+def rss_item(post: dict) -> str:
+    link = xml_escape(SITE_URL + BLOG_POST_PATH.format(slug=post['slug']))
+    item = f'<item><title>{xml_escape(post["title"])}</title><link>{link}</link><guid isPermaLink="true">{link}</guid>'
+    published = as_datetime(post.get('created_at'))
+    if published:
+        item += f'<pubDate>{format_datetime(published, usegmt=True)}</pubDate>'
+    if post.get('excerpt'):
+        item += f'<description>{xml_escape(post["excerpt"])}</description>'
+    return item + '</item>\n'
+
+async def generate_blog_rss():
+    yield (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<rss version="2.0"><channel>\n'
+        f'<title>intowns.in Blog</title><link>{xml_escape(SITE_URL)}/blog</link>'
+        '<description>Wellness, massage and beauty tips from intowns.in</description>\n'
+    ).encode()
+    cursor = db.blog_posts.find(
+        {'published': True},
+        {'_id': 0, 'title': 1, 'slug': 1, 'excerpt': 1, 'created_at': 1}
+    ).sort([('created_at', -1), ('id', -1)]).limit(RSS_MAX_ITEMS)
+    async for chunk in chunked(cursor, rss_item):
+        yield chunk
+    yield b'</channel></rss>\n'
+
+sitemap_snapshot = StreamedSnapshot(generate_sitemap, 'application/xml')
+blog_rss_snapshot = StreamedSnapshot(generate_blog_rss, 'application/rss+xml')
+for collection in ('products', 'categories', 'blog_posts'):
+    invalidation_bus.register(collection, lambda _: sitemap_snapshot.invalidate())
+invalidation_bus.register('blog_posts', lambda _: blog_rss_snapshot.invalidate())
+
+@seo_router.get("/sitemap.xml", include_in_schema=False)
+async def sitemap(request: Request):
+    return await sitemap_snapshot.response(request)
+
+@seo_router.get("/blog/rss.xml", include_in_schema=False)
+async def blog_rss(request: Request):
+    return await blog_rss_snapshot.response(request)
+
 # ============= Admin Config Routes =============
 
 @api_router.get("/config/{key}", dependencies=[Depends(require_admin)])
@@ -1392,23 +3645,19 @@ async def update_config(config: SiteConfigUpdate):
         {'key': config.key},
         {'$set': {
             'value': config.value,
-            'updated_at': datetime.now(timezone.utc).isoformat()
+            'updated_at': datetime.now(timezone.utc)
         }},
         upsert=True
     )
+    await invalidation_bus.notify('site_config')
     return {'success': True}
 
-@api_router.get("/config")
-async def get_all_public_config():
-    """Get public config like razorpay key, google maps key, etc."""
-    configs = await db.site_config.find({}, {'_id': 0}).to_list(100)
-    public_configs = {}
-    
-    # Only expose public keys
-    public_keys = ['razorpay_key_id', 'google_maps_api_key', 'whatsapp_number', 'site_logo', 'site_name']
-    for config in configs:
-        if config['key'] in public_keys:
-            public_configs[config['key']] = config['value']
+PUBLIC_CONFIG_KEYS = ['razorpay_key_id', 'google_maps_api_key', 'whatsapp_number', 'site_logo', 'site_name']
+
+async def build_public_config() -> dict:
+    """Public config like razorpay key, google maps key, etc."""
+    configs = await db.site_config.find({'key': {'$in': PUBLIC_CONFIG_KEYS}}, {'_id': 0}).to_list(100)
+    public_configs = {config['key']: config['value'] for config in configs}
     
     # Add defaults from env
     if 'razorpay_key_id' not in public_configs:
@@ -1422,73 +3671,206 @@ async def get_all_public_config():
     
     return public_configs
 
+public_config_snapshot = JSONSnapshot(build_public_config)
+invalidation_bus.register('site_config', lambda _: public_config_snapshot.invalidate())
+
+@api_router.get("/config")
+async def get_all_public_config(request: Request):
+    """Get public config like razorpay key, google maps key, etc."""
+    return await public_config_snapshot.response(request)
+
 # ============= Address Autocomplete (Open Source) =============
 
-@api_router.get("/address/search")
+@api_router.get("/address/search", dependencies=[Depends(RateLimit('address_search'))])
 async def search_address(query: str):
     """
-    Simple address search using Nominatim (OpenStreetMap)
-    No API key needed - open source!
+    Address search against the offline pincode/locality index,
+    falling back to Nominatim (OpenStreetMap) on a miss
     """
-    import urllib.parse
-    import aiohttp
-    
     if not query or len(query) < 3:
         return []
     
+    suggestions = address_index.search(query)
+    if suggestions:
+        return suggestions
+    
     try:
-        encoded_query = urllib.parse.quote(query)
-        url = f"https://nominatim.openstreetmap.org/search?q={encoded_query}&format=json&addressdetails=1&limit=5&countrycodes=in"
-        
-        async with aiohttp.ClientSession() as session:
-            headers = {'User-Agent': 'Intowns-App/1.0'}
-            async with session.get(url, headers=headers) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    suggestions = []
-                    for item in data:
-                        suggestions.append({
-                            'description': item.get('display_name', ''),
-                            'place_id': item.get('place_id', ''),
-                            'lat': item.get('lat', ''),
-                            'lon': item.get('lon', '')
-                        })
-                    return suggestions
-                return []
+        return await nominatim_client.search(query)
     except Exception as e:
         logger.error(f"Address search error: {str(e)}")
         return []
 
+# ============= Serviceability Routes =============
+
+@api_router.get("/serviceability")
+async def check_serviceability(pincode: str):
+    if PincodeSet.parse(pincode) is None:
+        raise HTTPException(status_code=400, detail="Invalid pincode")
+    return {'pincode': pincode, 'serviceable': is_serviceable(pincode)}
+
+@api_router.get("/admin/serviceable-pincodes", dependencies=[Depends(require_admin), Depends(RateLimit('admin_list'))])
+async def get_serviceable_pincodes():
+    docs = await db.serviceable_pincodes.find({}, {'_id': 0}).sort('pincode', 1).to_list(None)
+    return [doc['pincode'] for doc in docs]
+
+@api_router.post("/admin/serviceable-pincodes", dependencies=[Depends(require_admin)])
+async def add_serviceable_pincodes(req: ServiceablePincodesRequest):
+    invalid = [p for p in req.pincodes if PincodeSet.parse(p) is None]
+    if invalid:
+        raise HTTPException(status_code=400, detail=f"Invalid pincodes: {', '.join(invalid)}")
+    
+    pincodes = sorted({p.strip() for p in req.pincodes})
+    if pincodes:
+        now = datetime.now(timezone.utc)
+        await db.serviceable_pincodes.bulk_write([
+            UpdateOne(
+                {'pincode': pincode},
+                {'$setOnInsert': {'pincode': pincode, 'created_at': now}},
+                upsert=True
+            )
+            for pincode in pincodes
+        ], ordered=False)
+    for pincode in pincodes:
+        serviceable_pincodes.add(pincode)
+    
+    await invalidation_bus.notify('serviceable_pincodes')
+    
+    return {'success': True, 'total': len(serviceable_pincodes)}
+
+@api_router.delete("/admin/serviceable-pincodes/{pincode}", dependencies=[Depends(require_admin)])
+async def delete_serviceable_pincode(pincode: str):
+    result = await db.serviceable_pincodes.delete_one({'pincode': pincode})
+    if result.deleted_count == 0:
+        raise HTTPException(status_code=404, detail="Pincode not found")
+    serviceable_pincodes.discard(pincode)
+    await invalidation_bus.notify('serviceable_pincodes')
+    
+    return {'success': True, 'total': len(serviceable_pincodes)}
+
 # ============= Admin Stats =============
 
 @api_router.get("/admin/stats", dependencies=[Depends(require_admin)])
 async def get_admin_stats():
-    total_bookings = await db.bookings.count_documents({})
-    total_users = await db.users.count_documents({'role': 'user'})
-    total_revenue = await db.bookings.aggregate([
-        {'$match': {'status': {'$in': ['accepted', 'on_the_way', 'in_progress', 'completed']}}},
-        {'$group': {'_id': None, 'total': {'$sum': '$amount'}}}
-    ]).to_list(1)
+    stats = await db.admin_stats.find_one({'key': 'global'}, {'_id': 0})
+    if not stats or 'reconciled_at' not in stats:
+        return await reconcile_admin_stats()
+    
+    return {
+        'total_bookings': stats.get('total_bookings', 0),
+        'total_users': stats.get('total_users', 0),
+        'total_revenue': stats.get('total_revenue', 0),
+        'total_wallet_balance': stats.get('total_wallet_balance', 0)
+    }
+
+# ============= Admin Analytics =============
+
+@api_router.get("/admin/analytics/timeseries", dependencies=[Depends(require_admin), Depends(RateLimit('admin_list'))])
+async def get_analytics_timeseries(
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    interval: str = "day",
+    group_by: Optional[str] = None,
+    category_id: Optional[str] = None,
+    professional_id: Optional[str] = None,
+    status: Optional[str] = None
+):
+    """
+    Bookings and revenue per day or month from the daily rollups.
+    Revenue only counts bookings in revenue statuses.
+    """
+    if interval not in ['day', 'month']:
+        raise HTTPException(status_code=400, detail="interval must be 'day' or 'month'")
+    if group_by not in [None, 'category', 'professional', 'status']:
+        raise HTTPException(status_code=400, detail="group_by must be 'category', 'professional' or 'status'")
     
-    revenue = total_revenue[0]['total'] if total_revenue else 0
+    today = datetime.now(timezone.utc).date()
+    try:
+        end_date = datetime.fromisoformat(end).date() if end else today
+        start_date = datetime.fromisoformat(start).date() if start else end_date - timedelta(days=364)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="start and end must be YYYY-MM-DD dates")
     
-    # Get wallet stats
-    total_wallet = await db.users.aggregate([
-        {'$group': {'_id': None, 'total': {'$sum': '$wallet_balance'}}}
-    ]).to_list(1)
+    docs = await db.booking_rollups.find(
+        {'date': {'$gte': start_date.isoformat(), '$lte': end_date.isoformat()}},
+        {'_id': 0}
+    ).sort('date', 1).to_list(None)
     
-    wallet_balance = total_wallet[0]['total'] if total_wallet else 0
+    points = {}
+    for doc in docs:
+        period = doc['date'] if interval == 'day' else doc['date'][:7]
+        for bucket, counts in doc.get('buckets', {}).items():
+            bucket_category, bucket_professional, bucket_status = bucket.split('|')
+            if category_id and bucket_category != category_id:
+                continue
+            if professional_id and bucket_professional != professional_id:
+                continue
+            if status and bucket_status != status:
+                continue
+            
+            group = {
+                'category': bucket_category,
+                'professional': bucket_professional,
+                'status': bucket_status
+            }.get(group_by)
+            point = points.setdefault((period, group), {'date': period, 'bookings': 0, 'revenue': 0})
+            if group_by:
+                point[group_by] = group
+            point['bookings'] += counts.get('bookings', 0)
+            if bucket_status in REVENUE_STATUSES:
+                point['revenue'] += counts.get('revenue', 0)
     
+    series = [point for point in points.values() if point['bookings']]
     return {
-        'total_bookings': total_bookings,
-        'total_users': total_users,
-        'total_revenue': revenue,
-        'total_wallet_balance': wallet_balance
+        'start': start_date.isoformat(),
+        'end': end_date.isoformat(),
+        'interval': interval,
+        'series': series,
+        'totals': {
+            'bookings': sum(p['bookings'] for p in series),
+            'revenue': sum(p['revenue'] for p in series)
+        }
     }
 
+@api_router.post("/admin/analytics/backfill", dependencies=[Depends(require_admin)])
+async def backfill_analytics(chunk_size: int = 1000):
+    """Rebuild the daily rollups from existing bookings"""
+    processed = await backfill_booking_rollups(chunk_size)
+    return {'success': True, 'bookings_processed': processed}
+
+@api_router.post("/admin/migrations/dates", dependencies=[Depends(require_admin)])
+async def run_date_migration(chunk_size: int = 1000, restart: bool = False):
+    """Convert stored ISO string timestamps to BSON dates; call again until done"""
+    progress = await migrate_dates(chunk_size, restart)
+    done = len(progress) == len(DATE_FIELDS) and all(p['done'] for p in progress.values())
+    return {'success': True, 'done': done, 'collections': progress}
+
+@api_router.post("/admin/bookings/backfill-products", dependencies=[Depends(require_admin)])
+async def backfill_bookings_products(chunk_size: int = 1000):
+    """Embed product snapshots in bookings created before they were stored"""
+    updated = await backfill_booking_products(chunk_size)
+    return {'success': True, 'bookings_updated': updated}
+
+# ============= Admin Profiles =============
+
+@api_router.get("/admin/profiles", dependencies=[Depends(require_admin), Depends(RateLimit('admin_list'))])
+async def get_profiles():
+    """Slowest profiled requests captured by this worker"""
+    return [
+        {k: v for k, v in profile.items() if k != 'stacks'}
+        for profile in profile_store.list()
+    ]
+
+@api_router.get("/admin/profiles/{profile_id}", dependencies=[Depends(require_admin)])
+async def get_profile(profile_id: str):
+    """Profile with collapsed stacks (flamegraph.pl compatible: 'frame;frame count')"""
+    profile = profile_store.get(profile_id)
+    if not profile:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    return profile
+
 # ============= Admin User Management =============
 
-@api_router.get("/admin/users", dependencies=[Depends(require_admin)])
+@api_router.get("/admin/users", dependencies=[Depends(require_admin), Depends(RateLimit('admin_list'))])
 async def get_all_users(skip: int = 0, limit: int = 50):
     """Get all users with pagination"""
     users = await db.users.find({}, {'_id': 0}).skip(skip).limit(limit).to_list(limit)
@@ -1506,14 +3888,20 @@ async def update_user_role(user_id: str, role: str):
     if role not in ['user', 'admin', 'professional']:
         raise HTTPException(status_code=400, detail="Invalid role")
     
-    result = await db.users.update_one(
+    existing = await db.users.find_one_and_update(
         {'id': user_id},
-        {'$set': {'role': role}}
+        {'$set': {'role': role}},
+        projection={'_id': 0, 'role': 1}
     )
     
-    if result.matched_count == 0:
+    if existing is None:
         raise HTTPException(status_code=404, detail="User not found")
     
+    if (existing.get('role') == 'user') != (role == 'user'):
+        await bump_admin_stats(total_users=1 if role == 'user' else -1)
+    
+    await invalidation_bus.notify('users')
+    
     return {'success': True, 'message': f'User role updated to {role}'}
 
 @api_router.delete("/admin/users/{user_id}", dependencies=[Depends(require_admin)])
@@ -1527,15 +3915,16 @@ async def delete_user(user_id: str):
     if result.matched_count == 0:
         raise HTTPException(status_code=404, detail="User not found")
     
+    await invalidation_bus.notify('users')
+    
     return {'success': True, 'message': 'User deleted'}
 
 # ============= Admin Product/Category Management =============
 
-@api_router.get("/admin/products", dependencies=[Depends(require_admin)])
-async def get_all_products_admin():
+@api_router.get("/admin/products", dependencies=[Depends(require_admin), Depends(RateLimit('admin_list'))])
+async def get_all_products_admin(request: Request):
     """Get all products for admin"""
-    products = await db.products.find({}, {'_id': 0}).to_list(1000)
-    return products
+    return await product_list_snapshot({}).response(request)
 
 @api_router.patch("/admin/products/{product_id}", dependencies=[Depends(require_admin)])
 async def update_product(product_id: str, product: ProductCreate):
@@ -1549,6 +3938,8 @@ async def update_product(product_id: str, product: ProductCreate):
     if result.matched_count == 0:
         raise HTTPException(status_code=404, detail="Product not found")
     
+    await invalidation_bus.notify('products')
+    
     return {'success': True, 'message': 'Product updated'}
 
 @api_router.delete("/admin/products/{product_id}", dependencies=[Depends(require_admin)])
@@ -1559,9 +3950,11 @@ async def delete_product(product_id: str):
     if result.deleted_count == 0:
         raise HTTPException(status_code=404, detail="Product not found")
     
+    await invalidation_bus.notify('products')
+    
     return {'success': True, 'message': 'Product deleted'}
 
-@api_router.get("/admin/categories", dependencies=[Depends(require_admin)])
+@api_router.get("/admin/categories", dependencies=[Depends(require_admin), Depends(RateLimit('admin_list'))])
 async def get_all_categories_admin():
     """Get all categories for admin"""
     categories = await db.categories.find({}, {'_id': 0}).to_list(1000)
@@ -1589,11 +3982,13 @@ async def delete_category(category_id: str):
     if result.deleted_count == 0:
         raise HTTPException(status_code=404, detail="Category not found")
     
+    await invalidation_bus.notify('categories')
+    
     return {'success': True, 'message': 'Category deleted'}
 
 # ============= Admin Bookings Management =============
 
-@api_router.get("/admin/bookings", dependencies=[Depends(require_admin)])
+@api_router.get("/admin/bookings", dependencies=[Depends(require_admin), Depends(RateLimit('admin_list'))])
 async def get_all_bookings_admin(status: Optional[str] = None, skip: int = 0, limit: int = 50):
     """Get all bookings for admin"""
     query = {}
@@ -1602,26 +3997,24 @@ async def get_all_bookings_admin(status: Optional[str] = None, skip: int = 0, li
     
     bookings = await db.bookings.find(query, {'_id': 0}).sort('created_at', -1).skip(skip).limit(limit).to_list(limit)
     
-    # Populate product and user details
+    # Populate user details; the product is embedded at booking time
+    users = await find_by_ids('users', [b['user_id'] for b in bookings])
+    professionals = await find_by_ids('professionals', [b.get('professional_id') for b in bookings])
     for booking in bookings:
-        product = await db.products.find_one({'id': booking['product_id']}, {'_id': 0})
-        booking['product'] = product
-        
-        user_data = await db.users.find_one({'id': booking['user_id']}, {'_id': 0})
-        booking['user'] = user_data
+        booking['user'] = users.get(booking['user_id'])
         
         if booking.get('professional_id'):
-            professional = await db.professionals.find_one({'id': booking['professional_id']}, {'_id': 0})
-            booking['professional'] = professional
+            booking['professional'] = professionals.get(booking['professional_id'])
+    await attach_missing_products(bookings)
     
     total_count = await db.bookings.count_documents(query)
     
-    return {
+    return FastJSONResponse({
         'bookings': bookings,
         'total': total_count,
         'page': skip // limit + 1,
         'pages': (total_count + limit - 1) // limit
-    }
+    })
 
 # ============= Admin Mailing =============
 
@@ -1658,43 +4051,112 @@ async def send_email(email_req: EmailRequest):
             'recipients': 0
         }
 
-@api_router.get("/admin/email-logs", dependencies=[Depends(require_admin)])
-async def get_email_logs(limit: int = 50):
-    """Get email logs for analytics"""
-    logs = await db.email_logs.find({}, {'_id': 0}).sort('created_at', -1).limit(limit).to_list(limit)
+async def get_email_stats(since: Optional[datetime] = None, until: Optional[datetime] = None) -> dict:
+    """Aggregate email log counts by status and type in a single pass"""
+    match = date_range('created_at', since, until)
+    
+    pipeline = [{'$match': match}] if match else []
+    pipeline.append({'$facet': {
+        'by_status': [{'$group': {'_id': '$status', 'count': {'$sum': 1}}}],
+        'by_type': [{'$group': {'_id': '$type', 'count': {'$sum': 1}}}]
+    }})
+    result = await db.email_logs.aggregate(pipeline).to_list(1)
+    facets = result[0] if result else {'by_status': [], 'by_type': []}
     
-    # Get stats
-    total_sent = await db.email_logs.count_documents({'status': 'sent'})
-    total_failed = await db.email_logs.count_documents({'status': 'failed'})
+    by_status = {row['_id']: row['count'] for row in facets['by_status']}
     
-    # Count by type
-    welcome_count = await db.email_logs.count_documents({'type': 'welcome'})
-    topup_count = await db.email_logs.count_documents({'type': 'topup'})
-    order_count = await db.email_logs.count_documents({'type': 'order_success'})
-    notification_count = await db.email_logs.count_documents({'type': 'order_notification'})
-    manual_count = await db.email_logs.count_documents({'type': 'manual'})
+    # Always report the known types, plus any others found in the window
+    by_type = {t: 0 for t in EMAIL_TYPES}
+    for row in facets['by_type']:
+        if row['_id'] is not None:
+            by_type[row['_id']] = row['count']
+    
+    return {
+        'total_sent': by_status.get('sent', 0),
+        'total_failed': by_status.get('failed', 0),
+        'by_type': by_type
+    }
+
+@api_router.get("/admin/email-logs", dependencies=[Depends(require_admin), Depends(RateLimit('admin_list'))])
+async def get_email_logs(limit: int = 50, since: Optional[datetime] = None, until: Optional[datetime] = None):
+    """Get email logs for analytics"""
+    query = date_range('created_at', since, until)
+    logs = await db.email_logs.find(query, {'_id': 0}).sort('created_at', -1).limit(limit).to_list(limit)
+    stats = await get_email_stats(since, until)
     
     return {
         'logs': logs,
-        'stats': {
-            'total_sent': total_sent,
-            'total_failed': total_failed,
-            'by_type': {
-                'welcome': welcome_count,
-                'topup': topup_count,
-                'order_success': order_count,
-                'order_notification': notification_count,
-                'manual': manual_count
-            }
-        }
+        'stats': stats
     }
 
 @api_router.get("/")
 async def root():
     return {"message": "Intowns API"}
 
-app.include_router(api_router)
+# ============= App Factory =============
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Open per-process resources on startup and release them on shutdown"""
+    global client, db, rate_limit_backend
+    client = create_mongo_client()
+    db = client[os.environ['DB_NAME']]
+    rate_limit_backend = create_rate_limit_backend()
+    
+    email_log_writer.start()
+    wallet_transaction_writer.start()
+    # ~165k offices take a second or two to index; keep the loop free meanwhile
+    await asyncio.to_thread(address_index.load, ADDRESS_INDEX_PATH)
+    await load_serviceable_pincodes()
+    await invalidation_bus.start()
+    await nominatim_client.start()
+    tasks = [
+        asyncio.create_task(reconcile_admin_stats_periodically()),
+        asyncio.create_task(refresh_oauth_metadata()),
+        asyncio.create_task(render_legacy_blog_posts()),
+        asyncio.create_task(ensure_indexes())
+    ]
+    
+    try:
+        yield
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await email_log_writer.close()
+        await wallet_transaction_writer.close()
+        await nominatim_client.close()
+        await invalidation_bus.close()
+        await rate_limit_backend.close()
+        client.close()
+
+def create_app() -> FastAPI:
+    """
+    Build the ASGI app. Each worker process gets its own Mongo pool,
+    HTTP clients, caches and background tasks via the lifespan, e.g.
+    uvicorn server:create_app --factory, or gunicorn with gunicorn.conf.py
+    """
+    application = FastAPI(lifespan=lifespan)
+    application.include_router(api_router)
+    application.include_router(seo_router)
+    application.add_route('/metrics', metrics_endpoint, include_in_schema=False)
+    
+    application.add_middleware(DeadlineMiddleware)
+    application.add_middleware(CompressionMiddleware)
+    application.add_middleware(SessionMiddleware, secret_key=JWT_SECRET)
+    # Inside CORS, so browsers on other origins can read its 503s and Retry-After
+    application.add_middleware(AdmissionControlMiddleware)
+    application.add_middleware(
+        CORSMiddleware,
+        allow_credentials=True,
+        allow_origins=os.environ.get('CORS_ORIGINS', '*').split(','),
+        allow_methods=["*"],
+        allow_headers=["*"],
+        expose_headers=["X-Next-Cursor", "Retry-After"],
+    )
+    application.add_middleware(ProfilingMiddleware)
+    application.add_middleware(QueryBudgetMiddleware)
+    application.add_middleware(MetricsMiddleware)
+    return application
 
-@app.on_event("shutdown")
-async def shutdown_db_client():
-    client.close()
+app = create_app()
@@ -124,7 +124,7 @@ const AdminDashboard = () => {
         axios.get(`${API_URL}/coupons`, { headers }),
         axios.get(`${API_URL}/wallet/offers`),
         axios.get(`${API_URL}/wallet/config`, { headers }),
-        axios.get(`${API_URL}/blog?published_only=false`, { headers }),
+        axios.get(`${API_URL}/blog?published_only=false&limit=100`, { headers }),
         axios.get(`${API_URL}/admin/users`, { headers }),
         axios.get(`${API_URL}/admin/products`, { headers }),
         axios.get(`${API_URL}/admin/categories`, { headers }),
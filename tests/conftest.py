@@ -0,0 +1,130 @@
+import os
+import sys
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'backend'))
+os.environ.setdefault('MONGO_URL', 'mongodb://localhost:27017')
+os.environ.setdefault('DB_NAME', 'intowns_test')
+
+
+@pytest.fixture
+def assert_max_queries(monkeypatch):
+    """
+    Fail when a response made more Mongo round trips than allowed.
+
+        response = client.get('/api/bookings', headers=auth)
+        assert_max_queries(response, 3)
+    """
+    import server
+    from mongomock_motor import AsyncCursor, AsyncLatentCommandCursor, AsyncMongoMockCollection
+    monkeypatch.setattr(server, 'QUERY_DEBUG', True)
+
+    # mongomock emits no command events, so count its round trips here instead:
+    # one per collection call, one per cursor
+    def counted(method):
+        def wrapper(*args, **kwargs):
+            stats = server.current_query_stats.get()
+            if stats is not None:
+                stats.queries += 1
+            return method(*args, **kwargs)
+        return wrapper
+
+    for name in ('find_one', 'find_one_and_update', 'insert_one', 'update_one', 'update_many',
+                 'count_documents', 'bulk_write', 'find', 'aggregate'):
+        monkeypatch.setattr(AsyncMongoMockCollection, name, counted(getattr(AsyncMongoMockCollection, name)))
+
+    def check(response, max_queries: int):
+        count = int(response.headers['x-query-count'])
+        assert count <= max_queries, (
+            f"{response.request.method} {response.request.url.path} made {count} "
+            f"Mongo queries, budget is {max_queries}"
+        )
+        return count
+
+    return check
+
+
+@pytest.fixture(scope='session')
+def sample_pincodes(tmp_path_factory):
+    """A few rows in the bundled directory's format; indexing the full file on every app start is slow"""
+    path = tmp_path_factory.mktemp('data') / 'pincodes.csv'
+    path.write_text(
+        'pincode,locality,district,state\n'
+        '560034,Koramangala,Bengaluru Urban,Karnataka\n'
+        '560038,Indiranagar,Bengaluru Urban,Karnataka\n'
+        '110001,Connaught Place,New Delhi,Delhi\n'
+    )
+    return str(path)
+
+
+@pytest.fixture
+def db(monkeypatch, sample_pincodes):
+    """A fresh in-memory database (mongomock-motor) for the app under test"""
+    from mongomock_motor import AsyncMongoMockClient
+    import server
+    mongo = AsyncMongoMockClient()
+    monkeypatch.setattr(server, 'create_mongo_client', lambda: mongo)
+    monkeypatch.setattr(server, 'ADDRESS_INDEX_PATH', sample_pincodes)
+    monkeypatch.setattr(server, 'RATE_LIMIT_ENABLED', False)
+    return mongo[os.environ['DB_NAME']]
+
+
+@pytest.fixture
+def client(db):
+    """TestClient over a new app; its lifespan runs against the `db` fixture"""
+    from fastapi.testclient import TestClient
+    import server
+    with TestClient(server.create_app()) as client:
+        yield client
+
+
+class StubRazorpay:
+    """Razorpay SDK stand-in: orders are created locally and every signature is valid"""
+
+    class order:
+        @staticmethod
+        def create(data: dict, **options) -> dict:
+            return {'id': f"order_{uuid.uuid4().hex[:14]}", 'amount': data['amount']}
+
+    class utility:
+        @staticmethod
+        def verify_payment_signature(params: dict) -> bool:
+            return True
+
+
+@pytest.fixture
+def razorpay(monkeypatch):
+    import server
+    stub = StubRazorpay()
+    monkeypatch.setattr(server, 'razorpay_client', stub)
+    return stub
+
+
+@pytest.fixture
+def make_user(client, db):
+    """
+    Insert a user and return it with auth headers.
+
+        user, headers = make_user('admin')
+    """
+    import server
+
+    def make(role: str = 'user', **fields):
+        user = {
+            'id': str(uuid.uuid4()),
+            'email': f"{role}-{uuid.uuid4().hex[:8]}@example.com",
+            'name': role.title(),
+            'role': role,
+            'wallet_balance': 0,
+            'wallet_locked_balance': 0,
+            'created_at': datetime.now(timezone.utc),
+            **fields
+        }
+        client.portal.call(db.users.insert_one, dict(user))
+        return user, {'Authorization': f"Bearer {server.create_jwt_token(user)}"}
+
+    return make
@@ -0,0 +1,33 @@
+import pytest
+
+import server
+
+
+@pytest.fixture(scope='module')
+def bundled_index():
+    index = server.AddressIndex()
+    index.load(str(server.ROOT_DIR / 'data' / 'pincodes.csv.gz'))
+    return index
+
+
+def test_bundled_directory_covers_india(bundled_index):
+    # The India Post directory lists ~165k post offices
+    assert len(bundled_index) > 150000
+    states = {record[3] for record in bundled_index._records}
+    assert {'Karnataka', 'Maharashtra', 'Assam', 'Ladakh', 'Andaman And Nicobar Islands'} <= states
+
+
+@pytest.mark.parametrize('query, pincode', [
+    ('koramangala', '560034'),
+    ('Connaught Place', '110001'),
+    ('400001', '400001'),
+    ('kothimir', '504273'),
+])
+def test_bundled_directory_resolves_localities(bundled_index, query, pincode):
+    assert pincode in [suggestion['pincode'] for suggestion in bundled_index.search(query)]
+
+
+def test_office_suffixes_are_dropped(bundled_index):
+    localities = {record[1] for record in bundled_index._records if record[0] == '504273'}
+    assert 'Kothimir' in localities
+    assert not any(locality.endswith(('B.O', 'S.O', 'H.O')) for locality in localities)
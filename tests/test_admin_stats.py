@@ -0,0 +1,117 @@
+"""
+The admin stats document is kept current by bump_admin_stats() on every
+write path; reconcile_admin_stats() recomputes it from scratch. Each step
+below goes through the API and must leave the two in agreement.
+"""
+import uuid
+
+import pytest
+
+import server
+
+
+@pytest.fixture
+def admin(make_user):
+    return make_user('admin')[1]
+
+
+@pytest.fixture
+def customer(make_user):
+    return make_user('user', wallet_balance=20000)
+
+
+@pytest.fixture
+def product(client, db):
+    product = {'id': str(uuid.uuid4()), 'name': 'Swedish Massage', 'price': 49900, 'category_id': 'massage'}
+    client.portal.call(db.products.insert_one, dict(product))
+    return product
+
+
+@pytest.fixture
+def assert_stats_consistent(client, admin, customer):
+    # Users are inserted directly by the fixtures, so start from a reconciled document
+    client.portal.call(server.reconcile_admin_stats)
+
+    def check():
+        stats = client.get('/api/admin/stats', headers=admin).json()
+        assert stats == client.portal.call(server.reconcile_admin_stats)
+        return stats
+    return check
+
+
+def place_order(client, headers, product, **fields) -> dict:
+    response = client.post('/api/orders/create', headers=headers, json={
+        'product_id': product['id'], 'address': '221 Indiranagar', **fields
+    })
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def test_cod_order_with_wallet(client, customer, product, razorpay, assert_stats_consistent):
+    _, headers = customer
+    before = assert_stats_consistent()
+    place_order(client, headers, product, payment_method='cod', use_wallet=True)
+
+    stats = assert_stats_consistent()
+    assert stats['total_bookings'] == before['total_bookings'] + 1
+    assert stats['total_revenue'] == before['total_revenue'] + 49900
+    assert stats['total_wallet_balance'] == before['total_wallet_balance'] - 20000
+
+
+def test_online_order_and_verify(client, customer, product, razorpay, assert_stats_consistent):
+    _, headers = customer
+    assert_stats_consistent()
+    order = place_order(client, headers, product, payment_method='online', use_wallet=True)
+    assert_stats_consistent()
+
+    response = client.post('/api/orders/verify', headers=headers, json={
+        'razorpay_order_id': order['razorpay_order_id'], 'razorpay_payment_id': 'pay_1',
+        'razorpay_signature': 'sig', 'booking_id': order['booking_id']
+    })
+    assert response.status_code == 200
+    assert assert_stats_consistent()['total_revenue'] == 49900
+
+
+def test_status_changes_in_and_out_of_revenue(client, admin, customer, product, razorpay, assert_stats_consistent):
+    _, headers = customer
+    order = place_order(client, headers, product, payment_method='online')
+    assert_stats_consistent()
+
+    for status, revenue in [('accepted', 49900), ('completed', 49900), ('cancelled', 0), ('in_progress', 49900)]:
+        response = client.patch(f"/api/bookings/{order['booking_id']}/status", headers=admin, json={'status': status})
+        assert response.status_code == 200
+        assert assert_stats_consistent()['total_revenue'] == revenue
+
+
+def test_wallet_topup(client, db, customer, razorpay, assert_stats_consistent):
+    user, headers = customer
+    client.portal.call(db.wallet_offers.insert_one, {
+        'id': 'offer-1', 'amount': 100000, 'cashback_percentage': 10, 'max_cashback': 5000, 'active': True
+    })
+    assert_stats_consistent()
+
+    response = client.post('/api/wallet/topup/verify', headers=headers, params={
+        'razorpay_order_id': 'order_1', 'razorpay_payment_id': 'pay_1', 'razorpay_signature': 'sig', 'offer_id': 'offer-1'
+    })
+    assert response.status_code == 200
+    assert assert_stats_consistent()['total_wallet_balance'] == 20000 + 105000
+
+
+def test_review_reward(client, admin, customer, product, razorpay, assert_stats_consistent):
+    _, headers = customer
+    order = place_order(client, headers, product, payment_method='cod')
+    assert_stats_consistent()
+
+    response = client.post(f"/api/bookings/{order['booking_id']}/confirm-review", headers=admin)
+    assert response.status_code == 200
+    assert assert_stats_consistent()['total_wallet_balance'] == 20000 + 10000
+
+
+def test_role_changes(client, admin, customer, assert_stats_consistent):
+    user, _ = customer
+    before = assert_stats_consistent()
+
+    for role, users in [('professional', -1), ('admin', -1), ('user', 0), ('user', 0)]:
+        response = client.patch(f"/api/admin/users/{user['id']}/role", headers=admin, params={'role': role})
+        assert response.status_code == 200
+        assert assert_stats_consistent()['total_users'] == before['total_users'] + users
@@ -0,0 +1,87 @@
+import asyncio
+
+import pytest
+from mongomock_motor import AsyncMongoMockClient, AsyncMongoMockCollection
+
+import server
+
+
+@pytest.fixture
+def db(monkeypatch):
+    database = AsyncMongoMockClient()['intowns_batch']
+    monkeypatch.setattr(server, 'db', database)
+    return database
+
+
+@pytest.fixture
+def batches(monkeypatch):
+    """Record the size of every insert_many, each taking a little while to be acknowledged"""
+    sizes = []
+    insert_many = AsyncMongoMockCollection.insert_many
+
+    async def slow_insert_many(self, documents, **kwargs):
+        await asyncio.sleep(0.05)
+        result = await insert_many(self, documents, **kwargs)
+        sizes.append(len(documents))
+        return result
+
+    monkeypatch.setattr(AsyncMongoMockCollection, 'insert_many', slow_insert_many)
+    return sizes
+
+
+def test_durable_insert_returns_once_its_batch_is_written(db, batches):
+    writer = server.BatchWriter('email_logs', max_delay=10)
+
+    async def main():
+        writer.start()
+        await writer.insert({'id': 'queued'})
+        await writer.insert({'id': 'durable'}, wait=True)
+        # Written with the queued document, without waiting out max_delay
+        assert batches == [2]
+        assert await db.email_logs.count_documents({}) == 2
+        await writer.close()
+
+    asyncio.run(asyncio.wait_for(main(), 5))
+
+
+def test_failed_batch_raises_on_waiters(db, monkeypatch):
+    insert_many = AsyncMongoMockCollection.insert_many
+    failures = [server.PyMongoError('not primary')]
+
+    async def flaky_insert_many(self, documents, **kwargs):
+        if failures:
+            raise failures.pop()
+        return await insert_many(self, documents, **kwargs)
+
+    monkeypatch.setattr(AsyncMongoMockCollection, 'insert_many', flaky_insert_many)
+    writer = server.BatchWriter('wallet_transactions', max_delay=10)
+
+    async def main():
+        writer.start()
+        with pytest.raises(server.PyMongoError, match='not primary'):
+            await writer.insert({'id': 't1'}, wait=True)
+        # The writer keeps going after a failed batch
+        await writer.insert({'id': 't2'}, wait=True)
+        assert [d['id'] for d in await db.wallet_transactions.find({}).to_list(None)] == ['t2']
+        await writer.close()
+
+    asyncio.run(asyncio.wait_for(main(), 5))
+
+
+def test_close_flushes_queued_documents(db, batches):
+    writer = server.BatchWriter('email_logs', max_batch=3, max_delay=10)
+
+    async def main():
+        writer.start()
+        for i in range(7):
+            await writer.insert({'id': i})
+        await writer.close()
+        assert writer._task is None
+        assert sorted(d['id'] for d in await db.email_logs.find({}).to_list(None)) == list(range(7))
+        assert all(size <= 3 for size in batches)
+
+        # Once closed, inserts are written directly
+        await writer.insert({'id': 'after-close'})
+        assert await db.email_logs.count_documents({'id': 'after-close'}) == 1
+
+    asyncio.run(asyncio.wait_for(main(), 5))
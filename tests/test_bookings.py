@@ -0,0 +1,106 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+
+@pytest.fixture
+def seed_bookings(client, db, make_user):
+    """Insert n bookings, each for a different user and professional"""
+    def seed(n: int, user_id: str = None):
+        now = datetime.now(timezone.utc)
+        bookings, professionals = [], []
+        for i in range(n):
+            customer_id = user_id or make_user('user')[0]['id']
+            professional = {'id': str(uuid.uuid4()), 'user_id': str(uuid.uuid4()), 'name': f"Pro {i}"}
+            professionals.append(professional)
+            bookings.append({
+                'id': str(uuid.uuid4()),
+                'user_id': customer_id,
+                'professional_id': professional['id'],
+                'product_id': 'p1',
+                'product': {'id': 'p1', 'name': 'Haircut'},
+                'status': 'pending',
+                'final_amount': 100,
+                'created_at': now - timedelta(minutes=i),
+            })
+        client.portal.call(db.professionals.insert_many, professionals)
+        client.portal.call(db.bookings.insert_many, bookings)
+        return bookings
+
+    return seed
+
+
+def test_user_bookings_query_count_is_constant(client, make_user, seed_bookings, assert_max_queries):
+    user, headers = make_user('user')
+    seed_bookings(1, user_id=user['id'])
+    few = client.get('/api/bookings', headers=headers)
+    seed_bookings(20, user_id=user['id'])
+    many = client.get('/api/bookings', headers=headers)
+
+    assert many.status_code == 200
+    assert len(many.json()) == 21
+    assert all(b['user']['id'] == user['id'] for b in many.json())
+    # auth + bookings + users
+    assert assert_max_queries(many, 3) == assert_max_queries(few, 3)
+
+
+def test_all_bookings_visible_to_admin_in_constant_queries(client, make_user, seed_bookings, assert_max_queries):
+    _, headers = make_user('admin')
+    bookings = seed_bookings(15)
+    response = client.get('/api/bookings', headers=headers)
+
+    assert response.status_code == 200
+    by_id = {b['id']: b for b in response.json()}
+    assert all(by_id[b['id']]['user']['id'] == b['user_id'] for b in bookings)
+    assert_max_queries(response, 3)
+
+
+def test_admin_bookings_query_count_is_constant(client, make_user, seed_bookings, assert_max_queries):
+    _, headers = make_user('admin')
+    seed_bookings(1)
+    few = client.get('/api/admin/bookings', headers=headers)
+    bookings = seed_bookings(30)
+    many = client.get('/api/admin/bookings', params={'limit': 50}, headers=headers)
+
+    assert many.status_code == 200
+    body = many.json()
+    assert body['total'] == 31
+    by_id = {b['id']: b for b in body['bookings']}
+    for booking in bookings:
+        assert by_id[booking['id']]['user']['id'] == booking['user_id']
+        assert by_id[booking['id']]['professional']['id'] == booking['professional_id']
+    # auth + bookings + users + professionals + count
+    assert assert_max_queries(many, 5) == assert_max_queries(few, 5)
+
+
+def test_admin_users_query_count(client, make_user, assert_max_queries):
+    _, headers = make_user('admin')
+    for _ in range(10):
+        make_user('user')
+    response = client.get('/api/admin/users', headers=headers)
+
+    assert response.status_code == 200
+    assert response.json()['total'] == 11
+    # auth + users + count
+    assert_max_queries(response, 3)
+
+
+def test_bookings_without_product_snapshot_are_filled_in(client, db, make_user, seed_bookings, assert_max_queries):
+    """Bookings from before the product snapshot, until backfill_booking_products runs"""
+    user, headers = make_user('user')
+    client.portal.call(db.products.insert_one, {'id': 'p1', 'name': 'Haircut', 'price': 30000})
+    bookings = seed_bookings(10, user_id=user['id'])
+    client.portal.call(db.bookings.update_many, {}, {'$unset': {'product': ''}})
+    client.portal.call(db.bookings.update_one, {'id': bookings[0]['id']}, {'$set': {'product_id': 'gone'}})
+
+    response = client.get('/api/bookings', headers=headers)
+    assert response.status_code == 200
+    by_id = {b['id']: b for b in response.json()}
+    assert by_id[bookings[0]['id']]['product'] is None
+    assert all(by_id[b['id']]['product']['name'] == 'Haircut' for b in bookings[1:])
+    # auth + bookings + users + products
+    assert_max_queries(response, 4)
+
+    single = client.get(f"/api/bookings/{bookings[1]['id']}", headers=headers)
+    assert single.json()['product']['price'] == 30000
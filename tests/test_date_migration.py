@@ -0,0 +1,98 @@
+import time
+from datetime import datetime, timezone
+
+from bson import ObjectId
+
+import server
+
+
+def utc(*args) -> datetime:
+    return datetime(*args, tzinfo=timezone.utc)
+
+
+def stored(client, db, collection: str = 'email_logs') -> dict:
+    docs = client.portal.call(lambda: db[collection].find({}).to_list(None))
+    return {doc['id']: doc for doc in docs}
+
+
+def as_utc(value):
+    # mongomock hands back naive datetimes; Mongo (tz_aware=True) returns them in UTC
+    return value.replace(tzinfo=timezone.utc) if isinstance(value, datetime) and value.tzinfo is None else value
+
+
+def test_converts_iso_strings_and_skips_unparsable(client, db):
+    client.portal.call(db.email_logs.insert_many, [
+        {'id': 'z', 'created_at': '2024-05-01T10:30:00Z'},
+        {'id': 'offset', 'created_at': '2024-05-01T16:00:00+05:30'},
+        {'id': 'utc', 'created_at': '2024-05-01T10:30:00.250000+00:00'},
+        {'id': 'naive', 'created_at': '2024-05-01T10:30:00'},
+        {'id': 'garbage', 'created_at': 'last tuesday'},
+        {'id': 'date', 'created_at': utc(2024, 6, 1)},
+    ])
+
+    result = client.portal.call(server.migrate_collection_dates, 'email_logs', ['created_at'], 2)
+
+    assert result == {'converted': 4, 'skipped': 1, 'done': True}
+    docs = {key: as_utc(doc['created_at']) for key, doc in stored(client, db).items()}
+    assert docs['z'] == utc(2024, 5, 1, 10, 30)
+    assert docs['offset'] == utc(2024, 5, 1, 10, 30)
+    assert docs['utc'] == utc(2024, 5, 1, 10, 30, 0, 250000)
+    assert docs['naive'] == utc(2024, 5, 1, 10, 30)
+    assert docs['garbage'] == 'last tuesday'
+    assert docs['date'] == utc(2024, 6, 1)
+
+
+def test_resumes_from_checkpoint(client, db, monkeypatch):
+    client.portal.call(db.email_logs.insert_many, [
+        {'id': f'log-{i}', 'created_at': f'2024-05-0{i + 1}T00:00:00+00:00'} for i in range(4)
+    ])
+    # Stop after the first chunk: the pause eats into the margin kept for reporting
+    monkeypatch.setattr(server, 'DATE_MIGRATION_STOP_MARGIN', 0.2)
+    monkeypatch.setattr(server, 'DATE_MIGRATION_PAUSE', 0.2)
+
+    async def run_with_deadline():
+        token = server.current_deadline.set(time.monotonic() + 0.3)
+        try:
+            return await server.migrate_collection_dates('email_logs', ['created_at'], 2)
+        finally:
+            server.current_deadline.reset(token)
+
+    assert client.portal.call(run_with_deadline) == {'converted': 2, 'skipped': 0, 'done': False}
+    checkpoint = client.portal.call(db.migrations.find_one, {'id': 'dates:email_logs'})
+    assert checkpoint['converted'] == 2
+
+    # A string behind the checkpoint is not revisited by a resumed run...
+    client.portal.call(db.email_logs.insert_one, {'_id': ObjectId('0' * 24), 'id': 'early', 'created_at': '2024-01-01T00:00:00+00:00'})
+    monkeypatch.setattr(server, 'DATE_MIGRATION_PAUSE', 0)
+    assert client.portal.call(server.migrate_collection_dates, 'email_logs', ['created_at'], 2) == {
+        'converted': 4, 'skipped': 0, 'done': True
+    }
+    docs = stored(client, db)
+    assert all(isinstance(docs[f'log-{i}']['created_at'], datetime) for i in range(4))
+    assert docs['early']['created_at'] == '2024-01-01T00:00:00+00:00'
+
+    # ...but a restart clears the checkpoints and picks it up
+    progress = client.portal.call(lambda: server.migrate_dates(chunk_size=2, restart=True))
+    assert progress['email_logs'] == {'converted': 1, 'skipped': 0, 'done': True}
+    assert isinstance(stored(client, db)['early']['created_at'], datetime)
+
+
+def test_date_range_matches_dates_and_legacy_strings(client, db, monkeypatch):
+    client.portal.call(db.email_logs.insert_many, [
+        {'id': 'old-string', 'created_at': '2024-04-30T23:59:59+00:00'},
+        {'id': 'string', 'created_at': '2024-05-02T08:00:00+00:00'},
+        {'id': 'date', 'created_at': utc(2024, 5, 3, 8)},
+        {'id': 'late-date', 'created_at': utc(2024, 5, 10)},
+    ])
+
+    def matching(since, until) -> set:
+        query = server.date_range('created_at', since, until)
+        docs = client.portal.call(lambda: db.email_logs.find(query).to_list(None))
+        return {doc['id'] for doc in docs}
+
+    assert matching(utc(2024, 5, 1), utc(2024, 5, 10)) == {'string', 'date'}
+    assert matching(utc(2024, 5, 1), None) == {'string', 'date', 'late-date'}
+    assert server.date_range('created_at') == {}
+
+    monkeypatch.setattr(server, 'DATES_DUAL_READ', False)
+    assert matching(utc(2024, 5, 1), utc(2024, 5, 10)) == {'date'}
@@ -0,0 +1,19 @@
+from datetime import datetime, timezone
+
+
+def test_email_logs_filtered_by_date(client, db, make_user):
+    _, headers = make_user('admin')
+    client.portal.call(db.email_logs.insert_many, [
+        {'id': f"log-{day}", 'type': 'manual', 'status': 'sent',
+         'created_at': datetime(2026, 3, day, tzinfo=timezone.utc)}
+        for day in (1, 5, 9)
+    ])
+
+    response = client.get('/api/admin/email-logs', headers=headers, params={
+        'since': '2026-03-02T00:00:00Z', 'until': '2026-03-09T00:00:00Z'
+    })
+
+    assert response.status_code == 200
+    body = response.json()
+    assert [log['id'] for log in body['logs']] == ['log-5']
+    assert body['stats']['total_sent'] == 1
@@ -0,0 +1,155 @@
+"""
+InvalidationBus across workers. Each test runs two buses, standing in for
+two worker processes, against one database.
+
+The change-stream tests need a replica set; point MONGO_TEST_REPLSET_URL at
+a single-node one to run them, e.g.
+
+    mongod --replSet rs0 --dbpath /tmp/rs0 &
+    mongosh --eval 'rs.initiate()'
+    MONGO_TEST_REPLSET_URL='mongodb://localhost:27017/?replicaSet=rs0' pytest tests
+
+The polling tests run on mongomock as well as on the replica set.
+"""
+import asyncio
+import os
+import uuid
+
+import pytest
+
+import server
+
+REPLSET_URL = os.environ.get('MONGO_TEST_REPLSET_URL')
+requires_replset = pytest.mark.skipif(
+    not REPLSET_URL, reason='MONGO_TEST_REPLSET_URL is not set'
+)
+
+
+def connect(backend: str):
+    if backend == 'replset':
+        from motor.motor_asyncio import AsyncIOMotorClient
+        return AsyncIOMotorClient(REPLSET_URL, tz_aware=True)
+    from mongomock_motor import AsyncMongoMockClient
+    return AsyncMongoMockClient()
+
+
+def run(backend: str, monkeypatch, scenario):
+    """Run scenario(db) with server.client/server.db pointed at a scratch database"""
+    monkeypatch.setattr(server, 'CACHE_POLL_INTERVAL', 0.05)
+
+    async def main():
+        mongo = connect(backend)
+        db = mongo[f"intowns_bus_{uuid.uuid4().hex[:8]}"]
+        monkeypatch.setattr(server, 'client', mongo)
+        monkeypatch.setattr(server, 'db', db)
+        try:
+            await scenario(db)
+        finally:
+            if backend == 'replset':
+                await mongo.drop_database(db.name)
+                mongo.close()
+
+    asyncio.run(main())
+
+
+async def wait_for(condition, timeout: float = 5):
+    async with asyncio.timeout(timeout):
+        while not condition():
+            await asyncio.sleep(0.02)
+
+
+def recording_bus(calls: list, name: str, force_polling: bool = False):
+    bus = server.InvalidationBus(['products', 'settings'])
+    for collection in bus.collections:
+        bus.register(collection, lambda c: calls.append((name, c)))
+    if force_polling:
+        async def unsupported():
+            return False
+        bus._supports_change_streams = unsupported
+    return bus
+
+
+@requires_replset
+def test_change_stream_invalidates_every_worker(monkeypatch):
+    async def scenario(db):
+        calls = []
+        a, b = recording_bus(calls, 'a'), recording_bus(calls, 'b')
+        await a.start()
+        await b.start()
+        try:
+            assert a.mode == b.mode == 'change_stream'
+            await asyncio.sleep(0.5)  # let both streams open before writing
+            # Any write is seen, even one that never called notify()
+            await db.products.insert_one({'id': 'p1', 'name': 'Haircut'})
+            await wait_for(lambda: {('a', 'products'), ('b', 'products')} <= set(calls))
+            assert all(c == 'products' for _, c in calls)
+        finally:
+            await a.close()
+            await b.close()
+
+    run('replset', monkeypatch, scenario)
+
+
+@requires_replset
+def test_change_stream_resumes_after_interruption(monkeypatch):
+    async def scenario(db):
+        calls = []
+        bus = recording_bus(calls, 'a')
+        await bus.start()
+        try:
+            await asyncio.sleep(0.5)
+            await db.products.insert_one({'id': 'p1'})
+            await wait_for(lambda: calls)
+            assert 'products' in bus._resume_tokens
+
+            # Drop the stream and write while nobody is watching
+            await bus.close()
+            calls.clear()
+            await db.products.update_one({'id': 'p1'}, {'$set': {'name': 'Shave'}})
+            await bus.start()
+            await wait_for(lambda: ('a', 'products') in calls)
+        finally:
+            await bus.close()
+
+    run('replset', monkeypatch, scenario)
+
+
+@pytest.mark.parametrize('backend', [
+    'mongomock',
+    pytest.param('replset', marks=requires_replset),
+])
+def test_polling_invalidates_other_workers(backend, monkeypatch):
+    async def scenario(db):
+        calls = []
+        a = recording_bus(calls, 'a', force_polling=True)
+        b = recording_bus(calls, 'b', force_polling=True)
+        await a.start()
+        await b.start()
+        try:
+            assert a.mode == b.mode == 'polling'
+            await a.notify('settings')
+            # The writer invalidates in-process right away, the other worker on its next poll
+            assert calls == [('a', 'settings')]
+            await wait_for(lambda: ('b', 'settings') in calls)
+
+            # a already holds the version it wrote and must not invalidate twice
+            await asyncio.sleep(server.CACHE_POLL_INTERVAL * 3)
+            assert calls == [('a', 'settings'), ('b', 'settings')]
+        finally:
+            await a.close()
+            await b.close()
+
+    run(backend, monkeypatch, scenario)
+
+
+def test_falls_back_to_polling_without_replica_set(monkeypatch):
+    async def scenario(db):
+        bus = recording_bus([], 'a')
+        await bus.start()
+        try:
+            assert bus.mode == 'polling'
+        finally:
+            await bus.close()
+        assert bus.mode is None
+
+    run('mongomock', monkeypatch, scenario)
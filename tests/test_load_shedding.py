@@ -0,0 +1,109 @@
+import asyncio
+
+import pytest
+
+import server
+
+
+@pytest.fixture
+def rate_limited(client, monkeypatch):
+    """Rate limiting on, with budgets of two requests and no refill to speak of"""
+    monkeypatch.setattr(server, 'RATE_LIMIT_ENABLED', True)
+    monkeypatch.setitem(server.RATE_LIMITS, 'login', (0.01, 2))
+    monkeypatch.setitem(server.RATE_LIMITS, 'admin_list', (0.01, 2))
+    return client
+
+
+def test_memory_backend_spends_tokens_and_reports_wait():
+    backend = server.MemoryRateLimitBackend()
+
+    async def main():
+        assert await backend.take('k', rate=2, burst=2) == (True, 0)
+        assert await backend.take('k', rate=2, burst=2) == (True, 0)
+        allowed, retry_after = await backend.take('k', rate=2, burst=2)
+        assert not allowed
+        assert 0 < retry_after <= 0.5
+        assert (await backend.take('other', rate=2, burst=2))[0]
+
+    asyncio.run(main())
+
+
+def test_memory_backend_evicts_oldest_keys():
+    backend = server.MemoryRateLimitBackend(max_keys=2)
+
+    async def main():
+        for key in ('a', 'b', 'c'):
+            await backend.take(key, rate=1, burst=1)
+        assert list(backend._buckets) == ['b', 'c']
+
+    asyncio.run(main())
+
+
+def test_anonymous_clients_limited_per_ip(rate_limited):
+    credentials = {'username': 'nobody', 'password': 'wrong'}
+    for _ in range(2):
+        assert rate_limited.post('/api/auth/login', json=credentials).status_code == 401
+
+    response = rate_limited.post('/api/auth/login', json=credentials)
+    assert response.status_code == 429
+    assert int(response.headers['retry-after']) >= 1
+
+
+def test_signed_in_clients_limited_per_user(rate_limited, make_user):
+    _, first = make_user('admin')
+    _, second = make_user('admin')
+    for _ in range(2):
+        assert rate_limited.get('/api/admin/users', headers=first).status_code == 200
+
+    assert rate_limited.get('/api/admin/users', headers=first).status_code == 429
+    # Another user behind the same address has a budget of its own
+    assert rate_limited.get('/api/admin/users', headers=second).status_code == 200
+
+
+def test_admission_control_sheds_beyond_max_in_flight(monkeypatch):
+    monkeypatch.setattr(server, 'MAX_IN_FLIGHT_REQUESTS', 1)
+    release = asyncio.Event()
+
+    async def slow_app(scope, receive, send):
+        await release.wait()
+        await send({'type': 'http.response.start', 'status': 200, 'headers': []})
+        await send({'type': 'http.response.body', 'body': b'ok'})
+
+    middleware = server.AdmissionControlMiddleware(slow_app)
+
+    async def call(path: str = '/api/products') -> list:
+        sent = []
+
+        async def send(message):
+            sent.append(message)
+
+        async def receive():
+            return {'type': 'http.request', 'body': b''}
+
+        await middleware({'type': 'http', 'method': 'GET', 'path': path, 'headers': []}, receive, send)
+        return sent
+
+    async def main():
+        first = asyncio.create_task(call())
+        await asyncio.sleep(0)
+        shed = await call()
+        assert shed[0]['status'] == 503
+        assert (b'retry-after', b'1') in shed[0]['headers']
+
+        # Exempt paths are always served
+        exempt = asyncio.create_task(call('/metrics'))
+        release.set()
+        assert (await first)[0]['status'] == 200
+        assert (await exempt)[0]['status'] == 200
+        assert middleware.in_flight == 0
+
+    asyncio.run(main())
+
+
+def test_shed_responses_carry_cors_headers(client, monkeypatch):
+    monkeypatch.setattr(server.pool_wait_monitor, 'recent_wait_ms', lambda: server.POOL_WAIT_SHED_MS + 1)
+
+    response = client.get('/api/products', headers={'Origin': 'https://intowns.in'})
+    assert response.status_code == 503
+    assert response.headers['access-control-allow-origin'] in ('*', 'https://intowns.in')
+    assert 'retry-after' in response.headers['access-control-expose-headers'].lower()
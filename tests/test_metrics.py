@@ -0,0 +1,16 @@
+import server
+
+
+def test_metrics_disabled_without_token(client):
+    assert client.get('/metrics').status_code == 404
+
+
+def test_metrics_require_bearer_token(client, monkeypatch):
+    monkeypatch.setattr(server, 'METRICS_TOKEN', 's3cret')
+
+    assert client.get('/metrics').status_code == 401
+    assert client.get('/metrics', headers={'Authorization': 'Bearer wrong'}).status_code == 401
+
+    response = client.get('/metrics', headers={'Authorization': 'Bearer s3cret'})
+    assert response.status_code == 200
+    assert 'http_request_duration_seconds' in response.text
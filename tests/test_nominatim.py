@@ -0,0 +1,56 @@
+import asyncio
+import time
+
+import pytest
+from mongomock_motor import AsyncMongoMockClient
+
+import server
+
+
+@pytest.fixture
+def shared_db(monkeypatch):
+    monkeypatch.setattr(server, 'db', AsyncMongoMockClient()['intowns_nominatim'])
+    monkeypatch.setattr(server, 'NOMINATIM_MIN_INTERVAL', 0.1)
+    return server.db
+
+
+def test_upstream_slots_are_spaced_across_workers(shared_db):
+    # Two clients stand in for two worker processes
+    workers = [server.NominatimClient(), server.NominatimClient()]
+
+    async def main():
+        return sorted(await asyncio.gather(*[w._reserve_slot() for w in workers * 3]))
+
+    started = time.time()
+    slots = asyncio.run(main())
+    assert slots[0] >= started - 0.01
+    gaps = [b - a for a, b in zip(slots, slots[1:])]
+    assert all(gap == pytest.approx(0.1, abs=1e-6) for gap in gaps)
+
+
+def test_wait_for_slot_sleeps_until_the_shared_slot(shared_db):
+    workers = [server.NominatimClient(), server.NominatimClient()]
+
+    async def main():
+        started = time.monotonic()
+        await asyncio.gather(*[w._wait_for_slot() for w in workers * 2])
+        return time.monotonic() - started
+
+    assert asyncio.run(main()) >= 0.3 - 0.02
+
+
+def test_slot_past_the_deadline_is_not_claimed(shared_db):
+    client = server.NominatimClient()
+
+    async def main():
+        await shared_db.upstream_slots.insert_one({'_id': 'nominatim', 'next_at': time.time() + 5})
+        token = server.current_deadline.set(time.monotonic() + 1)
+        try:
+            with pytest.raises(server.DeadlineExceeded):
+                await client._reserve_slot()
+        finally:
+            server.current_deadline.reset(token)
+        return await shared_db.upstream_slots.find_one({'_id': 'nominatim'})
+
+    state = asyncio.run(main())
+    assert state['next_at'] - time.time() < 5
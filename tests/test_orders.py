@@ -0,0 +1,119 @@
+import asyncio
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+
+import server
+
+
+@pytest.fixture
+def short_deadline(monkeypatch, razorpay):
+    """Payment routes time out after 0.2s, while each wallet transaction takes 0.5s to write"""
+    monkeypatch.setitem(server.REQUEST_DEADLINES, 'payment', 0.2)
+    monkeypatch.setattr(server, 'DEADLINE_GRACE', 0.05)
+    add_wallet_transaction = server.add_wallet_transaction
+
+    async def slow_add_wallet_transaction(*args, **kwargs):
+        await asyncio.sleep(0.5)
+        return await add_wallet_transaction(*args, **kwargs)
+
+    monkeypatch.setattr(server, 'add_wallet_transaction', slow_add_wallet_transaction)
+
+
+def finish_detached_writes(client):
+    async def wait():
+        await asyncio.gather(*server._detached_tasks)
+    client.portal.call(wait)
+
+
+def insert_product(client, db) -> dict:
+    product = {'id': str(uuid.uuid4()), 'name': 'Swedish Massage', 'price': 49900, 'duration': '60 min', 'category_id': 'massage'}
+    client.portal.call(db.products.insert_one, dict(product))
+    return product
+
+
+def insert_online_booking(client, db, user: dict, product: dict) -> dict:
+    booking = {
+        'id': str(uuid.uuid4()), 'user_id': user['id'], 'product_id': product['id'], 'product': product,
+        'address': '221 Indiranagar', 'status': 'pending', 'payment_method': 'online', 'payment_id': None,
+        'amount': 49900, 'wallet_used': 20000, 'discount_amount': 0, 'created_at': datetime.now(timezone.utc)
+    }
+    client.portal.call(db.bookings.insert_one, dict(booking))
+    return booking
+
+
+def verify_payload(booking: dict) -> dict:
+    return {'razorpay_order_id': 'order_1', 'razorpay_payment_id': 'pay_1', 'razorpay_signature': 'sig', 'booking_id': booking['id']}
+
+
+def test_verify_payment_completes_writes_when_deadline_passes(client, db, make_user, short_deadline):
+    user, headers = make_user(wallet_balance=50000)
+    booking = insert_online_booking(client, db, user, insert_product(client, db))
+    payload = verify_payload(booking)
+
+    # The deadline passes during the wallet debit; the request waits for the
+    # settlement to finish and reports it rather than asking for a retry
+    response = client.post('/api/orders/verify', headers=headers, json=payload)
+    assert response.status_code == 200
+    assert response.json() == {'success': True, 'booking_id': booking['id']}
+
+    stored = client.portal.call(db.bookings.find_one, {'id': booking['id']})
+    assert stored['status'] == 'accepted'
+    assert stored['payment_id'] == 'pay_1'
+    assert client.portal.call(db.users.find_one, {'id': user['id']})['wallet_balance'] == 30000
+
+    # A retried verify doesn't debit the wallet again
+    response = client.post('/api/orders/verify', headers=headers, json=payload)
+    assert response.status_code == 200
+    finish_detached_writes(client)
+    assert client.portal.call(db.users.find_one, {'id': user['id']})['wallet_balance'] == 30000
+    assert client.portal.call(db.wallet_transactions.count_documents, {'reference_id': booking['id']}) == 1
+
+
+def test_verify_payment_settles_when_deadline_passes_right_after_claim(client, db, make_user, short_deadline, monkeypatch):
+    user, headers = make_user(wallet_balance=50000)
+    booking = insert_online_booking(client, db, user, insert_product(client, db))
+    client.portal.call(db.professionals.insert_one, {'id': 'pro-1', 'name': 'Asha', 'status': 'active'})
+    pick_professional = server.pick_professional
+    claims = []
+
+    async def slow_pick_professional():
+        claims.append((await db.bookings.find_one({'id': booking['id']}))['payment_id'])
+        await asyncio.sleep(0.5)  # the deadline passes here, after the booking was claimed
+        return await pick_professional()
+
+    monkeypatch.setattr(server, 'pick_professional', slow_pick_professional)
+
+    response = client.post('/api/orders/verify', headers=headers, json=verify_payload(booking))
+    assert response.status_code == 200
+    assert claims == ['pay_1']  # slowed down after the claim
+
+    stored = client.portal.call(db.bookings.find_one, {'id': booking['id']})
+    assert stored['status'] == 'accepted'
+    assert stored['professional_id'] == 'pro-1'
+    assert client.portal.call(db.users.find_one, {'id': user['id']})['wallet_balance'] == 30000
+
+    response = client.post('/api/orders/verify', headers=headers, json=verify_payload(booking))
+    assert response.status_code == 200
+    finish_detached_writes(client)
+    assert client.portal.call(db.wallet_transactions.count_documents, {'reference_id': booking['id']}) == 1
+
+
+def test_create_order_completes_writes_when_deadline_passes(client, db, make_user, short_deadline):
+    user, headers = make_user(wallet_balance=10000)
+    product = insert_product(client, db)
+
+    response = client.post('/api/orders/create', headers=headers, json={
+        'product_id': product['id'], 'address': '221 Indiranagar', 'payment_method': 'cod', 'use_wallet': True
+    })
+    # The order went through, so the client must get it, not a 504 inviting a second order
+    assert response.status_code == 200
+    assert response.json()['wallet_used'] == 10000
+
+    bookings = client.portal.call(lambda: db.bookings.find({'user_id': user['id']}).to_list(None))
+    assert [b['status'] for b in bookings] == ['accepted']
+    assert bookings[0]['id'] == response.json()['booking_id']
+    assert bookings[0]['wallet_used'] == 10000
+    assert client.portal.call(db.users.find_one, {'id': user['id']})['wallet_balance'] == 0
+    assert client.portal.call(db.wallet_transactions.count_documents, {'reference_id': bookings[0]['id']}) == 1
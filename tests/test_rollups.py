@@ -0,0 +1,85 @@
+import uuid
+from datetime import datetime, timezone
+
+import server
+
+
+def booking(day: str, status: str = 'pending', amount: int = 100) -> dict:
+    return {
+        'id': str(uuid.uuid4()),
+        'user_id': 'u1',
+        'product_id': 'p1',
+        'category_id': 'c1',
+        'professional_id': None,
+        'status': status,
+        'amount': amount,
+        'created_at': datetime.fromisoformat(day).replace(hour=12, tzinfo=timezone.utc),
+    }
+
+
+def rollups(client, db) -> dict:
+    docs = client.portal.call(lambda: db.booking_rollups.find({}, {'_id': 0}).to_list(None))
+    return {doc['date']: doc['buckets'] for doc in docs}
+
+
+def test_backfill_rebuilds_rollups(client, db):
+    client.portal.call(db.bookings.insert_many, [
+        booking('2026-01-01'), booking('2026-01-01', amount=50), booking('2026-01-02', status='completed'),
+    ])
+    client.portal.call(db.booking_rollups.insert_one, {'date': '2025-12-31', 'buckets': {'stale': {}}})
+
+    assert client.portal.call(server.backfill_booking_rollups) == 3
+    assert rollups(client, db) == {
+        '2026-01-01': {'c1|none|pending': {'bookings': 2, 'revenue': 150}},
+        '2026-01-02': {'c1|none|completed': {'bookings': 1, 'revenue': 100}},
+    }
+
+
+def test_backfill_keeps_bookings_counted_while_it_runs(client, db, monkeypatch):
+    first = booking('2026-01-01')
+    client.portal.call(db.bookings.insert_one, dict(first))
+    client.portal.call(server.add_booking_to_rollup, first)
+
+    scan = server.scan_rollup_days
+    calls = []
+
+    async def scan_racing_a_new_booking(query, product_categories, chunk_size):
+        result = await scan(query, product_categories, chunk_size)
+        if not calls:
+            # Booked after the full scan counted 2026-01-01, before the rollups are written
+            late = booking('2026-01-01', amount=70)
+            await db.bookings.insert_one(dict(late))
+            await server.add_booking_to_rollup(late)
+        calls.append(query)
+        return result
+
+    monkeypatch.setattr(server, 'scan_rollup_days', scan_racing_a_new_booking)
+    client.portal.call(server.backfill_booking_rollups)
+
+    assert len(calls) == 2  # the full scan, then 2026-01-01 again
+    assert rollups(client, db)['2026-01-01'] == {'c1|none|pending': {'bookings': 2, 'revenue': 170}}
+
+
+def test_status_change_after_backfill_moves_legacy_booking(client, db, make_user):
+    """Bookings stored before category_id get it from their product during the backfill"""
+    _, headers = make_user('admin')
+    client.portal.call(db.products.insert_one, {'id': 'p1', 'name': 'Haircut', 'price': 100, 'category_id': 'c1'})
+    legacy = booking('2026-01-01')
+    del legacy['category_id']
+    client.portal.call(db.bookings.insert_one, dict(legacy))
+
+    client.portal.call(server.backfill_booking_rollups)
+    stored = client.portal.call(db.bookings.find_one, {'id': legacy['id']})
+    assert stored['category_id'] == 'c1'
+
+    response = client.patch(f"/api/bookings/{legacy['id']}/status", headers=headers, json={'status': 'completed'})
+    assert response.status_code == 200
+    assert rollups(client, db)['2026-01-01'] == {
+        'c1|none|pending': {'bookings': 0, 'revenue': 0},
+        'c1|none|completed': {'bookings': 1, 'revenue': 100},
+    }
+
+    timeseries = client.get('/api/admin/analytics/timeseries', headers=headers, params={
+        'start': '2026-01-01', 'end': '2026-01-01'
+    })
+    assert timeseries.json()['series'] == [{'date': '2026-01-01', 'bookings': 1, 'revenue': 100}]
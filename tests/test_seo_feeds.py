@@ -0,0 +1,35 @@
+import pytest
+
+import server
+
+
+@pytest.fixture(autouse=True)
+def fresh_sitemap(monkeypatch):
+    """The sitemap snapshot is module state; don't let one test's copy leak into another"""
+    monkeypatch.setattr(server, 'sitemap_snapshot', server.StreamedSnapshot(server.generate_sitemap, 'application/xml'))
+
+
+def seed(client, db):
+    client.portal.call(db.categories.insert_one, {'id': 'massage', 'name': 'Massage'})
+    client.portal.call(db.products.insert_one, {'id': 'swedish', 'name': 'Swedish Massage', 'price': 100})
+    client.portal.call(db.blog_posts.insert_one, {'id': 'b1', 'slug': 'spa-at-home', 'title': 'Spa at home', 'published': True})
+
+
+def test_sitemap_lists_only_pages_the_frontend_serves(client, db):
+    seed(client, db)
+    response = client.get('/sitemap.xml')
+
+    assert response.status_code == 200
+    assert response.text.count('<url>') == 1
+    assert f'<loc>{server.SITE_URL}/</loc>' in response.text
+
+
+def test_sitemap_includes_configured_page_paths(client, db, monkeypatch):
+    monkeypatch.setattr(server, 'SITEMAP_CATEGORY_PATH', '/services/{id}')
+    monkeypatch.setattr(server, 'SITEMAP_PRODUCT_PATH', '/services/item/{id}')
+    monkeypatch.setattr(server, 'SITEMAP_BLOG_ENABLED', True)
+    seed(client, db)
+    response = client.get('/sitemap.xml')
+
+    for path in ('/', '/blog', '/services/massage', '/services/item/swedish', '/blog/spa-at-home'):
+        assert f'<loc>{server.SITE_URL}{path}</loc>' in response.text
@@ -0,0 +1,47 @@
+import uuid
+
+import pytest
+
+import server
+
+
+@pytest.fixture
+def product(client, db):
+    product = {'id': str(uuid.uuid4()), 'name': 'Swedish Massage', 'price': 49900, 'category_id': 'massage'}
+    client.portal.call(db.products.insert_one, dict(product))
+    return product
+
+
+def order(client, headers, product, **fields):
+    return client.post('/api/orders/create', headers=headers, json={
+        'product_id': product['id'], 'address': '221 Indiranagar', 'payment_method': 'cod', **fields
+    })
+
+
+def test_orders_need_a_listed_pincode_when_enforced(client, make_user, product, monkeypatch):
+    monkeypatch.setattr(server, 'SERVICEABILITY_CHECK_ENABLED', True)
+    _, admin = make_user('admin')
+    _, headers = make_user()
+    assert client.post('/api/admin/serviceable-pincodes', headers=admin, json={'pincodes': ['560038', ' 560038', '560001']}).json()['total'] == 2
+
+    assert order(client, headers, product).status_code == 400
+    assert order(client, headers, product, pincode='').status_code == 400
+    assert order(client, headers, product, pincode='110001').status_code == 400
+    assert order(client, headers, product, pincode='560038').status_code == 200
+
+
+def test_empty_list_serves_nowhere_when_enforced(client, make_user, product, monkeypatch):
+    monkeypatch.setattr(server, 'SERVICEABILITY_CHECK_ENABLED', True)
+    _, admin = make_user('admin')
+    _, headers = make_user()
+    client.post('/api/admin/serviceable-pincodes', headers=admin, json={'pincodes': ['560038']})
+    assert client.delete('/api/admin/serviceable-pincodes/560038', headers=admin).json()['total'] == 0
+
+    assert client.get('/api/serviceability', params={'pincode': '560038'}).json()['serviceable'] is False
+    assert order(client, headers, product, pincode='560038').status_code == 400
+
+
+def test_everything_is_served_when_not_enforced(client, make_user, product, monkeypatch):
+    monkeypatch.setattr(server, 'SERVICEABILITY_CHECK_ENABLED', False)
+    _, headers = make_user()
+    assert order(client, headers, product, pincode='').status_code == 200
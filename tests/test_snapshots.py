@@ -0,0 +1,35 @@
+import asyncio
+import json
+
+from starlette.requests import Request
+
+import server
+
+
+def make_request():
+    return Request({'type': 'http', 'method': 'GET', 'path': '/', 'headers': []})
+
+
+def test_json_snapshot_not_cached_when_invalidated_mid_build():
+    builds = []
+
+    async def build():
+        builds.append(len(builds))
+        if len(builds) == 1:
+            snapshot.invalidate()  # a write lands while the first build is reading
+        return {'build': len(builds)}
+
+    snapshot = server.JSONSnapshot(build)
+
+    async def main():
+        first = await snapshot.response(make_request())
+        assert first.status_code == 200
+        assert json.loads(first.body) == {'build': 1}
+        assert snapshot.body is None
+
+        second = await snapshot.response(make_request())
+        assert json.loads(second.body) == {'build': 2}
+        assert snapshot.body == second.body
+        assert second.headers['etag'] == snapshot.etag
+
+    asyncio.run(main())